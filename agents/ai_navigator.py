@@ -78,7 +78,7 @@ class AINavigator:
         
         # Initialize metrics tracking
         self.metrics = NavigationMetrics()
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         # Initialize services
         self.dom_service = DomService(page)
@@ -98,7 +98,7 @@ class AINavigator:
         Returns (success: bool, confidence: float).
         """
         step = context.get("step", "unknown")
-        start_time = time.time()
+        start_time = time.monotonic()
         
         await self.logs_manager.info(f"Starting navigation for step: {step}")
         await self._log_system_health()
@@ -111,7 +111,7 @@ class AINavigator:
                 try:
                     await self.logs_manager.debug(f"Executing action for step {step}")
                     await action()
-                    duration = time.time() - start_time
+                    duration = time.monotonic() - start_time
                     await self._track_performance(step, duration)
                     await self._log_success(action, context, confidence)
                     return True, confidence
@@ -129,7 +129,7 @@ class AINavigator:
                 return await self._handle_low_confidence(action, confidence)
                 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             await self.logs_manager.error(f"Navigation failed for step {step} after {duration:.2f}s: {str(e)}")
             await self._handle_error_with_context(e, context)
             raise
@@ -141,7 +141,7 @@ class AINavigator:
         Returns:
             Tuple[bool, float]: (success, overall_confidence)
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         await self.logs_manager.info(f"Starting master plan execution with {len(plan_steps)} steps")
         await self.logs_manager.debug(f"Plan steps: {', '.join(plan_steps)}")
         
@@ -150,7 +150,7 @@ class AINavigator:
 
         try:
             for index, step in enumerate(plan_steps, 1):
-                step_start_time = time.time()
+                step_start_time = time.monotonic()
                 await self.logs_manager.info(f"Executing step {index}/{len(plan_steps)}: {step}")
                 
                 try:
@@ -162,7 +162,7 @@ class AINavigator:
                             await self.logs_manager.warning(f"CAPTCHA detected before step: {step}")
                             success, conf = await self.navigate(self._handle_captcha, {"step": "handle_captcha"})
                             if not success:
-                                duration = time.time() - start_time
+                                duration = time.monotonic() - start_time
                                 await self.logs_manager.error(f"Master plan failed at CAPTCHA handling after {duration:.2f}s")
                                 return False, overall_confidence
 
@@ -171,7 +171,7 @@ class AINavigator:
                     success, confidence = await self._execute_step(step)
                     overall_confidence *= confidence
                     
-                    step_duration = time.time() - step_start_time
+                    step_duration = time.monotonic() - step_start_time
                     await self._track_performance(step, step_duration)
                     
                     if not success:
@@ -186,12 +186,12 @@ class AINavigator:
                     await self._handle_error_with_context(e, {"step": step, "index": index})
                     return False, overall_confidence
 
-            total_duration = time.time() - start_time
+            total_duration = time.monotonic() - start_time
             await self.logs_manager.info(f"Master plan completed successfully in {total_duration:.2f}s")
             return True, overall_confidence
 
         except Exception as e:
-            total_duration = time.time() - start_time
+            total_duration = time.monotonic() - start_time
             await self.logs_manager.error(f"Master plan execution failed after {total_duration:.2f}s: {str(e)}")
             raise
 
@@ -223,7 +223,7 @@ class AINavigator:
         await self.logs_manager.debug(f"- Retry count: {self.retry_count}")
         await self.logs_manager.debug(f"- Current confidence: {self.min_confidence}")
         await self.logs_manager.debug(f"- Total errors: {sum(self.metrics.error_counts.values())}")
-        await self.logs_manager.debug(f"- Uptime: {time.time() - self.start_time:.2f}s")
+        await self.logs_manager.debug(f"- Uptime: {time.monotonic() - self.start_time:.2f}s")
         
         # Log performance statistics if available
         if self.metrics.performance_metrics:
@@ -852,7 +852,7 @@ class AINavigator:
 
     async def _execute_action(self, action):
         """Execute action with DOM-based fallback if primary action fails."""
-        start_time = time.time()
+        start_time = time.monotonic()
         action_name = action.__name__
         
         await self.logs_manager.debug(f"Executing action: {action_name}")
@@ -867,13 +867,13 @@ class AINavigator:
             if new_url != current_url:
                 await self._log_navigation_path(current_url, new_url)
             
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             await self._track_performance(action_name, duration)
             await self.logs_manager.debug(f"Action {action_name} completed successfully in {duration:.2f}s")
             return result
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             await self.logs_manager.warning(f"Primary action failed after {duration:.2f}s, attempting DOM fallback: {str(e)}")
             
             # Track the error
@@ -1,8 +1,9 @@
 """
-Form Filling Agent (Async, Playwright) - GPT-4o Cover Letter Integration
+Form Filling Agent (Async, Playwright) - OpenAI Cover Letter Integration
 
 Enhancements:
-1. Cover letter generation using GPT-4o.
+1. Cover letter generation using gpt-4o-mini by default, configurable via
+   COVER_LETTER_MODEL (shared async client, pooled HTTP/2 connections).
 2. Retry logic (once) if cover letter generation fails.
 3. If a cover letter is required and both attempts fail, ask user for manual input; 
    otherwise, skip it.
@@ -33,29 +34,277 @@ form_mapping = {
 """
 
 import asyncio
+import json
 import random
 import os
-from typing import Any, Dict, Union, Optional
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Union, Optional
 from pathlib import Path
 
+import aiofiles.tempfile
+import httpx
 import openai
+from openai import AsyncOpenAI
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from constants import TimingConstants, Selectors, Messages
 from utils.telemetry import TelemetryManager
 from utils.dom.dom_service import DomService
 from storage.logs_manager import LogsManager
+from storage.cover_letter_cache import CoverLetterCache
+from locators.linkedin_locators import LinkedInLocators
+from utils.page_pool import PagePool
+from utils.playwright_patch import apply_playwright_stack_patch
+
+# Drop Playwright's per-call stack capture on the form-filling hot path (PW_INSPECT_STACK=1 to keep it).
+apply_playwright_stack_patch()
 
 # Ensure your OPENAI_API_KEY or relevant GPT-4 key is in env vars.
 openai.api_key = os.getenv("OPENAI_API_KEY", "")
 
+# A 200-word cover letter doesn't need a frontier model; the mini model is
+# several times cheaper with lower per-token latency.
+DEFAULT_COVER_LETTER_MODEL = "gpt-4o-mini"
+
+# Process-wide OpenAI client shared by every FormFillerAgent. One pooled
+# HTTP/2 connection lets concurrent cover-letter requests multiplex instead
+# of each call opening its own connection.
+_openai_client: Optional[AsyncOpenAI] = None
+_openai_lock = asyncio.Lock()
+
+
+async def get_openai_client() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client, creating it on first use."""
+    global _openai_client
+    if _openai_client is None:
+        async with _openai_lock:
+            if _openai_client is None:
+                _openai_client = AsyncOpenAI(
+                    api_key=openai.api_key,
+                    max_retries=0,  # retries are handled in _async_chat_completion
+                    http_client=httpx.AsyncClient(
+                        http2=True,
+                        limits=httpx.Limits(max_connections=50, max_keepalive_connections=25),
+                        timeout=30.0
+                    )
+                )
+    return _openai_client
+
+
+# Transient OpenAI failures that are retried at the API-call layer.
+OPENAI_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError)
+OPENAI_MAX_ATTEMPTS = 3
+OPENAI_BACKOFF_MIN = 1.0   # seconds
+OPENAI_BACKOFF_MAX = 16.0  # seconds
+OPENAI_MAX_RPM = int(os.getenv("OPENAI_MAX_RPM", "500"))
+
+
+class OpenAIRateLimiter:
+    """
+    Leaky-bucket limiter for OpenAI requests: callers are released no faster than
+    `max_rate` per `time_period` seconds, so concurrent form fills queue up locally
+    instead of tripping 429s and serialising on retries.
+
+    Usage:
+        async with limiter:
+            await client.chat.completions.create(...)
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        self.interval = time_period / max_rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+# Shared across agents, like the client itself: the RPM quota is per API key.
+_openai_limiter = OpenAIRateLimiter(OPENAI_MAX_RPM)
+
+# Part of every cover letter cache key; bump when the prompt changes.
+COVER_LETTER_PROMPT_VERSION = "v2"
+
+# Static instructions go in one shared system message; the per-job user turn only
+# carries the job data, with the description capped to bound input tokens.
+COVER_LETTER_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You write concise, professional cover letters of 200 words or fewer. "
+        "Output only the letter body."
+    )
+}
+COVER_LETTER_JD_MAX_TOKENS = 1500
+CHARS_PER_TOKEN_ESTIMATE = 4  # fallback when the tokenizer can't be loaded
+
+# generate_batch packs several jobs into one completion, bounded by input size and count.
+COVER_LETTER_BATCH_MAX_INPUT_TOKENS = 3000
+COVER_LETTER_BATCH_MAX_JOBS = 5
+
+# Cover letters are capped at 200 words (~260 tokens); output tokens dominate latency.
+COVER_LETTER_MAX_WORDS = 200
+COVER_LETTER_MAX_TOKENS = 260
+
+# Streamed cover letters are appended to the field in chunks of at least this many characters.
+STREAM_FLUSH_CHARS = 40
+APPEND_VALUE_JS = "(el, s) => { el.value += s; el.dispatchEvent(new Event('input', {bubbles: true})); }"
+
+# Current value of the Easy Apply progress bar as a string, or null without one.
+# LinkedIn's single-page modal keeps the URL and document across steps; this is
+# what changes when it moves to the next one.
+EASY_APPLY_PROGRESS_EXPR = """(() => {
+    const bar = document.querySelector(%s);
+    if (!bar) return null;
+    const value = bar.getAttribute("aria-valuenow") ?? bar.value;
+    return value == null ? null : String(value);
+})()""" % json.dumps(Selectors.EASY_APPLY_PROGRESS)
+
+# Reads everything _fill_current_step_fields needs about an Easy Apply step in
+# one round-trip, including checkbox/textarea state (by index) to avoid per-element reads.
+# Built once from the shared Selectors so the probe and the fill helpers can't drift apart.
+# Also classifies the step for fill_easy_apply: "review" (submit button shown),
+# "resume" (CV upload input) or "questions", plus which button advances the step.
+EASY_APPLY_STEP_PROBE_JS = """
+() => {
+    let step = "questions";
+    if (document.querySelector(%(submit)s)) step = "review";
+    else if (document.querySelector(%(upload)s)) step = "resume";
+    let next = null;
+    if (document.querySelector(%(next_button)s)) next = %(next_button)s;
+    else if (document.querySelector(%(review_button)s)) next = %(review_button)s;
+    const uncheckedCheckboxes = [];
+    document.querySelectorAll(%(checkbox)s).forEach((el, i) => {
+        if (!el.checked) uncheckedCheckboxes.push(i);
+    });
+    const emptyTextareas = [];
+    document.querySelectorAll(%(textarea)s).forEach((el, i) => {
+        if (!el.value) emptyTextareas.push(i);
+    });
+    return {
+        step: step,
+        next: next,
+        progress: %(progress)s,
+        phone: !!document.querySelector(%(phone)s),
+        experience: !!document.querySelector(%(experience)s),
+        unchecked_checkboxes: uncheckedCheckboxes,
+        empty_textareas: emptyTextareas
+    };
+}
+""" % {
+    "submit": json.dumps(Selectors.EASY_APPLY_SUBMIT_BUTTON),
+    "upload": json.dumps(Selectors.EASY_APPLY_CV_UPLOAD),
+    "next_button": json.dumps(Selectors.FORM_NEXT_BUTTON),
+    "review_button": json.dumps(Selectors.EASY_APPLY_REVIEW_BUTTON),
+    "checkbox": json.dumps(Selectors.EASY_APPLY_REQUIRED_CHECKBOX),
+    "textarea": json.dumps(Selectors.EASY_APPLY_REQUIRED_TEXTAREA),
+    "phone": json.dumps(Selectors.EASY_APPLY_PHONE_INPUT),
+    "experience": json.dumps(Selectors.EASY_APPLY_EXPERIENCE_SELECT),
+    "progress": EASY_APPLY_PROGRESS_EXPR,
+}
+
+EASY_APPLY_MAX_STEPS = 15  # guards against a modal that never advances
+
+# Any of these being visible means an Easy Apply step is ready to act on.
+EASY_APPLY_STEP_MARKER = ", ".join([
+    Selectors.FORM_NEXT_BUTTON, Selectors.EASY_APPLY_REVIEW_BUTTON, Selectors.EASY_APPLY_SUBMIT_BUTTON
+])
+EASY_APPLY_STEP_TIMEOUT = 3000  # ms
+
+# True once the step whose advance button was clicked has been left: the button
+# is gone from the DOM or the progress bar moved. Args: [button handle, old progress].
+EASY_APPLY_STEP_LEFT_JS = """([button, progress]) =>
+    !button.isConnected || %s !== progress""" % EASY_APPLY_PROGRESS_EXPR
+EASY_APPLY_SUCCESS_MARKER = ", ".join(LinkedInLocators.FORM_SUCCESS)
+
+
+@lru_cache(maxsize=1)
+def _get_tokenizer():
+    """tiktoken encoding for cover letter prompts, or None if it can't be loaded (e.g. offline)."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Token count for text (approximated by characters without a tokenizer)."""
+    tokenizer = _get_tokenizer()
+    if tokenizer is None:
+        return len(text) // CHARS_PER_TOKEN_ESTIMATE + 1
+    return len(tokenizer.encode(text))
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens (approximated by characters without a tokenizer)."""
+    tokenizer = _get_tokenizer()
+    if tokenizer is None:
+        return text[:max_tokens * CHARS_PER_TOKEN_ESTIMATE]
+    tokens = tokenizer.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return tokenizer.decode(tokens[:max_tokens])
+
+
+def _openai_retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying an OpenAI call.
+    Honours the Retry-After header sent with 429s, otherwise uses
+    exponential backoff with full jitter between OPENAI_BACKOFF_MIN and OPENAI_BACKOFF_MAX.
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), OPENAI_BACKOFF_MAX)
+        except ValueError:
+            pass
+    ceiling = min(OPENAI_BACKOFF_MAX, OPENAI_BACKOFF_MIN * (2 ** attempt))
+    return max(OPENAI_BACKOFF_MIN, random.uniform(0, ceiling))
+
 class FormFillerAgent:
-    def __init__(self, dom_service: DomService, logs_manager: LogsManager, settings: dict = None):
-        """Initialize form filler with DOM service and settings."""
+    # Field types whose selector names the element itself, so presence can be checked up front.
+    PRESENCE_CHECKED_TYPES = frozenset({"text", "select", "checkbox", "upload"})
+
+    def __init__(
+        self,
+        dom_service: DomService,
+        logs_manager: LogsManager,
+        settings: dict = None,
+        prompt_callback: Optional[Callable[[str], Awaitable[str]]] = None,
+        humanize: Optional[bool] = None
+    ):
+        """
+        Initialize form filler with DOM service and settings.
+
+        Args:
+            prompt_callback: Async function asking the user for input when a required
+                field can't be filled automatically. Defaults to a console prompt run in
+                a worker thread; headless/batch runs can pass one that raises instead.
+            humanize: Keep the human-like pauses between actions. Defaults to True
+                unless FORM_FILLER_FAST=1 (for trusted portals and batch runs).
+        """
         self.dom_service = dom_service
+        self.prompt_callback = prompt_callback or self._console_prompt
+        self.humanize = humanize if humanize is not None else os.getenv("FORM_FILLER_FAST", "0") != "1"
+        self._uniform = random.Random().uniform  # per-agent generator for human-like delays
         self.settings = settings or {}
         self.telemetry = TelemetryManager(self.settings)
         self.logs_manager = logs_manager
+        self.llm_model = os.getenv("COVER_LETTER_MODEL", DEFAULT_COVER_LETTER_MODEL)
+        self.cover_letter_cache = CoverLetterCache(
+            self.settings, prompt_version=f"{COVER_LETTER_PROMPT_VERSION}:{self.llm_model}"
+        )
 
         # Standard delays
         self.human_delay_min = 0.3  # seconds
@@ -67,6 +316,59 @@ class FormFillerAgent:
         self.default_wait = 10.0  # seconds
         self.raise_on_error = False
 
+        # Held around every focus-taking action (fill, click, check, typing): they act on
+        # whichever element has focus, so concurrent field tasks must not interleave them.
+        self._keyboard_lock = asyncio.Lock()
+
+        # Field type -> handler(selector, value, required), built once per agent.
+        # Cover letter handlers manage their own waits, so they get no extra delay.
+        self._field_handlers = {
+            "text": self._fill_text,
+            "select": self._fill_select,
+            "checkbox": self._fill_checkbox,
+            "radio": self._fill_radio,
+            "upload": self._fill_upload,
+            "cover_letter_text": partial(self._handle_cover_letter, "cover_letter_text"),
+            "cover_letter_upload": partial(self._handle_cover_letter, "cover_letter_upload"),
+        }
+        # Easy Apply step id (from EASY_APPLY_STEP_PROBE_JS) -> handler(form_data, probe, state).
+        self._easy_apply_step_handlers = {
+            "review": self._easy_apply_review_step,
+            "resume": self._easy_apply_resume_step,
+            "questions": self._easy_apply_questions_step,
+        }
+        # Variants for mappings marked {"requires_keystrokes": True}.
+        self._keystroke_handlers = {
+            "text": partial(self._fill_text, requires_keystrokes=True),
+            "cover_letter_text": partial(self._handle_cover_letter, "cover_letter_text", requires_keystrokes=True),
+        }
+
+    @classmethod
+    @asynccontextmanager
+    async def acquire(
+        cls,
+        pool: PagePool,
+        logs_manager: LogsManager,
+        settings: dict = None,
+        **kwargs
+    ) -> AsyncIterator["FormFillerAgent"]:
+        """
+        Borrow a page from a PagePool and yield a FormFillerAgent bound to it.
+        The page goes back to the pool when the block exits.
+
+        Usage:
+            async with FormFillerAgent.acquire(pool, logs_manager, settings) as agent:
+                await agent.fill_easy_apply(form_data)
+        """
+        async with pool.acquire() as page:
+            dom_service = DomService(page, settings=settings, logs_manager=logs_manager)
+            yield cls(dom_service, logs_manager, settings, **kwargs)
+
+    @property
+    def page(self):
+        """The page (or frame) DomService is currently operating on."""
+        return self.dom_service.page
+
     async def fill_form(self, form_data: Dict[str, Any], form_mapping: Dict[str, Dict[str, Any]]):
         """
         Fill a form using provided data and field mapping.
@@ -74,32 +376,74 @@ class FormFillerAgent:
         If a mapping entry includes {"required": True}, we treat that field as mandatory.
         For example:
           "cover_letter": {"selector": "textarea[name='cover_letter']", "type": "cover_letter_text", "required": True}
+
+        Text fields are set in one fill() call. Add {"requires_keystrokes": True} for inputs
+        whose listeners only react to real key events (typed character by character instead).
         """
         await self.telemetry.track_event(
             "form_filling",
-            {"form_type": form_data.type},
+            lambda: {
+                "form_type": form_data.get("form_type", "generic"),
+                "field_count": len(form_mapping)
+            },
             success=True
         )
 
+        # Fields with distinct selectors are independent, so their delays, waits and
+        # lookups run concurrently; the focus-taking actions themselves are
+        # serialized by _keyboard_lock. Cover letters run afterwards since they
+        # depend on the job data and do their own (slow) generation.
+        independent, deferred = [], []
         for field_name, field_value in form_data.items():
             if field_name not in form_mapping:
                 await self.logs_manager.warning(f"No mapping for field '{field_name}', skipping.")
                 continue
 
             config = form_mapping[field_name]
-            selector = config["selector"]
-            field_type = config.get("type", "text")
-            required = config.get("required", False)  # whether the field is mandatory
+            field_args = (
+                field_name,
+                field_value,
+                config["selector"],
+                config.get("type", "text"),
+                config.get("required", False),  # whether the field is mandatory
+                config.get("requires_keystrokes", False)
+            )
+            if field_args[3].startswith("cover_letter"):
+                deferred.append(field_args)
+            else:
+                independent.append(field_args)
 
-            try:
+        for group in (independent, deferred):
+            if group:
+                await asyncio.gather(
+                    *(self._fill_field_logged(*field_args) for field_args in group),
+                    return_exceptions=not self.raise_on_error
+                )
+
+    async def _fill_field_logged(
+        self,
+        field_name: str,
+        value: Any,
+        selector: str,
+        field_type: str,
+        required: bool,
+        requires_keystrokes: bool = False
+    ):
+        """
+        Fill one field for fill_form, logging failures and re-raising them
+        only when raise_on_error is set. A jittered pre-delay (up to
+        FORM_FIELD_DELAY) staggers concurrent fields instead of spacing them serially.
+        """
+        try:
+            await self._delay(self._uniform(0, TimingConstants.FORM_FIELD_DELAY))
+            if self.logs_manager.is_enabled("DEBUG"):
                 await self.logs_manager.debug(f"Filling field '{field_name}' of type '{field_type}'")
-                await self._fill_field(field_name, field_value, selector, field_type, required)
-                await asyncio.sleep(TimingConstants.FORM_FIELD_DELAY)  # Delay between fields
-            except Exception as e:
-                error_msg = f"Error filling field '{field_name}': {str(e)}"
-                await self.logs_manager.error(error_msg)
-                if self.raise_on_error:
-                    raise Exception(error_msg)
+            await self._fill_field(field_name, value, selector, field_type, required, requires_keystrokes)
+        except Exception as e:
+            error_msg = f"Error filling field '{field_name}': {str(e)}"
+            await self.logs_manager.error(error_msg)
+            if self.raise_on_error:
+                raise Exception(error_msg)
 
     async def submit_form(self, submit_button_selector: str) -> bool:
         """
@@ -107,12 +451,16 @@ class FormFillerAgent:
 
         Raises an exception if not found and raise_on_error=True.
         """
-        await asyncio.sleep(TimingConstants.HUMAN_DELAY_MIN)  # Delay before submission
+        await self._delay(TimingConstants.HUMAN_DELAY_MIN)  # Delay before submission
         try:
             await self.logs_manager.info("Attempting to submit form...")
             element = await self._wait_for_element(submit_button_selector)
             await element.click()
-            await asyncio.sleep(TimingConstants.FORM_SUBMIT_DELAY)  # Delay after submission
+            # Wait for the resulting page load instead of a fixed post-submit delay
+            try:
+                await self.page.wait_for_load_state("domcontentloaded", timeout=TimingConstants.DEFAULT_TIMEOUT)
+            except PlaywrightTimeoutError:
+                await self.logs_manager.debug("Page did not finish loading after submit; continuing")
             await self.logs_manager.info("Form submitted successfully")
             return True
         except Exception as e:
@@ -126,7 +474,11 @@ class FormFillerAgent:
         """
         Specialized method for LinkedIn's Easy Apply flow.
         Handles multi-step forms including CV upload, text fields, and radio/checkbox options.
-        
+
+        Runs as a small state machine: each iteration probes the modal once with
+        page.evaluate, which classifies the step ("review", "resume" or "questions")
+        and lists the fields needing work; the matching step handler then acts on it.
+
         Args:
             form_data: Optional dict with pre-filled data like:
                 {
@@ -141,115 +493,159 @@ class FormFillerAgent:
         try:
             form_data = form_data or {}
             await self.logs_manager.info("Starting LinkedIn Easy Apply process...")
-            
-            # Step 1: Handle CV upload if required
-            await self._handle_cv_upload(form_data.get("cv_path"))
-            
-            # Step 2: Process each form step until submission
-            while True:
-                # Check for final submit button first
-                submit_btn = await self.dom_service.query_selector('button[aria-label="Submit application"]')
-                if submit_btn:
-                    await self.logs_manager.info("Found submit button, completing application...")
-                    await asyncio.sleep(TimingConstants.HUMAN_DELAY_MIN)
-                    await submit_btn.click()
-                    await asyncio.sleep(TimingConstants.FORM_SUBMIT_DELAY)
-                    await self.logs_manager.info("Application submitted successfully")
-                    return "applied"
-                
-                # Fill visible form fields on current step
-                await self._fill_current_step_fields(form_data)
-                
-                # Look for and click "Next" button
-                next_btn = await self.dom_service.query_selector('button[aria-label="Continue to next step"]')
-                if next_btn:
-                    await self.logs_manager.debug("Moving to next form step...")
-                    await asyncio.sleep(TimingConstants.HUMAN_DELAY_MIN)
-                    await next_btn.click()
-                    await asyncio.sleep(TimingConstants.ACTION_DELAY)
-                else:
-                    await self.logs_manager.warning("No next or submit button found")
-                    return "failed"
-                    
+            state = {"cv_uploaded": False}
+
+            for _ in range(EASY_APPLY_MAX_STEPS):
+                probe = await self.page.evaluate(EASY_APPLY_STEP_PROBE_JS)
+                if self.logs_manager.is_enabled("DEBUG"):
+                    await self.logs_manager.debug(f"Easy Apply step detected: {probe['step']}")
+                result = await self._easy_apply_step_handlers[probe["step"]](form_data, probe, state)
+                if result:
+                    return result
+
+            await self.logs_manager.warning(f"Easy Apply did not finish within {EASY_APPLY_MAX_STEPS} steps")
+            return "failed"
+
         except Exception as e:
             await self.logs_manager.error(f"Easy Apply form filling failed: {e}")
             return "failed"
 
+    # -------------------------------------------------------------------------
+    # Easy Apply Step Handlers
+    # Each takes (form_data, probe, state) and returns a final result, or None
+    # once it has advanced the modal to the next step.
+    # -------------------------------------------------------------------------
+    async def _easy_apply_review_step(self, form_data: Dict[str, Any], probe: Dict[str, Any], state: Dict[str, Any]):
+        """Final step: submit the application."""
+        await self.logs_manager.info("Found submit button, completing application...")
+        await self._delay(TimingConstants.HUMAN_DELAY_MIN)
+        await self.page.locator(Selectors.EASY_APPLY_SUBMIT_BUTTON).first.click()
+        # Done as soon as LinkedIn confirms, instead of a fixed post-submit sleep.
+        if not await self._wait_for_visible(EASY_APPLY_SUCCESS_MARKER, TimingConstants.DEFAULT_TIMEOUT):
+            await self.logs_manager.debug("No submission confirmation seen before timeout")
+        await self.logs_manager.info("Application submitted successfully")
+        return "applied"
+
+    async def _easy_apply_resume_step(self, form_data: Dict[str, Any], probe: Dict[str, Any], state: Dict[str, Any]):
+        """Resume step: upload the CV once, fill anything else on the step, then advance."""
+        if not state["cv_uploaded"]:
+            await self._handle_cv_upload(form_data.get("cv_path"))
+            state["cv_uploaded"] = True
+        return await self._easy_apply_questions_step(form_data, probe, state)
+
+    async def _easy_apply_questions_step(self, form_data: Dict[str, Any], probe: Dict[str, Any], state: Dict[str, Any]):
+        """Contact info / screening questions: fill the probed fields, then advance."""
+        await self._fill_current_step_fields(form_data, probe)
+        if not probe["next"]:
+            await self.logs_manager.warning("No next or submit button found")
+            return "failed"
+        await self.logs_manager.debug("Moving to next form step...")
+        await self._delay(TimingConstants.HUMAN_DELAY_MIN)
+        button = await self.page.locator(probe["next"]).first.element_handle()
+        try:
+            await button.click()
+            # The step markers are already visible on the step being left, so first wait
+            # for it to actually change; a step that doesn't (e.g. a validation error)
+            # is re-probed as is after the timeout.
+            try:
+                await self.page.wait_for_function(
+                    EASY_APPLY_STEP_LEFT_JS, arg=[button, probe["progress"]], timeout=EASY_APPLY_STEP_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                await self.logs_manager.debug("Easy Apply step did not change after clicking next")
+        finally:
+            await button.dispose()
+        await self._wait_for_visible(EASY_APPLY_STEP_MARKER, EASY_APPLY_STEP_TIMEOUT)
+        return None
+
     async def _handle_cv_upload(self, cv_path: Optional[str]):
         """Handle CV upload if required and CV path is provided."""
         try:
-            upload_input = await self.dom_service.query_selector('input[type="file"][name="fileId"]')
-            if upload_input:
-                if cv_path:
-                    await self.logs_manager.info(f"Uploading CV from: {cv_path}")
-                    await upload_input.set_input_files(cv_path)
-                    await asyncio.sleep(TimingConstants.FILE_UPLOAD_DELAY)
-                    await self.logs_manager.info("CV upload completed")
-                else:
-                    await self.logs_manager.warning("CV upload required but no CV path provided")
+            if cv_path:
+                await self.logs_manager.info(f"Uploading CV from: {cv_path}")
+                await self.page.locator(Selectors.EASY_APPLY_CV_UPLOAD).first.set_input_files(cv_path)
+                await asyncio.sleep(TimingConstants.FILE_UPLOAD_DELAY / 1000)  # let the upload register
+                await self.logs_manager.info("CV upload completed")
+            else:
+                await self.logs_manager.warning("CV upload required but no CV path provided")
         except Exception as e:
             await self.logs_manager.error(f"CV upload failed: {e}")
 
-    async def _fill_current_step_fields(self, form_data: Dict[str, Any]):
+    async def _fill_current_step_fields(self, form_data: Dict[str, Any], probe: Optional[Dict[str, Any]] = None):
         """
         Fill all visible fields in the current step of the Easy Apply form.
-        Handles common LinkedIn form field types.
+        Handles common LinkedIn form field types. The step is probed once with a
+        single page.evaluate (or reuses the caller's probe); the independent field
+        groups then run concurrently, with each fill/click/check taken in turn
+        under _keyboard_lock since they all act on the focused element.
         """
         try:
             await self.logs_manager.debug("Processing current form step fields...")
-            # Phone number field
-            phone_input = await self.dom_service.query_selector('input[name="phoneNumber"]')
-            if phone_input and form_data.get("phone"):
-                await self.logs_manager.debug("Filling phone number field")
-                await asyncio.sleep(TimingConstants.HUMAN_DELAY_MIN)
-                await phone_input.fill(form_data["phone"])
-
-            # Work authorization radio buttons
-            if form_data.get("work_authorization"):
-                await self.logs_manager.debug("Setting work authorization")
-                auth_radio = await self.dom_service.query_selector(
-                    f'label:has-text("{form_data["work_authorization"]}")'
-                )
-                if auth_radio:
-                    await asyncio.sleep(TimingConstants.HUMAN_DELAY_MIN)
-                    await auth_radio.click()
-
-            # Years of experience dropdown/select
-            if form_data.get("years_of_experience"):
-                await self.logs_manager.debug("Setting years of experience")
-                exp_select = await self.dom_service.query_selector('select[id*="experience"]')
-                if exp_select:
-                    await asyncio.sleep(TimingConstants.HUMAN_DELAY_MIN)
-                    await exp_select.select_option(label=form_data["years_of_experience"])
-
-            # Handle any required checkboxes (e.g., certifications)
-            required_checkboxes = await self.dom_service.query_selector_all(
-                'input[type="checkbox"][required]'
-            )
-            if required_checkboxes:
-                await self.logs_manager.debug(f"Processing {len(required_checkboxes)} required checkboxes")
-            for checkbox in required_checkboxes:
-                if not await checkbox.is_checked():
-                    await asyncio.sleep(TimingConstants.HUMAN_DELAY_MIN)
-                    await checkbox.click()
-
-            # Handle any required text areas (e.g., additional information)
-            required_textareas = await self.dom_service.query_selector_all(
-                'textarea[required]'
+            if probe is None:
+                probe = await self.page.evaluate(EASY_APPLY_STEP_PROBE_JS)
+            await asyncio.gather(
+                self._fill_step_phone(form_data, probe),
+                self._fill_step_work_authorization(form_data),
+                self._fill_step_experience(form_data, probe),
+                self._fill_step_required_checkboxes(probe),
+                self._fill_step_required_textareas(probe)
             )
-            if required_textareas:
-                await self.logs_manager.debug(f"Processing {len(required_textareas)} required text areas")
-            for textarea in required_textareas:
-                existing_value = await textarea.input_value()
-                if not existing_value:
-                    await asyncio.sleep(TimingConstants.HUMAN_DELAY_MIN)
-                    await textarea.fill("N/A")
-
             await self.logs_manager.debug("Completed processing current form step")
 
         except Exception as e:
             await self.logs_manager.error(f"Error filling current step fields: {e}")
 
+    async def _fill_step_phone(self, form_data: Dict[str, Any], probe: Dict[str, Any]):
+        """Phone number field."""
+        if probe["phone"] and form_data.get("phone"):
+            await self.logs_manager.debug("Filling phone number field")
+            await self._delay(TimingConstants.HUMAN_DELAY_MIN)
+            await self._focused(self.page.locator(Selectors.EASY_APPLY_PHONE_INPUT).first.fill, form_data["phone"])
+
+    async def _fill_step_work_authorization(self, form_data: Dict[str, Any]):
+        """Work authorization radio buttons."""
+        if form_data.get("work_authorization"):
+            await self.logs_manager.debug("Setting work authorization")
+            auth_radios = self.page.get_by_role("radio", name=form_data["work_authorization"])
+            if await auth_radios.count():
+                await self._delay(TimingConstants.HUMAN_DELAY_MIN)
+                await self._focused(auth_radios.first.check)
+
+    async def _fill_step_experience(self, form_data: Dict[str, Any], probe: Dict[str, Any]):
+        """Years of experience dropdown/select."""
+        if probe["experience"] and form_data.get("years_of_experience"):
+            await self.logs_manager.debug("Setting years of experience")
+            await self._delay(TimingConstants.HUMAN_DELAY_MIN)
+            await self.page.locator(Selectors.EASY_APPLY_EXPERIENCE_SELECT).first.select_option(
+                label=form_data["years_of_experience"]
+            )
+
+    async def _fill_step_required_checkboxes(self, probe: Dict[str, Any]):
+        """Check any required checkboxes (e.g., certifications) the probe found unchecked."""
+        unchecked = probe["unchecked_checkboxes"]
+        if unchecked and self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug(f"Processing {len(unchecked)} required checkboxes")
+        checkboxes = self.page.locator(Selectors.EASY_APPLY_REQUIRED_CHECKBOX)
+        await asyncio.gather(*(self._ensure_checked(checkboxes.nth(index)) for index in unchecked))
+
+    async def _fill_step_required_textareas(self, probe: Dict[str, Any]):
+        """Fill any required text areas (e.g., additional information) the probe found empty."""
+        empty = probe["empty_textareas"]
+        if empty and self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug(f"Processing {len(empty)} required text areas")
+        textareas = self.page.locator(Selectors.EASY_APPLY_REQUIRED_TEXTAREA)
+        await asyncio.gather(*(self._ensure_filled(textareas.nth(index), "N/A") for index in empty))
+
+    async def _ensure_checked(self, checkbox):
+        """Click a checkbox the step probe reported as unchecked."""
+        await self._delay(TimingConstants.HUMAN_DELAY_MIN)
+        await self._focused(checkbox.click)
+
+    async def _ensure_filled(self, textarea, text: str):
+        """Fill a text area the step probe reported as empty."""
+        await self._delay(TimingConstants.HUMAN_DELAY_MIN)
+        await self._focused(textarea.fill, text)
+
     async def _check_disqualifying_questions(self) -> bool:
         """
         Check for any disqualifying questions that might prevent application.
@@ -279,7 +675,8 @@ class FormFillerAgent:
         value: Any,
         selector: str,
         field_type: str,
-        required: bool = False
+        required: bool = False,
+        requires_keystrokes: bool = False
     ):
         """
         Fill a single form field. Dispatches to specialized handlers.
@@ -290,63 +687,106 @@ class FormFillerAgent:
             selector (str): CSS selector for the element.
             field_type (str): e.g. "text", "upload", "cover_letter_text", etc.
             required (bool): Whether this field is mandatory.
+            requires_keystrokes (bool): Type text key by key instead of a single fill().
         """
+        handler = self._field_handlers.get(field_type)
+        if handler is None:
+            await self.logs_manager.warning(f"Unknown field type '{field_type}' for '{field_name}', skipping.")
+            return
+        # Optional fields that aren't on the page are skipped immediately instead of
+        # waiting out the locator timeout.
+        if not required and field_type in self.PRESENCE_CHECKED_TYPES and not await self._is_present(selector):
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"Optional field '{field_name}' not present, skipping.")
+            return
+        if requires_keystrokes:
+            handler = self._keystroke_handlers.get(field_type, handler)
+        await handler(selector, value, required)
+
+    # -------------------------------------------------------------------------
+    # Selector-level Dispatch Targets
+    # Each takes (selector, value, required) so _fill_field can dispatch directly.
+    # -------------------------------------------------------------------------
+    async def _fill_text(self, selector: str, value: Any, required: bool, requires_keystrokes: bool = False):
         await self._human_delay(0.8, 1.5)
+        await self._handle_text_field(selector, value, requires_keystrokes)
 
-        if field_type in ["text", "select", "checkbox", "radio"]:
-            element = await self._wait_for_element(selector)
-            if field_type == "text":
-                await self._handle_text_field(element, value)
-            elif field_type == "select":
-                await self._handle_select(element, value)
-            elif field_type == "checkbox":
-                await self._handle_checkbox(element, value)
-            elif field_type == "radio":
-                await self._handle_radio(selector, value)
-
-        elif field_type == "upload":
-            element = await self._wait_for_element(selector)
-            await self._handle_file_upload(element, value, required)
-
-        elif field_type in ["cover_letter_text", "cover_letter_upload"]:
-            await self._handle_cover_letter(field_type, selector, value, required)
-        else:
-            await self.logs_manager.warning(f"Unknown field type '{field_type}' for '{field_name}', skipping.")
+    async def _fill_select(self, selector: str, value: Any, required: bool):
+        await self._human_delay(0.8, 1.5)
+        await self._handle_select(selector, value)
+
+    async def _fill_checkbox(self, selector: str, value: Any, required: bool):
+        await self._human_delay(0.8, 1.5)
+        await self._handle_checkbox(selector, value)
+
+    async def _fill_radio(self, selector: str, value: Any, required: bool):
+        await self._human_delay(0.8, 1.5)
+        await self._handle_radio(selector, value)
+
+    async def _fill_upload(self, selector: str, value: Any, required: bool):
+        await self._human_delay(0.8, 1.5)
+        await self._handle_file_upload(selector, value, required)
 
     # -------------------------------------------------------------------------
     # Handler Methods
+    # Handlers act on Playwright locators, which auto-wait for the element as
+    # part of the action (one driver round-trip instead of wait + act).
     # -------------------------------------------------------------------------
-    async def _handle_text_field(self, element, text_value: Union[str, int, float]):
-        """Clears existing text and types new text into the field."""
-        await element.fill("")
+    def _field(self, selector: str):
+        """Locator for the first element matching selector."""
+        return self.page.locator(selector).first
+
+    async def _focused(self, action: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any):
+        """Run one focus-taking action (fill/click/check) under _keyboard_lock."""
+        async with self._keyboard_lock:
+            return await action(*args, **kwargs)
+
+    async def _handle_text_field(
+        self,
+        selector: str,
+        text_value: Union[str, int, float],
+        requires_keystrokes: bool = False
+    ):
+        """
+        Replace the field's text. fill() sets the whole value in one call; fields that
+        need real key events are cleared and typed character by character instead.
+        """
+        field = self._field(selector)
+        if not requires_keystrokes:
+            await self._focused(field.fill, str(text_value), timeout=TimingConstants.DEFAULT_TIMEOUT)
+            return
+
         await self._human_delay(0.4, 0.9)
-        await element.type(str(text_value))
+        # Clearing and typing go to the focused element; keep them in one critical
+        # section so a concurrent field can't take focus in between.
+        async with self._keyboard_lock:
+            await field.fill("", timeout=TimingConstants.DEFAULT_TIMEOUT)
+            await field.press_sequentially(str(text_value), timeout=TimingConstants.DEFAULT_TIMEOUT)
 
-    async def _handle_select(self, element, value: Any):
+    async def _handle_select(self, selector: str, value: Any):
         """Handle <select> dropdown by selecting an option with the given 'value'."""
         await self._human_delay(0.4, 0.9)
-        await element.select_option(value=str(value))
+        await self._field(selector).select_option(value=str(value), timeout=TimingConstants.DEFAULT_TIMEOUT)
 
-    async def _handle_checkbox(self, element, value: bool):
+    async def _handle_checkbox(self, selector: str, value: bool):
         """If 'value' is True, ensure the checkbox is checked; if False, ensure it's unchecked."""
-        current_state = await element.is_checked()
-        if bool(value) != current_state:
-            await self._human_delay(0.3, 0.8)
-            await element.click()
+        await self._human_delay(0.3, 0.8)
+        await self._focused(self._field(selector).set_checked, bool(value), timeout=TimingConstants.DEFAULT_TIMEOUT)
 
     async def _handle_radio(self, selector_base: str, value: Any):
         """Handle radio button groups like input[name='gender'][value='female']."""
         await self._human_delay(0.3, 0.8)
         radio_selector = f"{selector_base}[value='{value}']"
-        radio_element = await self._wait_for_element(radio_selector)
-        await radio_element.click()
+        await self._focused(self._field(radio_selector).check, timeout=TimingConstants.DEFAULT_TIMEOUT)
 
-    async def _handle_file_upload(self, element, file_path: str, required: bool):
+    async def _handle_file_upload(self, selector: str, file_path: str, required: bool):
         """Handle a file upload input (e.g., for CV)."""
         if not file_path or not Path(file_path).exists():
             msg = f"File to upload not found: {file_path}"
             if required:
-                new_path = input("Required file not found. Provide a valid file path or press enter to skip: ").strip()
+                new_path = await self._prompt_user(
+                    "Required file not found. Provide a valid file path or press enter to skip: "
+                )
                 if new_path and Path(new_path).exists():
                     file_path = new_path
                 else:
@@ -357,13 +797,35 @@ class FormFillerAgent:
                 return
 
         await self._human_delay(0.6, 1.2)
-        await element.set_input_files(file_path)
+        await self._field(selector).set_input_files(file_path, timeout=TimingConstants.DEFAULT_TIMEOUT)
 
-    async def _handle_cover_letter(self, field_type: str, selector: str, value: Any, required: bool):
+    async def _handle_cover_letter(
+        self,
+        field_type: str,
+        selector: str,
+        value: Any,
+        required: bool,
+        requires_keystrokes: bool = False
+    ):
         """
         Generate or retrieve a cover letter, then either fill or upload it.
         If generation fails, retry once; if still failing and required, prompt user.
+
+        For text fields that need generation (and aren't cached), the letter is streamed
+        straight into the field first; any streaming failure falls back to the regular path.
+        Fields that require real keystrokes skip streaming and are typed once generated.
         """
+        can_stream = field_type == "cover_letter_text" and not requires_keystrokes and isinstance(value, dict)
+        if can_stream and await self.cover_letter_cache.get(
+            value.get("job_title", "N/A"), value.get("job_description", "")
+        ) is None:
+            try:
+                if await self._stream_cover_letter_into_field(selector, value):
+                    await self.logs_manager.info("Cover letter streamed into form")
+                    return
+            except Exception as e:
+                await self.logs_manager.warning(f"Streaming cover letter failed, falling back: {e}")
+
         attempts = 0
         cover_text = None
 
@@ -380,7 +842,9 @@ class FormFillerAgent:
                     if required:
                         # Prompt user for manual cover letter
                         await self.logs_manager.warning("Cover letter is required but generation failed twice. Requesting manual input...")
-                        user_input = input("Cover letter is required but generation failed twice. Please paste cover letter text: ").strip()
+                        user_input = await self._prompt_user(
+                            "Cover letter is required but generation failed twice. Please paste cover letter text: "
+                        )
                         if user_input:
                             cover_text = user_input
                             await self.logs_manager.info("Manual cover letter received")
@@ -399,18 +863,17 @@ class FormFillerAgent:
             return
 
         if field_type == "cover_letter_text":
-            element = await self._wait_for_element(selector)
-            await self._handle_text_field(element, cover_text)
+            await self._handle_text_field(selector, cover_text, requires_keystrokes)
             await self.logs_manager.info("Cover letter text filled in form")
         elif field_type == "cover_letter_upload":
             file_path = await self._write_cover_letter_to_file(cover_text)
-            element = await self._wait_for_element(selector)
-            await self._handle_file_upload(element, file_path, required=False)
-            await self.logs_manager.info("Cover letter uploaded as file")
-            # Cleanup
-            if Path(file_path).exists():
+            try:
+                await self._handle_file_upload(selector, file_path, required=False)
+                await self.logs_manager.info("Cover letter uploaded as file")
+            finally:
+                # Cleanup, even if the upload failed
                 try:
-                    Path(file_path).unlink()
+                    Path(file_path).unlink(missing_ok=True)
                 except Exception as e:
                     await self.logs_manager.error(f"Failed to cleanup temporary cover letter file: {e}")
 
@@ -433,50 +896,222 @@ class FormFillerAgent:
         return ""
 
     async def _call_llm_cover_letter(self, job_title: str, job_description: str) -> str:
-        """Example GPT-4 call, done via run_in_executor for a sync OpenAI call."""
-        if not openai.api_key:
-            error_msg = "OpenAI API key not set. Please set OPENAI_API_KEY."
-            await self.logs_manager.error(error_msg)
-            raise ValueError(error_msg)
+        """
+        LLM call through the shared async OpenAI client.
+        Letters are cached on disk per job, so repeat applications skip the API call.
+        """
+        cached = await self.cover_letter_cache.get(job_title, job_description)
+        if cached is not None:
+            await self.logs_manager.debug("Using cached cover letter")
+            return cached
 
-        prompt = (
-            f"Write a concise but effective cover letter for a position:\n"
-            f"Job Title: {job_title}\n"
-            f"Job Description: {job_description}\n"
-            f"Keep it professional, 200 words or fewer."
-        )
+        await self._ensure_openai_key()
+        prompt = self._build_cover_letter_prompt(job_title, job_description)
 
         try:
             await self.logs_manager.debug("Calling OpenAI API for cover letter generation...")
-            loop = asyncio.get_running_loop()
-            response = await loop.run_in_executor(None, self._sync_openai_chat_completion, prompt)
+            response = await self._async_chat_completion(prompt)
             await self.logs_manager.debug("Cover letter generated successfully")
+            await self.cover_letter_cache.set(job_title, job_description, response)
             return response
         except Exception as e:
-            error_msg = f"OpenAI GPT-4o cover letter generation failed: {str(e)}"
+            error_msg = f"OpenAI cover letter generation failed: {str(e)}"
             await self.logs_manager.error(error_msg)
             raise RuntimeError(error_msg)
 
-    def _sync_openai_chat_completion(self, prompt: str) -> str:
-        """Blocking call to OpenAI's ChatCompletion API (GPT-4o)."""
-        try:
-            response = openai.ChatCompletion.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=300,
-                temperature=0.7
+    async def _ensure_openai_key(self):
+        """Raise ValueError if no OpenAI API key is configured."""
+        if not openai.api_key:
+            error_msg = "OpenAI API key not set. Please set OPENAI_API_KEY."
+            await self.logs_manager.error(error_msg)
+            raise ValueError(error_msg)
+
+    async def generate_batch(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Generate cover letters for several jobs, packing up to COVER_LETTER_BATCH_MAX_JOBS
+        of them (and COVER_LETTER_BATCH_MAX_INPUT_TOKENS of job data) into each request.
+
+        Args:
+            jobs: [{"job_title": ..., "job_description": ...}, ...]
+        Returns:
+            Cover letters in the same order as `jobs` ("" where generation failed).
+            Letters are cached, so fill_form picks them up without another API call.
+        """
+        letters = [""] * len(jobs)
+        pending = []
+        for index, job in enumerate(jobs):
+            cached = await self.cover_letter_cache.get(job.get("job_title", "N/A"), job.get("job_description", ""))
+            if cached is not None:
+                letters[index] = cached
+            else:
+                pending.append(index)
+        if not pending:
+            return letters
+
+        await self._ensure_openai_key()
+        groups, group, group_tokens = [], [], 0
+        for index in pending:
+            job_prompt = self._build_cover_letter_prompt(
+                jobs[index].get("job_title", "N/A"), jobs[index].get("job_description", "")
             )
-            return response.choices[0].message.content.strip()
+            job_tokens = _count_tokens(job_prompt)
+            if group and (len(group) >= COVER_LETTER_BATCH_MAX_JOBS
+                          or group_tokens + job_tokens > COVER_LETTER_BATCH_MAX_INPUT_TOKENS):
+                groups.append(group)
+                group, group_tokens = [], 0
+            group.append((index, job_prompt))
+            group_tokens += job_tokens
+        groups.append(group)
+
+        for group in groups:
+            generated = await self._generate_letter_group(group)
+            for index, _ in group:
+                job = jobs[index]
+                job_title, job_description = job.get("job_title", "N/A"), job.get("job_description", "")
+                letter = generated.get(str(index))
+                if letter:
+                    await self.cover_letter_cache.set(job_title, job_description, letter)
+                else:
+                    # Missing from the packed response: fall back to a single-job request.
+                    try:
+                        letter = await self._call_llm_cover_letter(job_title, job_description)
+                    except Exception as e:
+                        await self.logs_manager.error(f"Cover letter generation failed for {job_title}: {e}")
+                        letter = ""
+                letters[index] = letter
+        return letters
+
+    async def _generate_letter_group(self, group: List[tuple]) -> Dict[str, str]:
+        """
+        One completion for several jobs, answered as JSON {"letters": [{"id", "letter"}]}.
+        Returns {id: letter}; empty if the call or the JSON parsing fails.
+        """
+        prompt = (
+            "Write one cover letter for each job below. Respond with a JSON object "
+            '{"letters": [{"id": <job ID>, "letter": <cover letter>}]}.\n\n'
+            + "\n\n".join(f"ID: {index}\n{job_prompt}" for index, job_prompt in group)
+        )
+        request_body = self._chat_request_body(prompt)
+        request_body.pop("stop")
+        request_body["max_tokens"] = COVER_LETTER_MAX_TOKENS * len(group) + 50
+        request_body["response_format"] = {"type": "json_object"}
+
+        try:
+            await self.logs_manager.debug(f"Generating {len(group)} cover letters in one request...")
+            content = await self._async_chat_completion(prompt, request_body)
+            return {
+                str(item["id"]): str(item["letter"]).strip()
+                for item in json.loads(content).get("letters", [])
+                if isinstance(item, dict) and "id" in item and "letter" in item
+            }
         except Exception as e:
-            raise RuntimeError(f"OpenAI API call failed: {str(e)}")
+            await self.logs_manager.warning(f"Packed cover letter request failed, falling back per job: {e}")
+            return {}
+
+    def _build_cover_letter_prompt(self, job_title: str, job_description: str) -> str:
+        """
+        Build the per-job user turn (instructions live in COVER_LETTER_SYSTEM_MESSAGE).
+        Bump COVER_LETTER_PROMPT_VERSION when changing it.
+        """
+        job_description = _truncate_to_tokens(job_description, COVER_LETTER_JD_MAX_TOKENS)
+        return f"Title: {job_title}\nJD: {job_description}"
+
+    async def _stream_cover_letter_into_field(self, selector: str, value: Dict[str, Any]) -> str:
+        """
+        Generate a cover letter with a streamed completion and append it to the
+        text field as tokens arrive, so filling overlaps with generation.
+        Returns the full cover letter text.
+        """
+        await self._ensure_openai_key()
+        job_title = value.get("job_title", "N/A")
+        job_description = value.get("job_description", "")
+        prompt = self._build_cover_letter_prompt(job_title, job_description)
+        await self.logs_manager.debug(f"Streaming cover letter for position: {job_title}")
+
+        field = self._field(selector)
+        await self._focused(field.fill, "", timeout=TimingConstants.DEFAULT_TIMEOUT)
+
+        parts, pending, pending_len = [], [], 0
+        async for token in self._stream_chat_completion(prompt):
+            parts.append(token)
+            pending.append(token)
+            pending_len += len(token)
+            if pending_len >= STREAM_FLUSH_CHARS:
+                await field.evaluate(APPEND_VALUE_JS, "".join(pending))
+                pending, pending_len = [], 0
+        if pending:
+            await field.evaluate(APPEND_VALUE_JS, "".join(pending))
+
+        cover_text = "".join(parts).strip()
+        await self.cover_letter_cache.set(job_title, job_description, cover_text)
+        return cover_text
+
+    def _chat_request_body(self, prompt: str) -> Dict[str, Any]:
+        """Chat Completions parameters for a cover letter prompt (shared by realtime, streaming and batch calls)."""
+        return {
+            "model": self.llm_model,
+            "messages": [COVER_LETTER_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            "max_tokens": COVER_LETTER_MAX_TOKENS,
+            "temperature": 0.7,
+            "stop": ["\n\n\n"]
+        }
+
+    async def _stream_chat_completion(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Yield content deltas from a streamed Chat Completions call.
+        Stops reading once COVER_LETTER_MAX_WORDS words have arrived.
+        """
+        client = await get_openai_client()
+        async with _openai_limiter:
+            stream = await client.chat.completions.create(**self._chat_request_body(prompt), stream=True)
+        text = ""
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                content = chunk.choices[0].delta.content
+                yield content
+                text += content
+                if len(text.split()) >= COVER_LETTER_MAX_WORDS:
+                    await stream.close()
+                    break
+
+    async def _async_chat_completion(self, prompt: str, request_body: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Non-blocking call to OpenAI's Chat Completions API (model from self.llm_model).
+        Transient errors (rate limits, timeouts, dropped connections) are retried
+        here with jittered exponential backoff; anything else fails immediately.
+
+        Args:
+            request_body: Full request parameters; defaults to _chat_request_body(prompt).
+        """
+        client = await get_openai_client()
+        request_body = request_body or self._chat_request_body(prompt)
+        for attempt in range(1, OPENAI_MAX_ATTEMPTS + 1):
+            try:
+                async with _openai_limiter:
+                    response = await client.chat.completions.create(**request_body)
+                return response.choices[0].message.content.strip()
+            except OPENAI_RETRYABLE_ERRORS as e:
+                if attempt == OPENAI_MAX_ATTEMPTS:
+                    raise RuntimeError(f"OpenAI API call failed after {attempt} attempts: {str(e)}")
+                delay = _openai_retry_delay(e, attempt)
+                await self.logs_manager.warning(
+                    f"OpenAI transient error (attempt {attempt}/{OPENAI_MAX_ATTEMPTS}): {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+            except Exception as e:
+                raise RuntimeError(f"OpenAI API call failed: {str(e)}")
 
     async def _write_cover_letter_to_file(self, cover_text: str) -> str:
         """Write cover letter text to a .txt file for uploading. Returns file path."""
-        temp_file = Path("temp_cover_letter.txt")
         try:
-            temp_file.write_text(cover_text, encoding="utf-8")
-            await self.logs_manager.debug(f"Cover letter written to temporary file: {temp_file}")
-            return str(temp_file)
+            # Unique file per call, so concurrent uploads can't overwrite each other's letter.
+            async with aiofiles.tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", prefix="cl_", suffix=".txt", delete=False
+            ) as temp_file:
+                await temp_file.write(cover_text)
+            await self.logs_manager.debug(f"Cover letter written to temporary file: {temp_file.name}")
+            return temp_file.name
         except Exception as e:
             error_msg = f"Failed to write cover letter to file: {e}"
             await self.logs_manager.error(error_msg)
@@ -485,31 +1120,191 @@ class FormFillerAgent:
     # -------------------------------------------------------------------------
     # Utility Methods
     # -------------------------------------------------------------------------
-    async def _wait_for_element(self, selector: str):
+    async def _wait_for_visible(self, selector: str, timeout: int) -> bool:
+        """Wait up to `timeout` ms for selector to be visible; False on timeout instead of raising."""
+        try:
+            await self.page.locator(selector).first.wait_for(state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def _is_present(self, selector: str) -> bool:
+        """
+        True if selector already matches something in the DOM (no waiting).
+        Counts through a Locator, so no ElementHandle is left behind in the page.
+        """
+        return await self.page.locator(selector).count() > 0
+
+    async def _wait_for_element(self, selector: str, timeout: int = TimingConstants.DEFAULT_TIMEOUT):
         """
         Wait for an element to be visible, returning the element handle.
-        Uses DomService internally.
+        Uses DomService internally. Only for elements that must appear; `timeout` is in ms.
         """
         try:
-            await self.logs_manager.debug(f"Waiting for element: {selector}")
-            element = await self.dom_service.wait_for_selector(
-                selector,
-                timeout=TimingConstants.DEFAULT_TIMEOUT
-            )
-            await self.logs_manager.debug(f"Element found: {selector}")
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"Waiting for element: {selector}")
+            element = await self.dom_service.wait_for_selector(selector, timeout=timeout)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"Element found: {selector}")
             return element
         except PlaywrightTimeoutError:
             error_msg = f"Timeout waiting for element: {selector}"
             await self.logs_manager.error(error_msg)
             raise Exception(error_msg)
 
+    async def _prompt_user(self, message: str) -> str:
+        """Ask the user for input without blocking the event loop."""
+        return (await self.prompt_callback(message) or "").strip()
+
+    @staticmethod
+    async def _console_prompt(message: str) -> str:
+        """Default prompt: builtin input() in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: input(message))
+
+    async def _delay(self, ms: float):
+        """
+        Human-like pause of `ms` milliseconds (TimingConstants values are in ms).
+        No-op when humanize is off.
+        """
+        if self.humanize:
+            await asyncio.sleep(ms / 1000)
+
     async def _human_delay(self, min_sec: float = None, max_sec: float = None):
         """
         Short random delay to mimic human-like interaction.
         Defaults are shorter for a faster user experience
-        but still not instantaneous.
+        but still not instantaneous. No-op when humanize is off or the
+        upper bound is zero.
         """
-        min_sec = min_sec if min_sec is not None else TimingConstants.HUMAN_DELAY_MIN
-        max_sec = max_sec if max_sec is not None else TimingConstants.HUMAN_DELAY_MAX
-        delay = random.uniform(min_sec, max_sec)
-        await asyncio.sleep(delay)
+        if not self.humanize:
+            return
+        min_sec = min_sec if min_sec is not None else TimingConstants.HUMAN_DELAY_MIN / 1000
+        max_sec = max_sec if max_sec is not None else TimingConstants.HUMAN_DELAY_MAX / 1000
+        if max_sec <= 0:
+            return
+        await asyncio.sleep(self._uniform(min_sec, max_sec))
+
+
+
+class BatchCoverLetterQueue:
+    """
+    Queue cover letters for the OpenAI Batch API (cheaper, up to 24h turnaround)
+    during a scraping pass, then load the results into the agent's cover letter cache.
+
+    Jobs whose batch results aren't ready in time simply miss the cache, and
+    FormFillerAgent generates them in realtime as usual.
+
+    Usage:
+        queue = BatchCoverLetterQueue(form_filler)
+        queue.add("job-123", "Data Scientist", "Looking for a DS...")
+        await queue.submit()
+        await queue.collect(timeout=3600)
+    """
+
+    TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+    def __init__(self, agent: FormFillerAgent, poll_interval: float = 60.0):
+        """
+        Args:
+            agent: FormFillerAgent whose prompt, request parameters and cache are used
+            poll_interval: Seconds between batch status checks
+        """
+        self.agent = agent
+        self.logs_manager = agent.logs_manager
+        self.poll_interval = poll_interval
+        self.batch_dir = agent.cover_letter_cache.db_path.parent / "batches"
+        self.pending: Dict[str, Dict[str, str]] = {}  # job_id -> {"job_title", "job_description"}
+        self.batch_id: Optional[str] = None
+
+    def add(self, job_id: str, job_title: str, job_description: str):
+        """Queue a job for batch cover letter generation."""
+        self.pending[str(job_id)] = {"job_title": job_title, "job_description": job_description}
+
+    async def submit(self) -> Optional[str]:
+        """
+        Write pending jobs (not already cached) to a JSONL file, upload it and
+        create the batch. Returns the batch id, or None if nothing needed generating.
+        """
+        requests = []
+        for job_id, job in list(self.pending.items()):
+            if await self.agent.cover_letter_cache.get(job["job_title"], job["job_description"]) is not None:
+                del self.pending[job_id]
+                continue
+            prompt = self.agent._build_cover_letter_prompt(job["job_title"], job["job_description"])
+            requests.append({
+                "custom_id": job_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self.agent._chat_request_body(prompt)
+            })
+
+        if not requests:
+            await self.logs_manager.info("[BatchCoverLetterQueue] All queued cover letters are already cached")
+            return None
+
+        await self.agent._ensure_openai_key()
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        batch_file = self.batch_dir / f"cover_letters_{int(time.time())}.jsonl"
+        await asyncio.to_thread(
+            batch_file.write_text,
+            "\n".join(json.dumps(request) for request in requests),
+            encoding="utf-8"
+        )
+
+        client = await get_openai_client()
+        input_file = await client.files.create(file=batch_file, purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        self.batch_id = batch.id
+        await self.logs_manager.info(
+            f"[BatchCoverLetterQueue] Submitted batch {batch.id} with {len(requests)} cover letters"
+        )
+        return batch.id
+
+    async def collect(self, timeout: float) -> int:
+        """
+        Poll the batch until it finishes or `timeout` seconds pass, then cache
+        every successful cover letter. Returns the number of letters cached.
+        """
+        if not self.batch_id:
+            return 0
+
+        client = await get_openai_client()
+        deadline = time.monotonic() + timeout
+        batch = await client.batches.retrieve(self.batch_id)
+        while batch.status not in self.TERMINAL_STATUSES:
+            if time.monotonic() >= deadline:
+                await self.logs_manager.warning(
+                    f"[BatchCoverLetterQueue] Batch {self.batch_id} still '{batch.status}' after {timeout}s; "
+                    f"remaining cover letters will be generated in realtime"
+                )
+                return 0
+            await asyncio.sleep(self.poll_interval)
+            batch = await client.batches.retrieve(self.batch_id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            await self.logs_manager.warning(
+                f"[BatchCoverLetterQueue] Batch {self.batch_id} ended with status '{batch.status}'"
+            )
+            return 0
+
+        output = await client.files.content(batch.output_file_id)
+        cached = 0
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            job = self.pending.get(result.get("custom_id"))
+            response = result.get("response") or {}
+            if not job or result.get("error") or response.get("status_code") != 200:
+                continue
+            cover_text = response["body"]["choices"][0]["message"]["content"].strip()
+            await self.agent.cover_letter_cache.set(job["job_title"], job["job_description"], cover_text)
+            del self.pending[result["custom_id"]]
+            cached += 1
+
+        await self.logs_manager.info(f"[BatchCoverLetterQueue] Cached {cached} cover letters from batch {self.batch_id}")
+        return cached
@@ -8,6 +8,8 @@ Features:
 4. Screenshot capturing for debugging / record-keeping.
 5. Check element presence (returns bool).
 6. Evaluate custom JavaScript/TypeScript on the page if needed.
+   Waits on page state should use JS predicates (wait_for_js_condition) or
+   wait_for_selector_state; wait_for_condition polls Python callables.
 7. No LLM usage here; purely mechanical. Orchestrator or separate LLM-based agent
    can provide instructions for this agent on unknown domains or fallback scenarios.
 
@@ -19,237 +21,703 @@ DOM Enhancement Updates:
 """
 
 import asyncio
+import os
 import random
-import time
-from typing import Any, Optional, List, TYPE_CHECKING
+import re
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, List, Tuple, TYPE_CHECKING
+from urllib.parse import urlparse
 from playwright.async_api import (
     Page,
+    Error as PlaywrightError,
     TimeoutError as PlaywrightTimeoutError
 )
 from constants import TimingConstants, Messages
-from utils.dom.dom_service import DomService
+from utils.dom.dom_service import (
+    DomService, EXTRACT_ATTR_JS, SCROLL_MAX_STEPS, SCROLL_TIMEOUT_MS, SCROLL_TO_BOTTOM_JS
+)
+from utils.telemetry import TelemetryManager
+from locators.linkedin_locators import LinkedInLocators
+from utils.page_pool import PagePool
 
 if TYPE_CHECKING:
-    from utils.telemetry import TelemetryManager
-    from locators.linkedin_locators import LinkedInLocators
     from storage.logs_manager import LogsManager
 
+# Upper bound on remembered selector resolutions (LRU eviction beyond this).
+SELECTOR_CACHE_SIZE = 512
+
+# Seconds to remember that the DOM-walk click fallback found nothing for a selector on a URL.
+FALLBACK_MISS_TTL = 30
+
+# Maximum concurrent DomService/Page calls across all GeneralAgent instances.
+DOM_CONCURRENCY_LIMIT = 32
+
+# Maximum concurrent DomService/Page calls on one agent's page (and its frames).
+PAGE_CONCURRENCY_LIMIT = 8
+
+# Number of precomputed human-like delays cycled by _human_delay.
+DELAY_POOL_SIZE = 256
+
+# Attribute the DOM-walk fallback tags matches with; its indices are reassigned for
+# every document, so resolutions through it don't survive a navigation.
+HIGHLIGHT_INDEX_ATTR = "data-highlight-index"
+
+# Plain "#id" / ".class" selectors, optionally tag-qualified ("button#submit").
+# A miss on one of these means the element isn't there, so the DOM-walk fallback is skipped.
+SIMPLE_SELECTOR_RE = re.compile(r"^[a-zA-Z]*[#.][\w-]+$")
+
+# Hot TimingConstants bound once at import so methods skip the class attribute lookup.
+MAX_RETRIES = TimingConstants.MAX_RETRIES
+BASE_RETRY_DELAY = TimingConstants.BASE_RETRY_DELAY  # ms
+MAX_WAIT_MS = TimingConstants.MAX_WAIT_TIME
+PAGE_TRANSITION_DELAY_SEC = TimingConstants.PAGE_TRANSITION_DELAY / 1000
+
+# Upper bound (ms) of the jittered sleep after each failed attempt: three times the
+# exponential step, capped at MAX_RETRY_DELAY. Computed once at import.
+RETRY_DELAY_CEILINGS = tuple(
+    min(TimingConstants.MAX_RETRY_DELAY, BASE_RETRY_DELAY * (1 << attempt) * 3)
+    for attempt in range(MAX_RETRIES)
+)
+
+# Waits (ms) at or below this are answered from the current DOM in one evaluate call.
+PRESENCE_FAST_PATH_MAX_WAIT = 100
+
+# Synchronous presence check; null when the selector isn't plain CSS (e.g. "text=..."),
+# which sends check_element_present back to the Playwright locator path.
+ELEMENT_PRESENT_JS = "s => { try { return !!document.querySelector(s); } catch (e) { return null; } }"
+
+# Helper library installed once per page (init script for future documents, evaluate
+# for the live one) so hot evaluate calls ship a short call site, not the full source.
+HELPERS_JS = f"""window.__ga = window.__ga || {{
+    present: {ELEMENT_PRESENT_JS},
+    scrollToBottom: {SCROLL_TO_BOTTOM_JS},
+}};"""
+PRESENT_CALL_JS = "s => window.__ga.present(s)"
+SCROLL_TO_BOTTOM_CALL_JS = "args => window.__ga.scrollToBottom(args)"
+
+# Pages that already carry HELPERS_JS as an init script, and pages/frames whose live
+# document has it. Kept per Page rather than per agent: pooled pages outlive the agents
+# built on them, and each add_init_script would otherwise pile up and run on every navigation.
+_helper_init_pages: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_helper_documents: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+# Transient failures worth another attempt. Anything else (bad selectors, invalid URLs,
+# programming errors) fails on the first attempt instead of sitting through the backoff.
+RECOVERABLE_ERRORS = (PlaywrightTimeoutError, asyncio.TimeoutError, ConnectionError)
+
+# Chromium network errors ("net::ERR_CONNECTION_RESET", ...) surface as a plain Playwright
+# Error, so they are recognised by message.
+NETWORK_ERROR_MARKER = "net::ERR_"
+
+
+def _is_recoverable(error: Exception) -> bool:
+    """True for transient errors _retry_operation should retry."""
+    if isinstance(error, RECOVERABLE_ERRORS):
+        return True
+    return isinstance(error, PlaywrightError) and NETWORK_ERROR_MARKER in str(error)
+
 
 class GeneralAgent:
+    # Fixed attribute layout: no per-instance __dict__, since pooled deployments
+    # keep many agents alive at once. New instance attributes must be listed here.
+    __slots__ = (
+        "dom_service",
+        "logs_manager",
+        "page",
+        "root_page",
+        "_current_frame_sel",
+        "default_timeout",
+        "min_delay",
+        "max_delay",
+        "humanize",
+        "_rng",
+        "_delay_pool",
+        "_delay_idx",
+        "_resume_event",
+        "telemetry",
+        "_selector_cache",
+        "_fallback_misses",
+        "_locator_cache",
+        "_page_sem",
+    )
+
+    # Caps in-flight DOM calls across all agents so the CDP pipe doesn't saturate.
+    _dom_sem: Optional[asyncio.BoundedSemaphore] = None
+    # id(settings) -> (settings, TelemetryManager), shared by agents built from the same settings;
+    # agents built without settings share the entry under None.
+    _telemetry_cache: Dict[Optional[int], Tuple[dict, TelemetryManager]] = {}
+
     def __init__(
         self,
         dom_service: 'DomService',
         logs_manager: 'LogsManager',
         default_timeout: float = TimingConstants.DEFAULT_TIMEOUT,
-        min_delay: float = TimingConstants.HUMAN_DELAY_MIN,
-        max_delay: float = TimingConstants.HUMAN_DELAY_MAX,
-        settings: dict = {}
+        min_delay: float = TimingConstants.HUMAN_DELAY_MIN / 1000,
+        max_delay: float = TimingConstants.HUMAN_DELAY_MAX / 1000,
+        settings: Optional[dict] = None,
+        humanize: Optional[bool] = None
     ):
         """
         Args:
             dom_service (DomService): The DomService instance for all DOM ops
             logs_manager (LogsManager): The LogsManager instance for logging
             default_timeout (float): Default timeout for waits
-            min_delay (float): Min delay for human-like interaction
-            max_delay (float): Max delay for human-like interaction
-            settings (dict): Additional configuration for telemetry
+            min_delay (float): Min delay for human-like interaction, in seconds
+            max_delay (float): Max delay for human-like interaction, in seconds
+            settings (dict, optional): Additional configuration for telemetry
+            humanize (bool, optional): Keep the human-like delays between actions. Defaults
+                to True unless GENERAL_AGENT_FAST=1 (headless/CI runs).
         """
         self.dom_service = dom_service
         self.logs_manager = logs_manager
         self.page = dom_service.page  # convenience reference
         self.root_page = self.page    # Store reference to original "main" Page
-        self.default_timeout = min(default_timeout, TimingConstants.MAX_WAIT_TIME)
+        self._current_frame_sel: Optional[str] = None  # iframe selector self.page points into, if any
+        self.default_timeout = min(default_timeout, MAX_WAIT_MS)
         self.min_delay = min_delay
         self.max_delay = max_delay
-        self.is_paused = False         # Track pause state
-        self.telemetry = TelemetryManager(settings)
+        self.humanize = humanize if humanize is not None else os.getenv("GENERAL_AGENT_FAST", "0") != "1"
+        # Jittered default delays drawn once, then cycled by _human_delay.
+        self._rng = random.Random()  # per-agent generator for delays and jitter
+        self._delay_pool = [self._rng.uniform(min_delay, max_delay) for _ in range(DELAY_POOL_SIZE)]
+        self._delay_idx = 0
+        self._resume_event = asyncio.Event()  # Set while running, cleared by pause()
+        self._resume_event.set()
+        # Caps this agent's in-flight DOM calls so one page can't take every shared slot.
+        self._page_sem = asyncio.BoundedSemaphore(PAGE_CONCURRENCY_LIMIT)
+        self.telemetry = self._get_telemetry(settings)
+
+        # (selector, domain) -> selector that actually resolved on that site.
+        # Cleared on frame switches; navigations only drop highlight-index resolutions.
+        self._selector_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        # (selector, page URL) -> loop time until which the DOM-walk fallback is not retried
+        self._fallback_misses: Dict[Tuple[str, str], float] = {}
+        # (id(page or frame), selector) -> Locator, LRU-bounded like the selector cache.
+        self._locator_cache: "OrderedDict[Tuple[int, str], Any]" = OrderedDict()
+        # Navigations the agent didn't start (link clicks, redirects, form submits)
+        # replace the DOM too; drop document-bound state whenever the main frame navigates.
+        self.root_page.on("framenavigated", self._on_frame_navigated)
+
+    @classmethod
+    @asynccontextmanager
+    async def acquire(
+        cls,
+        pool: PagePool,
+        logs_manager: 'LogsManager',
+        settings: Optional[dict] = None,
+        **kwargs
+    ) -> AsyncIterator["GeneralAgent"]:
+        """
+        Borrow a page from a PagePool and yield a GeneralAgent bound to it.
+        The page goes back to the pool when the block exits.
+
+        Usage:
+            async with GeneralAgent.acquire(pool, logs_manager, settings) as agent:
+                await agent.navigate_to(url)
+        """
+        async with pool.acquire() as page:
+            dom_service = DomService(page, settings=settings, logs_manager=logs_manager)
+            agent = cls(dom_service, logs_manager, settings=settings, **kwargs)
+            try:
+                yield agent
+            finally:
+                agent.detach()
+
+    @classmethod
+    async def run_batch(
+        cls,
+        browser: Any,
+        urls: List[str],
+        work_fn: Callable[["GeneralAgent", str], Awaitable[Any]],
+        logs_manager: 'LogsManager',
+        settings: Optional[dict] = None,
+        concurrency: int = 5,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Run work_fn(agent, url) for every URL, up to `concurrency` at a time.
+        Each URL gets its own BrowserContext (isolated cookies/storage) on the shared
+        browser, closed once its work is done.
+
+        Returns:
+            One entry per URL, in order: work_fn's result, or the exception it raised,
+            so one failing URL doesn't abort the rest of the batch.
+        """
+        slots = asyncio.Semaphore(concurrency)
+
+        async def run_one(url: str) -> Any:
+            async with slots:
+                context = await browser.new_context()
+                try:
+                    page = await context.new_page()
+                    dom_service = DomService(page, settings=settings, logs_manager=logs_manager)
+                    agent = cls(dom_service, logs_manager, settings=settings, **kwargs)
+                    try:
+                        return await work_fn(agent, url)
+                    finally:
+                        agent.detach()
+                finally:
+                    await context.close()
+
+        return await asyncio.gather(*(run_one(url) for url in urls), return_exceptions=True)
+
+    def detach(self):
+        """Stop listening to the page's events (pooled pages outlive their agents)."""
+        self.root_page.remove_listener("framenavigated", self._on_frame_navigated)
+
+    @classmethod
+    def _get_telemetry(cls, settings: Optional[dict]) -> TelemetryManager:
+        """
+        Return the TelemetryManager shared by every agent built from this settings dict
+        (or by every agent built without settings).
+        The dict is kept alongside its manager so its id can't be reused by another object.
+        """
+        key = id(settings) if settings is not None else None
+        entry = cls._telemetry_cache.get(key)
+        if entry is None:
+            settings = settings if settings is not None else {}
+            entry = cls._telemetry_cache[key] = (settings, TelemetryManager(settings))
+        return entry[1]
 
     # ===================
     # Pause/Resume Methods
     # ===================
+    @property
+    def is_paused(self) -> bool:
+        return not self._resume_event.is_set()
+
     async def pause(self):
         """Pause further actions until 'resume' is called."""
         await self.logs_manager.info(f"[GeneralAgent] {Messages.PAUSE_MESSAGE}")
-        self.is_paused = True
+        self._resume_event.clear()
 
     async def resume(self):
         """Resume actions after being paused."""
         await self.logs_manager.info(f"[GeneralAgent] {Messages.RESUME_MESSAGE}")
-        self.is_paused = False
+        self._resume_event.set()
 
     async def _check_if_paused(self):
-        """Block execution if paused, resuming only when self.is_paused = False."""
-        if self.is_paused:
-            await self.logs_manager.info("[GeneralAgent] Currently paused... waiting.")
-            while self.is_paused:
-                await asyncio.sleep(TimingConstants.POLL_INTERVAL)
-            await self.logs_manager.info("[GeneralAgent] Resumed from pause.")
+        """Block execution if paused, waking as soon as resume() sets the event."""
+        if self._resume_event.is_set():
+            return
+        await self.logs_manager.info("[GeneralAgent] Currently paused... waiting.")
+        await self._resume_event.wait()
+        await self.logs_manager.info("[GeneralAgent] Resumed from pause.")
 
     # ===================
     # Retry Logic
     # ===================
     async def _retry_operation(self, operation: callable, *args: Any, **kwargs: Any):
         """
-        Retry an operation with exponential backoff.
-        E.g., 2s, 4s, 8s (up to MAX_RETRIES).
+        Retry an operation with jittered exponential backoff.
+        Each sleep between attempts is uniform in [BASE_RETRY_DELAY,
+        RETRY_DELAY_CEILINGS[attempt]] ms, so concurrent agents don't retry in lockstep
+        but never retry immediately; the last failure is raised without sleeping.
+        Only RECOVERABLE_ERRORS and Chromium network errors are retried; any other
+        exception is raised immediately.
         """
+        max_retries = MAX_RETRIES
+        base_delay = BASE_RETRY_DELAY
+        retry_message = Messages.RETRY_MESSAGE.format
         last_exception = None
-        for attempt in range(TimingConstants.MAX_RETRIES):
+        for attempt in range(max_retries):
             try:
                 return await operation(*args, **kwargs)
             except Exception as e:
+                if not _is_recoverable(e):
+                    raise
                 last_exception = e
-                delay = TimingConstants.BASE_RETRY_DELAY * (2 ** attempt)
-                await self.logs_manager.warning(f"[GeneralAgent] {Messages.RETRY_MESSAGE.format(attempt+1, TimingConstants.MAX_RETRIES, e)}")
-                await self.logs_manager.info(f"[GeneralAgent] Retrying in {delay} seconds...")
+                if self.logs_manager.is_enabled("WARNING"):
+                    await self.logs_manager.warning(f"[GeneralAgent] {retry_message(attempt + 1, max_retries, e)}")
+                if attempt == max_retries - 1:
+                    break  # no retry left to wait for
+                delay = self._rng.uniform(base_delay, RETRY_DELAY_CEILINGS[attempt]) / 1000
+                if self.logs_manager.is_enabled("INFO"):
+                    await self.logs_manager.info(f"[GeneralAgent] Retrying in {delay:.2f} seconds...")
                 await asyncio.sleep(delay)
         error_msg = f"[GeneralAgent] All retries failed. Last error: {last_exception}"
         await self.logs_manager.error(error_msg)
         raise Exception(error_msg)
 
-    async def _navigate_operation(self, url: str):
+    async def _navigate_operation(self, url: str, wait_until: str = "domcontentloaded"):
         """
         Operation used by _retry_operation to navigate to a URL.
-        Uses a shorter timeout to prevent indefinite waits.
+        Uses a shorter timeout to prevent indefinite waits. The limit is
+        enforced by Playwright's own goto timeout; do not wrap this call in
+        asyncio.timeout, which would only add a second, redundant timer.
+        The human-like delay is taken once by navigate_to; retries already back off.
         """
-        await self._human_delay()
         try:
-            async with asyncio.timeout(TimingConstants.MAX_WAIT_TIME / 1000):
-                return await self.dom_service.goto(
-                    url,
-                    wait_until="domcontentloaded",
-                    timeout=TimingConstants.MAX_WAIT_TIME
-                )
-        except asyncio.TimeoutError:
-            await self.logs_manager.warning(f"[GeneralAgent] Navigation to {url} exceeded {TimingConstants.MAX_WAIT_TIME}ms limit. Proceeding anyway.")
+            return await self._dom_call(
+                self.dom_service.goto,
+                url,
+                wait_until=wait_until,
+                timeout=MAX_WAIT_MS
+            )
+        except PlaywrightTimeoutError:
+            await self.logs_manager.warning(f"[GeneralAgent] Navigation to {url} exceeded {MAX_WAIT_MS}ms limit. Proceeding anyway.")
             return None
 
     async def _human_delay(self, min_sec: float = None, max_sec: float = None):
         """
         Short random delay to mimic human-like interaction.
-        If not specified, uses self.min_delay / self.max_delay.
+        If not specified, takes the next value from the precomputed delay pool
+        (drawn from self.min_delay / self.max_delay). No-op when humanize is off
+        or the upper bound is zero, so no scheduler hop is paid for a zero sleep.
         """
-        if min_sec is None:
-            min_sec = self.min_delay
-        if max_sec is None:
-            max_sec = self.max_delay
-        delay = random.uniform(min_sec, max_sec)
+        if not self.humanize:
+            return
+        if min_sec is None and max_sec is None:
+            if self.max_delay <= 0:
+                return
+            delay = self._delay_pool[self._delay_idx % DELAY_POOL_SIZE]
+            self._delay_idx += 1
+        else:
+            if min_sec is None:
+                min_sec = self.min_delay
+            if max_sec is None:
+                max_sec = self.max_delay
+            if max_sec <= 0:
+                return
+            delay = self._rng.uniform(min_sec, max_sec)
         await asyncio.sleep(delay)
 
-    def _current_time_ms(self) -> int:
-        """Helper method to get current time in milliseconds."""
-        return int(time.time() * 1000)
+    # ===================
+    # DOM Concurrency
+    # ===================
+    @classmethod
+    def _dom_slots(cls) -> asyncio.BoundedSemaphore:
+        """Semaphore shared by every GeneralAgent, created on first use inside the running loop."""
+        if cls._dom_sem is None:
+            cls._dom_sem = asyncio.BoundedSemaphore(DOM_CONCURRENCY_LIMIT)
+        return cls._dom_sem
+
+    def _wait_timeout(self, timeout: Optional[float]) -> float:
+        """Caller's timeout clamped to MAX_WAIT_MS; default_timeout is already clamped in __init__."""
+        return self.default_timeout if timeout is None else min(timeout, MAX_WAIT_MS)
+
+    async def _dom_call(self, operation: callable, *args: Any, **kwargs: Any):
+        """
+        Run a single DomService/Page call while holding one of this page's slots and
+        one of the shared DOM slots. The page slot is taken first, so calls queued
+        behind a busy page don't hold shared slots other agents could use.
+        """
+        async with self._page_sem, self._dom_slots():
+            return await operation(*args, **kwargs)
+
+    async def _delayed_read(self, operation: callable, *args: Any, **kwargs: Any):
+        """
+        Run a read-only DOM call concurrently with the human-like delay and return its result.
+        Only for idempotent lookups: the page sees the same request whether it lands
+        before or after the pause, so the action costs max(delay, call) instead of the sum.
+        """
+        _, result = await asyncio.gather(self._human_delay(), self._dom_call(operation, *args, **kwargs))
+        return result
+
+    async def _batch_attr(self, selector: str, attr: str) -> List[str]:
+        """
+        Read attr from every element matching selector in one evaluate_all round-trip.
+        Use this for any N-elements-by-attribute scrape (href, data-*) instead of
+        looping over get_attribute; missing or empty values are dropped.
+        """
+        return await self._delayed_read(self._get_locator(selector).evaluate_all, EXTRACT_ATTR_JS, attr)
+
+    # ===================
+    # Selector Cache
+    # ===================
+    def _selector_key(self, selector: str) -> Tuple[str, str]:
+        try:
+            domain = urlparse(self.page.url).netloc
+        except (AttributeError, TypeError, ValueError):
+            domain = ""
+        return selector, domain
+
+    def _cached_selector(self, selector: str) -> Optional[str]:
+        """Return the remembered resolution for selector on the current domain, if any."""
+        key = self._selector_key(selector)
+        resolved = self._selector_cache.get(key)
+        if resolved is not None:
+            self._selector_cache.move_to_end(key)
+        return resolved
+
+    def _remember_selector(self, selector: str, resolved: str):
+        key = self._selector_key(selector)
+        self._selector_cache[key] = resolved
+        self._selector_cache.move_to_end(key)
+        while len(self._selector_cache) > SELECTOR_CACHE_SIZE:
+            self._selector_cache.popitem(last=False)
+
+    def _forget_selector(self, selector: str):
+        self._selector_cache.pop(self._selector_key(selector), None)
+
+    def invalidate_selector_cache(self):
+        """Forget cached selector resolutions (call after the DOM is replaced)."""
+        self._selector_cache.clear()
+
+    def _on_document_replaced(self):
+        """
+        Drop what is tied to the old document: cached locators and resolutions to
+        DOM-walk highlight indices. Per-domain resolutions to real selectors are kept;
+        they still apply to the next page on the same site.
+        """
+        self._locator_cache.clear()
+        for key in [key for key, resolved in self._selector_cache.items() if HIGHLIGHT_INDEX_ATTR in resolved]:
+            del self._selector_cache[key]
+
+    def _on_frame_navigated(self, frame):
+        """framenavigated listener: main-frame navigations replace the DOM."""
+        if frame is self.root_page.main_frame:
+            self._on_document_replaced()
+
+    def _resolve(self, selector: str) -> str:
+        """
+        Resolve selector to the one that last worked on this domain.
+        Falls back to the selector itself when nothing is cached.
+        """
+        return self._cached_selector(selector) or selector
+
+    def _get_locator(self, selector: str):
+        """
+        Locator for the (resolved) selector in the current page/frame, built once and reused.
+        Keyed on id(self.page) so locators from another frame are never handed out.
+        """
+        key = (id(self.page), self._resolve(selector))
+        locator = self._locator_cache.get(key)
+        if locator is None:
+            locator = self._locator_cache[key] = self.page.locator(key[1])
+            while len(self._locator_cache) > SELECTOR_CACHE_SIZE:
+                self._locator_cache.popitem(last=False)
+        else:
+            self._locator_cache.move_to_end(key)
+        return locator
+
+    async def _ensure_helpers(self):
+        """
+        Make window.__ga available in the current page/frame.
+        HELPERS_JS is registered once per root page as an init script, which covers
+        every later document in it and its frames; documents that were already loaded
+        get it once through evaluate. Both are tracked on the Page/Frame itself, so
+        agents reusing a pooled page don't register it again.
+        """
+        if self.page in _helper_documents:
+            return
+        if self.root_page not in _helper_init_pages:
+            _helper_init_pages.add(self.root_page)
+            try:
+                await self._dom_call(self.root_page.add_init_script, HELPERS_JS)
+            except BaseException:
+                _helper_init_pages.discard(self.root_page)
+                raise
+        await self._dom_call(self.page.evaluate, HELPERS_JS)
+        _helper_documents.add(self.page)
 
     # -------------------------------------------------------------------------
     # Public Methods - Navigation & Basic Interactions
     # -------------------------------------------------------------------------
-    async def navigate_to(self, url: str):
-        """Navigate to a specific URL with up to MAX_RETRIES attempts."""
+    async def navigate_to(self, url: str, wait_until: str = "domcontentloaded"):
+        """
+        Navigate to a specific URL with up to MAX_RETRIES attempts.
+
+        Args:
+            url: Target URL.
+            wait_until: Playwright load state goto waits for. "commit" returns once the
+                response arrives and skips the settle delay; use it when the next step is
+                a locator action (click/type/wait), which auto-waits for its element.
+                Keep the default before reads that take the DOM as-is (extract_links,
+                zero-timeout presence checks).
+        """
         await self._check_if_paused()
-        result = await self._retry_operation(self._navigate_operation, url)
-        await asyncio.sleep(TimingConstants.PAGE_TRANSITION_DELAY)
+        await self._human_delay()
+        result = await self._retry_operation(self._navigate_operation, url, wait_until=wait_until)
+        self._on_document_replaced()
+        if wait_until != "commit":
+            await asyncio.sleep(PAGE_TRANSITION_DELAY_SEC)
         return result
 
     async def click_element(self, selector: str):
         """
-        Click element with fallback to LinkedInLocators if direct approach fails.
+        Click element, letting Playwright pick between the selector and any
+        LinkedInLocators alternatives registered under that name.
+        If none resolve, falls back to the DOM-walk lookup (except for plain id/class
+        selectors, which it can't improve on); a match is remembered for this domain
+        so later clicks go straight to it.
         """
         await self._check_if_paused()
-        try:
-            await self._human_delay()
+        await self._human_delay()
+        if self.logs_manager.is_enabled("DEBUG"):
             await self.logs_manager.debug(f"[GeneralAgent] Attempting to click element: {selector}")
-            await self.dom_service.click_element(selector)
-            await self.logs_manager.debug(f"[GeneralAgent] Successfully clicked element: {selector}")
+        try:
+            await self._dom_call(self._click_locator(selector).click, timeout=self.default_timeout)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Successfully clicked element: {selector}")
+            return
         except Exception as e:
-            await self.logs_manager.warning(f"[GeneralAgent] Direct click failed: {e}")
-            # Domain-specific fallback
+            last_error = e
+            # A remembered fallback that no longer clicks is stale; rediscover it.
+            self._forget_selector(selector)
+
+        dom_selector = None
+        if not (SIMPLE_SELECTOR_RE.match(selector) or LinkedInLocators.fallback_for(selector)):
+            await self.logs_manager.warning(f"[GeneralAgent] Direct click failed: {last_error}")
+            dom_selector = await self._dom_fallback_selector(selector)
+        if dom_selector:
+            await self.logs_manager.info(f"[GeneralAgent] Using fallback selector: {dom_selector}")
             try:
-                dom_selector = await LinkedInLocators.get_element(
-                    self.page, 
-                    selector,
-                    dom_fallback=True
-                )
-                if dom_selector:
-                    await self.logs_manager.info(f"[GeneralAgent] Using fallback selector: {dom_selector}")
-                    await self.dom_service.click_element(dom_selector)
+                await self._dom_call(self.dom_service.click_element, dom_selector)
+                self._remember_selector(selector, dom_selector)
+                if self.logs_manager.is_enabled("DEBUG"):
                     await self.logs_manager.debug(f"[GeneralAgent] Successfully clicked with fallback selector")
-                else:
-                    error_msg = f"[GeneralAgent] Both direct click and fallback failed for '{selector}'"
-                    await self.logs_manager.error(error_msg)
-                    raise Exception(error_msg)
+                return
             except Exception as e:
-                error_msg = f"[GeneralAgent] Click operation failed completely: {e}"
-                await self.logs_manager.error(error_msg)
-                raise Exception(error_msg)
+                last_error = e
+
+        error_msg = f"[GeneralAgent] Click operation failed completely for '{selector}': {last_error}"
+        await self.logs_manager.error(error_msg)
+        raise Exception(error_msg)
+
+    async def _dom_fallback_selector(self, selector: str) -> Optional[str]:
+        """
+        DOM-walk lookup through LinkedInLocators.get_element. Returns None when nothing
+        matches; a miss is remembered per page URL for FALLBACK_MISS_TTL seconds.
+        """
+        miss_key = (selector, self.page.url)
+        loop_time = asyncio.get_running_loop().time()
+        if self._fallback_misses.get(miss_key, 0) > loop_time:
+            return None
+        try:
+            dom_selector = await LinkedInLocators.get_element(
+                self.page, 
+                selector,
+                dom_fallback=True
+            )
+        except Exception as e:
+            await self.logs_manager.warning(f"[GeneralAgent] Fallback lookup failed for '{selector}': {e}")
+            dom_selector = None
+        if not dom_selector:
+            if len(self._fallback_misses) >= SELECTOR_CACHE_SIZE:
+                self._fallback_misses.clear()
+            self._fallback_misses[miss_key] = loop_time + FALLBACK_MISS_TTL
+        return dom_selector
+
+    def _click_locator(self, selector: str):
+        """Locator matching the (cached) selector or any of its static LinkedInLocators alternatives."""
+        locator = self._get_locator(selector)
+        for alternative in LinkedInLocators.fallback_for(selector):
+            locator = locator.or_(self._get_locator(alternative))
+        return locator.first
 
     async def extract_text(self, selector: str) -> str:
-        """Extract text from an element."""
+        """
+        Extract text from an element.
+        Reads through the cached Locator: it waits for and reads the element in one call,
+        creates no ElementHandle (and leaves nothing for GC to dispose), and unlike a
+        cached handle can't go stale across navigations. A failed read drops the
+        remembered resolution for selector so the next call looks it up again.
+        """
         await self._check_if_paused()
-        try:
-            await self._human_delay()
+        if self.logs_manager.is_enabled("DEBUG"):
             await self.logs_manager.debug(f"[GeneralAgent] Attempting to extract text from: {selector}")
-            element = await self.dom_service.wait_for_selector(selector, timeout=self.default_timeout)
-            if not element:
-                error_msg = f"[GeneralAgent] No element found for {selector}"
-                await self.logs_manager.error(error_msg)
-                raise Exception(error_msg)
-            text = await element.text_content()
-            await asyncio.sleep(TimingConstants.ACTION_DELAY)
-            await self.logs_manager.debug(f"[GeneralAgent] Successfully extracted text from: {selector}")
-            return text or ""
+        try:
+            text = await self._delayed_read(self._get_locator(selector).first.text_content, timeout=self.default_timeout)
+        except PlaywrightTimeoutError:
+            self._forget_selector(selector)
+            error_msg = f"[GeneralAgent] No element found for {selector}"
+            await self.logs_manager.error(error_msg)
+            raise Exception(error_msg)
         except Exception as e:
+            self._forget_selector(selector)
             error_msg = f"[GeneralAgent] Failed to extract text from '{selector}': {e}"
             await self.logs_manager.error(error_msg)
             raise Exception(error_msg)
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug(f"[GeneralAgent] Successfully extracted text from: {selector}")
+        return text or ""
 
     async def wait_for_text(self, selector: str, expected_text: str, timeout: Optional[float] = None) -> bool:
-        """Wait until expected_text is found within element text."""
+        """
+        Wait until expected_text is found within element text.
+        A single Playwright locator wait, checked in the page as the DOM changes;
+        the match is case-sensitive, like a plain substring check.
+        This waits on the same thing expect(...).to_contain_text does, but it passes
+        when any element matching selector contains the text; expect would fail a
+        multi-element locator given one string, and it raises AssertionError rather
+        than a Playwright timeout.
+        """
         await self._check_if_paused()
-        use_timeout = min(timeout if timeout is not None else self.default_timeout, TimingConstants.MAX_WAIT_TIME)
+        use_timeout = self._wait_timeout(timeout)
         
-        await self.logs_manager.debug(f"[GeneralAgent] Waiting for text '{expected_text}' in selector: {selector}")
-        end_time = self._current_time_ms() + use_timeout
-        while self._current_time_ms() < end_time:
-            try:
-                current_text = await self.extract_text(selector)
-                if expected_text in current_text:
-                    await self.logs_manager.debug(f"[GeneralAgent] Found expected text: '{expected_text}'")
-                    return True
-            except:
-                pass
-            await asyncio.sleep(0.5)
-        
-        error_msg = f"[GeneralAgent] Timed out waiting for text '{expected_text}' in '{selector}'"
-        await self.logs_manager.error(error_msg)
-        raise Exception(error_msg)
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug(f"[GeneralAgent] Waiting for text '{expected_text}' in selector: {selector}")
+        match = self._get_locator(selector).filter(has_text=re.compile(re.escape(expected_text)))
+        try:
+            await self._dom_call(match.first.wait_for, state="attached", timeout=use_timeout)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Found expected text: '{expected_text}'")
+            return True
+        except PlaywrightTimeoutError:
+            error_msg = f"[GeneralAgent] Timed out waiting for text '{expected_text}' in '{selector}'"
+            await self.logs_manager.error(error_msg)
+            raise Exception(error_msg)
 
     async def type_text(self, selector: str, text: str, clear_first: bool = True) -> bool:
         """Type text into an input or textarea field."""
         await self._check_if_paused()
         try:
             await self._human_delay()
-            await self.logs_manager.debug(f"[GeneralAgent] Typing text into: {selector}")
-            await self.dom_service.type_text(selector, text, clear_first=clear_first)
-            await self.logs_manager.debug(f"[GeneralAgent] Successfully typed text into: {selector}")
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Typing text into: {selector}")
+            field = self._get_locator(selector).first
+            if clear_first:
+                await self._dom_call(field.fill, "", timeout=self.default_timeout)
+            await self._dom_call(field.press_sequentially, text, timeout=self.default_timeout)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Successfully typed text into: {selector}")
             return True
         except Exception as e:
             error_msg = f"[GeneralAgent] Failed to type text into '{selector}': {e}"
             await self.logs_manager.error(error_msg)
             raise Exception(error_msg)
 
-    async def scroll_to_bottom(self, step: int = 200, pause: float = TimingConstants.INFINITE_SCROLL_DELAY):
+    async def scroll_to_bottom(self, step: int = 200, pause: float = TimingConstants.INFINITE_SCROLL_DELAY / 1000,
+                               max_steps: int = SCROLL_MAX_STEPS, timeout: float = SCROLL_TIMEOUT_MS,
+                               container: Optional[str] = None) -> bool:
         """
         Scroll to the bottom of the page in increments (simulating human scroll).
+        The whole loop runs inside the page as one evaluate call; it finishes once the
+        bottom is reached and the page stops growing for one pause, or once max_steps
+        or timeout runs out (infinite feeds).
         
         Args:
             step (int): How many pixels to scroll each step.
             pause (float): Delay in seconds between each scroll step.
+            max_steps (int): Stop after this many steps.
+            timeout (float): Stop after this many ms.
+            container (str, optional): Selector of an inner scroll pane to scroll instead of the page.
+
+        Returns:
+            bool: True if the bottom was reached.
         """
         await self._check_if_paused()
         await self._human_delay()
-        await self.logs_manager.debug(f"[GeneralAgent] Starting incremental scroll to bottom (step={step}px)")
-        await self.dom_service.scroll_to_bottom(step=step, pause=pause)
-        await self.logs_manager.debug("[GeneralAgent] Completed scrolling to bottom")
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug(f"[GeneralAgent] Starting incremental scroll to bottom (step={step}px)")
+        reached = await self._scroll_in_page(step, pause, max_steps, timeout, container)
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug(
+                "[GeneralAgent] Completed scrolling to bottom" if reached
+                else "[GeneralAgent] Stopped scrolling before the bottom (step/time limit)"
+            )
+        return reached
+
+    async def _scroll_in_page(self, step: int, pause: float, max_steps: int = SCROLL_MAX_STEPS,
+                              timeout: float = SCROLL_TIMEOUT_MS, container: Optional[str] = None) -> bool:
+        """Run the bounded in-page scroll loop through the DOM slots like any other page call."""
+        await self._ensure_helpers()
+        return await self._dom_call(
+            self.page.evaluate, SCROLL_TO_BOTTOM_CALL_JS, [step, int(pause * 1000), max_steps, int(timeout), container]
+        )
 
     async def scroll_to_element(self, selector: str):
         """
@@ -257,53 +725,104 @@ class GeneralAgent:
         """
         await self._human_delay()
         try:
-            await self.logs_manager.debug(f"[GeneralAgent] Scrolling to element: {selector}")
-            await self.dom_service.scroll_to_element(selector)
-            await self.logs_manager.debug(f"[GeneralAgent] Successfully scrolled to element: {selector}")
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Scrolling to element: {selector}")
+            await self._dom_call(self._get_locator(selector).first.scroll_into_view_if_needed, timeout=self.default_timeout)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Successfully scrolled to element: {selector}")
         except Exception as e:
             error_msg = f"[GeneralAgent] Could not scroll to element '{selector}': {e}"
             await self.logs_manager.error(error_msg)
             raise Exception(error_msg)
 
-    async def take_screenshot(self, path: str):
+    async def take_screenshot(self, path: str) -> str:
         """
-        Take a full-page screenshot and save to the given path.
+        Take a full-page screenshot and save it to path.
+        A ".jpg"/".jpeg" path captures a smaller JPEG, anything else PNG
+        (see DomService.take_screenshot).
         """
         await self._human_delay()
         try:
-            await self.logs_manager.debug(f"[GeneralAgent] Taking screenshot: {path}")
-            await self.dom_service.take_screenshot(path=path, full_page=True)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Taking screenshot: {path}")
+            path = await self._dom_call(self.dom_service.take_screenshot, path=path, full_page=True)
             await self.logs_manager.info(f"[GeneralAgent] Screenshot saved to: {path}")
+            return path
         except Exception as e:
             error_msg = f"[GeneralAgent] Failed to take screenshot: {e}"
             await self.logs_manager.error(error_msg)
             raise Exception(error_msg)
 
+    async def scroll_and_capture(self, path: str, step: int = 200, pause: float = TimingConstants.INFINITE_SCROLL_DELAY / 1000) -> str:
+        """
+        Scroll to the bottom and take a full-page screenshot concurrently, with a
+        single human-like delay. The screenshot reflects the page as loaded when it
+        is taken, so content lazy-loaded later in the scroll may be missing.
+        
+        Args:
+            path (str): Where to save the screenshot (".jpg"/".jpeg" for JPEG, else PNG).
+            step (int): How many pixels to scroll each step.
+            pause (float): Delay in seconds between each scroll step.
+
+        Returns:
+            str: The path the screenshot was written to.
+        """
+        await self._check_if_paused()
+        await self._human_delay()
+        try:
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Scrolling to bottom while capturing: {path}")
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._scroll_in_page(step, pause))
+                capture = tg.create_task(self._dom_call(self.dom_service.take_screenshot, path=path, full_page=True))
+            path = capture.result()
+            await self.logs_manager.info(f"[GeneralAgent] Screenshot saved to: {path}")
+            return path
+        except Exception as e:
+            error_msg = f"[GeneralAgent] Scroll and capture failed: {e}"
+            await self.logs_manager.error(error_msg)
+            raise Exception(error_msg)
+
     async def check_element_present(self, selector: str, timeout: Optional[float] = None) -> bool:
         """
         Check if an element is present (without throwing an exception).
+        Timeouts up to PRESENCE_FAST_PATH_MAX_WAIT ms skip Playwright's polling and
+        query the current DOM once; that path checks attachment, not visibility.
         
         Returns:
             True if element is found within the given timeout, else False.
         """
-        use_timeout = timeout if timeout is not None else self.default_timeout
-        await self.logs_manager.debug(f"[GeneralAgent] Checking for element presence: {selector}")
-        result = await self.dom_service.check_element_present(selector, timeout=use_timeout)
-        if result:
-            await self.logs_manager.debug(f"[GeneralAgent] Element found: {selector}")
-        else:
-            await self.logs_manager.debug(f"[GeneralAgent] Element not found: {selector}")
+        use_timeout = self._wait_timeout(timeout)
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug(f"[GeneralAgent] Checking for element presence: {selector}")
+        result = None
+        if use_timeout <= PRESENCE_FAST_PATH_MAX_WAIT:
+            await self._ensure_helpers()
+            result = await self._dom_call(self.page.evaluate, PRESENT_CALL_JS, self._resolve(selector))
+        if result is None:
+            try:
+                await self._dom_call(self._get_locator(selector).first.wait_for, state="visible", timeout=use_timeout)
+                result = True
+            except PlaywrightTimeoutError:
+                result = False
+        if self.logs_manager.is_enabled("DEBUG"):
+            found = "found" if result else "not found"
+            await self.logs_manager.debug(f"[GeneralAgent] Element {found}: {selector}")
         return result
 
-    async def evaluate_script(self, script: str) -> Any:
+    async def evaluate_script(self, script: str, humanize: bool = True) -> Any:
         """
         Evaluate arbitrary JavaScript in the page context.
+        Pass humanize=False for internal tooling scripts that mimic no user action.
         """
-        await self._human_delay()
-        await self.logs_manager.debug("[GeneralAgent] Evaluating JavaScript")
+        if humanize:
+            await self._human_delay()
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug("[GeneralAgent] Evaluating JavaScript")
         try:
-            result = await self.dom_service.evaluate_script(script)
-            await self.logs_manager.debug("[GeneralAgent] JavaScript evaluation completed")
+            result = await self._dom_call(self.dom_service.evaluate_script, script)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug("[GeneralAgent] JavaScript evaluation completed")
             return result
         except Exception as e:
             error_msg = f"[GeneralAgent] JavaScript evaluation failed: {e}"
@@ -313,12 +832,15 @@ class GeneralAgent:
     async def extract_links(self, selector: str = "a") -> List[str]:
         """
         Extract all 'href' attributes from elements matching selector.
+        All matches are read by one _batch_attr call, so the cost is a single
+        round-trip however many links there are (no per-element get_attribute calls).
         """
-        await self._human_delay()
         try:
-            await self.logs_manager.debug(f"[GeneralAgent] Extracting links with selector: {selector}")
-            links = await self.dom_service.extract_links(selector)
-            await self.logs_manager.debug(f"[GeneralAgent] Successfully extracted {len(links)} links")
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Extracting links with selector: {selector}")
+            links = await self._batch_attr(selector, "href")
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Successfully extracted {len(links)} links")
             return links
         except Exception as e:
             error_msg = f"[GeneralAgent] Failed to extract links with selector '{selector}': {e}"
@@ -329,14 +851,22 @@ class GeneralAgent:
         """
         Switch 'self.page' context to the content_frame of an iframe.
         Example usage: await self.switch_to_iframe("iframe#captcha-frame")
+        Switching to the iframe we're already in (and that is still attached) is a no-op.
         """
+        if iframe_selector == self._current_frame_sel and not self.page.is_detached():
+            return
         await self._human_delay()
         try:
-            await self.logs_manager.debug(f"[GeneralAgent] Switching to iframe: {iframe_selector}")
-            await self.dom_service.switch_to_iframe(iframe_selector)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Switching to iframe: {iframe_selector}")
+            await self._dom_call(self.dom_service.switch_to_iframe, iframe_selector)
             # Update our page reference to match dom_service
             self.page = self.dom_service.page
-            await self.logs_manager.debug("[GeneralAgent] Successfully switched to iframe")
+            self._current_frame_sel = iframe_selector
+            self.invalidate_selector_cache()
+            self._locator_cache.clear()
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug("[GeneralAgent] Successfully switched to iframe")
         except Exception as e:
             error_msg = f"[GeneralAgent] Failed to switch to iframe '{iframe_selector}': {e}"
             await self.logs_manager.error(error_msg)
@@ -346,53 +876,134 @@ class GeneralAgent:
         """
         Switch back to the original root page context.
         Uses stored reference to avoid frame navigation issues.
+        No-op when already on the main frame. Not humanized: it only swaps
+        references and sends nothing to the page.
         """
-        await self._human_delay()
-        await self.logs_manager.debug("[GeneralAgent] Switching back to main frame")
+        if self._current_frame_sel is None and self.page is self.root_page:
+            return
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug("[GeneralAgent] Switching back to main frame")
         self.dom_service.switch_back_to_main_frame(self.root_page)
         self.page = self.root_page
-        await self.logs_manager.debug("[GeneralAgent] Successfully switched to main frame")
+        self._current_frame_sel = None
+        self.invalidate_selector_cache()
+        self._locator_cache.clear()
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug("[GeneralAgent] Successfully switched to main frame")
 
-    async def drag_and_drop(self, source_selector: str, target_selector: str):
+    async def drag_and_drop(self, source_selector: str, target_selector: str, use_dispatch: bool = True):
         """
         Drag from source_selector to target_selector.
+        By default the drag is dispatched as synthetic HTML5 events in one
+        page.evaluate; pass use_dispatch=False to force real mouse events.
+        The only human-like pause is the mouse hold (DRAG_HOLD_MIN..MAX ms),
+        which the dispatched path doesn't need.
         """
-        await self._human_delay()
+        await self._check_if_paused()
+        hold_delay = self._rng.uniform(TimingConstants.DRAG_HOLD_MIN, TimingConstants.DRAG_HOLD_MAX) / 1000 if self.humanize else 0
         try:
-            await self.logs_manager.debug(f"[GeneralAgent] Starting drag and drop from '{source_selector}' to '{target_selector}'")
-            await self.dom_service.drag_and_drop(source_selector, target_selector, hold_delay=0.5)
-            await self.logs_manager.debug("[GeneralAgent] Successfully completed drag and drop")
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug(f"[GeneralAgent] Starting drag and drop from '{source_selector}' to '{target_selector}'")
+            await self._dom_call(self.dom_service.drag_and_drop, source_selector, target_selector, hold_delay=hold_delay, use_dispatch=use_dispatch)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug("[GeneralAgent] Successfully completed drag and drop")
         except Exception as e:
             error_msg = f"[GeneralAgent] Drag-and-drop from '{source_selector}' to '{target_selector}' failed: {e}"
             await self.logs_manager.error(error_msg)
             raise Exception(error_msg)
 
-    async def accept_cookies(self, accept_button_selector: str) -> bool:
+    async def accept_cookies(self, accept_button_selector: str, timeout: float = 3000) -> bool:
         """
         Click the 'Accept Cookies' button if present.
+        A single locator click: Playwright waits up to timeout ms for the button and clicks
+        it, so there is no separate presence check.
         Returns True if clicked, False if not found or failed.
         """
         await self._human_delay()
-        await self.logs_manager.debug(f"[GeneralAgent] Looking for cookies accept button: {accept_button_selector}")
-        found = await self.dom_service.check_element_present(accept_button_selector, timeout=3000)
-        if found:
-            try:
-                await self.click_element(accept_button_selector)
-                await self.logs_manager.info("[GeneralAgent] Cookies accepted.")
-                return True
-            except Exception as e:
-                await self.logs_manager.warning(f"[GeneralAgent] Failed to click accept cookies button: {e}")
-                return False
-        else:
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug(f"[GeneralAgent] Looking for cookies accept button: {accept_button_selector}")
+        try:
+            await self._dom_call(self._get_locator(accept_button_selector).first.click, timeout=timeout)
+        except PlaywrightTimeoutError:
             await self.logs_manager.info("[GeneralAgent] No cookies accept button found.")
             return False
+        except Exception as e:
+            await self.logs_manager.warning(f"[GeneralAgent] Failed to click accept cookies button: {e}")
+            return False
+        await self.logs_manager.info("[GeneralAgent] Cookies accepted.")
+        return True
+
+    async def wait_for_selector_state(self, selector: str, state: str = "visible", timeout: Optional[float] = None) -> bool:
+        """
+        Wait until selector reaches state ('attached', 'detached', 'visible', 'hidden').
+        Use this instead of wait_for_condition when the condition is about one element;
+        Playwright waits in the page instead of polling from Python.
+        
+        Raises:
+            Exception if the state is not reached within timeout
+        """
+        await self._check_if_paused()
+        use_timeout = self._wait_timeout(timeout)
+        
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug(f"[GeneralAgent] Waiting for '{selector}' to be {state}")
+        try:
+            await self._dom_call(self._get_locator(selector).first.wait_for, state=state, timeout=use_timeout)
+            return True
+        except PlaywrightTimeoutError:
+            error_msg = f"[GeneralAgent] Timed out waiting for '{selector}' to be {state}"
+            await self.logs_manager.error(error_msg)
+            raise Exception(error_msg)
+
+    async def wait_for_js_condition(
+        self,
+        expression: str,
+        timeout: Optional[float] = None,
+        arg: Any = None,
+        polling: Any = "raf"
+    ) -> bool:
+        """
+        Wait for a JavaScript predicate to become truthy in the page.
+        Preferred over wait_for_condition for anything that only inspects page state:
+        Playwright re-evaluates it inside the renderer, with no Python-side polling.
+        
+        Args:
+            expression: JavaScript expression or function, e.g. "() => !document.querySelector('.spinner')"
+            timeout: Optional custom timeout in ms
+            arg: Optional argument passed to the predicate (keeps selectors/text out of the source)
+            polling: "raf" (every animation frame, the default) or an interval in ms for
+                     cheaper checks on slow-changing state. Playwright has no mutation-based
+                     polling; element/text waits should use wait_for_text or
+                     wait_for_selector_state instead.
+            
+        Raises:
+            Exception if the predicate is not truthy within timeout
+        """
+        await self._check_if_paused()
+        use_timeout = self._wait_timeout(timeout)
+        
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug("[GeneralAgent] Starting to wait for JS condition")
+        try:
+            await self._dom_call(self.page.wait_for_function, expression, arg=arg, timeout=use_timeout, polling=polling)
+            if self.logs_manager.is_enabled("DEBUG"):
+                await self.logs_manager.debug("[GeneralAgent] Condition met successfully")
+            return True
+        except PlaywrightTimeoutError:
+            error_msg = "[GeneralAgent] Timed out waiting for condition"
+            await self.logs_manager.error(error_msg)
+            raise Exception(error_msg)
 
     async def wait_for_condition(self, condition_fn, timeout: Optional[float] = None, poll_interval: float = 0.5) -> bool:
         """
         Wait for a custom condition function to return True.
+        This is the slow path: the function is polled from Python every poll_interval.
+        Use wait_for_js_condition or wait_for_selector_state when the condition only
+        depends on page state.
         
         Args:
-            condition_fn: Async function that returns bool
+            condition_fn: Async function that returns bool (a JavaScript expression string
+                          is passed on to wait_for_js_condition)
             timeout: Optional custom timeout in ms
             poll_interval: How often to check the condition in seconds
             
@@ -402,15 +1013,21 @@ class GeneralAgent:
         Raises:
             Exception if condition not met within timeout
         """
+        if isinstance(condition_fn, str):
+            return await self.wait_for_js_condition(condition_fn, timeout=timeout)
+        
         await self._check_if_paused()
-        use_timeout = min(timeout if timeout is not None else self.default_timeout, TimingConstants.MAX_WAIT_TIME)
+        use_timeout = self._wait_timeout(timeout)
         
-        await self.logs_manager.debug("[GeneralAgent] Starting to wait for condition")
-        end_time = self._current_time_ms() + use_timeout
-        while self._current_time_ms() < end_time:
+        if self.logs_manager.is_enabled("DEBUG"):
+            await self.logs_manager.debug("[GeneralAgent] Starting to wait for condition")
+        now = asyncio.get_running_loop().time  # monotonic; bound once for the loop
+        deadline = now() + use_timeout / 1000
+        while now() < deadline:
             try:
                 if await condition_fn():
-                    await self.logs_manager.debug("[GeneralAgent] Condition met successfully")
+                    if self.logs_manager.is_enabled("DEBUG"):
+                        await self.logs_manager.debug("[GeneralAgent] Condition met successfully")
                     return True
             except Exception as e:
                 await self.logs_manager.warning(f"[GeneralAgent] Error checking condition: {e}")
@@ -420,3 +1037,26 @@ class GeneralAgent:
         await self.logs_manager.error(error_msg)
         raise Exception(error_msg)
 
+    async def batch(self, *ops: Callable[[], Awaitable[Any]]) -> List[Any]:
+        """
+        Run independent, side-effect-free operations concurrently.
+        Playwright pipelines the resulting CDP messages, so N reads cost about one
+        round-trip instead of N. Do not batch actions that change the page.
+
+        Example:
+            text, present, links = await agent.batch(
+                lambda: agent.extract_text("h1"),
+                lambda: agent.check_element_present("#apply"),
+                lambda: agent.extract_links("a.job-card"),
+            )
+
+        Returns:
+            Results in the order the operations were given. The first failure is
+            raised once all operations have finished.
+        """
+        await self._check_if_paused()
+        results = await asyncio.gather(*(op() for op in ops), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
@@ -162,6 +162,89 @@ from constants import TimingConstants, Selectors, Messages
 from time import perf_counter
 from storage.logs_manager import LogsManager
 
+# Title/company/location of every card matching the selector, in document order,
+# read in one round-trip instead of three text lookups per card.
+FEED_CARD_FIELDS_JS = """cards => cards.map(card => {
+    const text = sel => (card.querySelector(sel)?.textContent || "").trim();
+    return {
+        title: text("h3"),
+        company: text(".job-card-container__company-name"),
+        location: text(".job-card-container__metadata-item")
+    };
+})"""
+
+# Scroll the feed to the bottom and return the page height it scrolled to.
+SCROLL_FEED_TO_BOTTOM_JS = """() => {
+    const height = document.body.scrollHeight;
+    window.scrollTo(0, height);
+    return height;
+}"""
+
+# Index of the first selector that matches an element (-1 if none), so a list of
+# fallback selectors costs one round-trip instead of one query_selector each.
+FIRST_MATCH_JS = """sels => sels.findIndex(sel => {
+    try { return !!document.querySelector(sel); } catch (e) { return false; }
+})"""
+
+# Selectors read by _extract_job_details (might vary if LinkedIn changes the DOM).
+JOB_DETAIL_SELECTORS = {
+    "job_title": ".jobs-details-top-card__job-title",
+    "company": ".jobs-details-top-card__company-url",
+    "location": ".jobs-details-top-card__bullet",
+    "easy_apply": "button.jobs-apply-button",  # sometimes there's text "Easy Apply" on the button
+    "recruiter": ".jobs-poster__name",  # might be a link to the recruiter
+}
+
+# Everything _extract_job_details needs from the detail pane, in one evaluate call.
+JOB_DETAILS_JS = """sel => {
+    const text = s => (document.querySelector(s)?.textContent || "").trim();
+    const recruiter = document.querySelector(sel.recruiter);
+    return {
+        job_title: text(sel.job_title),
+        company: text(sel.company),
+        location: text(sel.location),
+        is_easy_apply: !!document.querySelector(sel.easy_apply),
+        recruiter_name: recruiter ? (recruiter.textContent || "").trim() : "",
+        recruiter_link: recruiter ? recruiter.getAttribute("href") : null
+    };
+}"""
+
+# Any of these means the job detail pane has rendered.
+JOB_DETAIL_PANE_SELECTORS = [
+    ".jobs-search__right-rail",
+    ".jobs-details",
+    "[data-job-detail-container]"
+]
+
+# How long (ms) to wait for a jobs-tab click to commit a /jobs/ URL before falling
+# back to direct navigation. A working click commits well within this.
+JOBS_TAB_NAV_TIMEOUT = 1500
+
+# Columns of the applied-jobs CSV written by _save_job_record.
+APPLIED_JOBS_FIELDNAMES = [
+    "job_title", "company", "location",
+    "is_easy_apply", "recruiter_name", "recruiter_link",
+    "application_status"
+]
+
+# Cheap liveness probe for _check_session_health.
+DOCUMENT_READY_STATE_JS = "() => document.readyState"
+
+# True when a collapsed-search indicator is visible or the viewport is below the
+# mobile breakpoint; one round-trip instead of a query/is_visible pair per indicator.
+NARROW_LAYOUT_JS = """([selectors, breakpoint]) => selectors.some(sel => {
+    const el = document.querySelector(sel);
+    return !!el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+}) || window.innerWidth < breakpoint"""
+
+# Search-box elements that only show up in the narrow/collapsed layout.
+NARROW_LAYOUT_INDICATORS = [
+    "button[aria-label='Search']",  # Magnifier icon
+    ".jobs-search-box--collapsed",
+    ".jobs-search-box__container--responsive"
+]
+NARROW_LAYOUT_BREAKPOINT = 768  # Common breakpoint for mobile layouts (px)
+
 # We'll also import your GeneralAgent or FormFillerAgent if needed:
 # from agents.general_agent import GeneralAgent
 # from agents.form_filler_agent import FormFillerAgent
@@ -172,8 +255,8 @@ class LinkedInAgent:
         page: Page,
         controller,
         default_timeout: float = TimingConstants.DEFAULT_TIMEOUT,
-        min_delay: float = TimingConstants.HUMAN_DELAY_MIN,
-        max_delay: float = TimingConstants.HUMAN_DELAY_MAX,
+        min_delay: float = TimingConstants.HUMAN_DELAY_MIN / 1000,
+        max_delay: float = TimingConstants.HUMAN_DELAY_MAX / 1000,
         logs_manager: Optional[LogsManager] = None
     ):
         """
@@ -181,8 +264,8 @@ class LinkedInAgent:
             page (Page): A Playwright Page object where the user is already logged in.
             controller: A controller object.
             default_timeout (float): Default wait in ms for elements.
-            min_delay (float): Minimum random delay for human-like interactions.
-            max_delay (float): Maximum random delay for human-like interactions.
+            min_delay (float): Minimum random delay for human-like interactions, in seconds.
+            max_delay (float): Maximum random delay for human-like interactions, in seconds.
             logs_manager (LogsManager, optional): Instance of LogsManager for async logging.
         """
         self.page = page
@@ -191,34 +274,40 @@ class LinkedInAgent:
         self.default_timeout = min(default_timeout, TimingConstants.MAX_WAIT_TIME)
         self.min_delay = min_delay
         self.max_delay = max_delay
-        self.is_paused = False
+        self._uniform = random.Random().uniform  # per-agent generator for human-like delays and retry jitter
+        self._resume_event = asyncio.Event()  # Set while running, cleared by pause()
+        self._resume_event.set()
 
-        # A CSV to log applied jobs
+        # A CSV to log applied jobs; opened on the first record and kept open until close()
         self.applied_jobs_csv = "jobs_applied.csv"
+        self._csv_fp = None
+        self._csv_writer = None
+
+    @property
+    def is_paused(self) -> bool:
+        return not self._resume_event.is_set()
 
     async def pause(self):
         """Pause the agent's operations."""
         await self._log_state_change("running", "paused", "User requested pause")
         await self._log_info(Messages.PAUSE_MESSAGE)
-        self.is_paused = True
+        self._resume_event.clear()
 
     async def resume(self):
         """Resume the agent's operations."""
         await self._log_state_change("paused", "running", "User requested resume")
         await self._log_info(Messages.RESUME_MESSAGE)
-        self.is_paused = False
+        self._resume_event.set()
 
     async def _check_if_paused(self):
-        """Check pause state with proper async handling."""
-        while self.is_paused:
-            try:
-                await asyncio.sleep(TimingConstants.POLL_INTERVAL)
-                # Check for cancellation during pause
-                if asyncio.current_task().cancelled():
-                    raise asyncio.CancelledError()
-            except asyncio.CancelledError:
-                await self._log_state_change("paused", "cancelled", "Operation cancelled while paused")
-                raise
+        """Block while paused, waking as soon as resume() sets the event."""
+        if self._resume_event.is_set():
+            return
+        try:
+            await self._resume_event.wait()
+        except asyncio.CancelledError:
+            await self._log_state_change("paused", "cancelled", "Operation cancelled while paused")
+            raise
 
     async def _verify_url_is_jobs(self) -> bool:
         """Verify current URL is a LinkedIn jobs page."""
@@ -298,18 +387,14 @@ class LinkedInAgent:
                     "a[href*='/jobs']"
                 ]
                 
-                # Get the jobs tab element
+                # Probe every selector in one round-trip and keep the first that matches
                 jobs_tab = None
                 successful_selector = None
                 
-                for selector in jobs_tab_selectors:
-                    try:
-                        jobs_tab = await self.page.query_selector(selector)
-                        if jobs_tab:
-                            successful_selector = selector
-                            break
-                    except Exception:
-                        continue
+                match_index = await self.page.evaluate(FIRST_MATCH_JS, jobs_tab_selectors)
+                if match_index >= 0:
+                    successful_selector = jobs_tab_selectors[match_index]
+                    jobs_tab = self.page.locator(successful_selector).first
                 
                 await self._log_selector_strategy(
                     element_type="jobs_tab",
@@ -336,9 +421,10 @@ class LinkedInAgent:
                     # Now attempt the click
                     await jobs_tab.click()
                     
-                    # Wait for URL to change and verify
+                    # Wait only for the URL to commit, and not long: a click that
+                    # hasn't navigated by then falls through to direct navigation
                     try:
-                        await self.page.wait_for_url("**/jobs/**", timeout=5000)
+                        await self.page.wait_for_url("**/jobs/**", wait_until="commit", timeout=JOBS_TAB_NAV_TIMEOUT)
                         if await self._verify_url_is_jobs():
                             await self._log_navigation(
                                 from_url=current_url,
@@ -436,21 +522,14 @@ class LinkedInAgent:
                             await card_element.click()
                             await self._human_delay(1, 2)
                             
-                            # Wait for job details to load
-                            detail_selectors = [
-                                ".jobs-search__right-rail",
-                                ".jobs-details",
-                                "[data-job-detail-container]"
-                            ]
-                            
+                            # Wait for job details to load: one wait on the selector list
+                            # rather than up to 5s per selector in turn
                             details_loaded = False
-                            for selector in detail_selectors:
-                                try:
-                                    await self.page.wait_for_selector(selector, timeout=5000)
-                                    details_loaded = True
-                                    break
-                                except:
-                                    continue
+                            try:
+                                await self.page.wait_for_selector(", ".join(JOB_DETAIL_PANE_SELECTORS), timeout=5000)
+                                details_loaded = True
+                            except Exception:
+                                pass
                             
                             if details_loaded:
                                 full_job_data = await self._extract_job_details()
@@ -467,9 +546,15 @@ class LinkedInAgent:
                     # Check if we need to load more jobs
                     if job_card_count < max_jobs:
                         try:
-                            # Scroll to bottom to trigger more jobs loading
-                            await self.page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                            await self._human_delay(2, 3)
+                            # Scroll to bottom to trigger more jobs loading; the height read
+                            # in the same call is the baseline for detecting new content.
+                            height = await self.page.evaluate(SCROLL_FEED_TO_BOTTOM_JS)
+                            await self.page.wait_for_function(
+                                "h => document.body.scrollHeight > h", arg=height, timeout=3000
+                            )
+                        except PlaywrightTimeoutError:
+                            await self._log_info("No more jobs loaded after scrolling")
+                            break
                         except Exception as e:
                             await self._log_info(f"Error scrolling for more jobs: {e}")
                             break
@@ -490,37 +575,10 @@ class LinkedInAgent:
         """
         Extract relevant job info from the currently selected job detail pane.
         e.g., job title, company, location, recruiter link if visible, easy apply check.
+        All fields are read in one evaluate call (JOB_DETAILS_JS); missing elements
+        give empty strings, like _safe_get_text.
         """
-        # Example selectors, might vary if LinkedIn changes the DOM
-        job_title_sel = '.jobs-details-top-card__job-title'
-        company_sel = '.jobs-details-top-card__company-url'
-        location_sel = '.jobs-details-top-card__bullet'
-        easy_apply_sel = 'button.jobs-apply-button'  # sometimes there's text "Easy Apply" on the button
-        recruiter_sel = '.jobs-poster__name'  # might be a link to the recruiter
-
-        job_title = await self._safe_get_text(job_title_sel)
-        company_name = await self._safe_get_text(company_sel)
-        location = await self._safe_get_text(location_sel)
-
-        # Check if the "Easy Apply" button exists
-        easy_apply_button = await self.page.query_selector(easy_apply_sel)
-
-        # Attempt to find recruiter name or link
-        recruiter_name = await self._safe_get_text(recruiter_sel)
-        # If there's a link, you might do:
-        recruiter_link = None
-        rec_elem = await self.page.query_selector(recruiter_sel)
-        if rec_elem:
-            recruiter_link = await rec_elem.get_attribute("href")  # or something if it's clickable
-
-        return {
-            "job_title": job_title,
-            "company": company_name,
-            "location": location,
-            "is_easy_apply": True if easy_apply_button else False,
-            "recruiter_name": recruiter_name,
-            "recruiter_link": recruiter_link
-        }
+        return await self.page.evaluate(JOB_DETAILS_JS, JOB_DETAIL_SELECTORS)
 
     async def _apply_to_job(self, job_data: dict) -> str:
         """
@@ -693,23 +751,29 @@ class LinkedInAgent:
     async def _save_job_record(self, job_data: dict):
         """
         Append job data to a CSV file for record-keeping.
+        The file is opened once and kept open (see close()); each row is flushed
+        so records survive a crash.
         """
-        csv_file = Path(self.applied_jobs_csv)
-        file_exists = csv_file.exists()
-        fieldnames = [
-            "job_title", "company", "location", 
-            "is_easy_apply", "recruiter_name", "recruiter_link",
-            "application_status"
-        ]
         try:
-            with open(csv_file, "a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+            if self._csv_writer is None:
+                csv_file = Path(self.applied_jobs_csv)
+                file_exists = csv_file.exists()
+                self._csv_fp = open(csv_file, "a", newline="", encoding="utf-8")
+                self._csv_writer = csv.DictWriter(self._csv_fp, fieldnames=APPLIED_JOBS_FIELDNAMES)
                 if not file_exists:
-                    writer.writeheader()
-                writer.writerow(job_data)
+                    self._csv_writer.writeheader()
+            self._csv_writer.writerow(job_data)
+            self._csv_fp.flush()
         except Exception as e:
             await self._log_error("Error saving job record", error=e)
 
+    async def close(self):
+        """Close the applied-jobs CSV; the next record reopens it."""
+        if self._csv_fp is not None:
+            self._csv_fp.close()
+            self._csv_fp = None
+            self._csv_writer = None
+
     # -------------------------------------------------------------------------
     # Handling Missing Elements / Refresh
     # -------------------------------------------------------------------------
@@ -751,7 +815,7 @@ class LinkedInAgent:
             if el:
                 txt = await el.text_content()
                 return txt.strip() if txt else ""
-        except:
+        except Exception:
             pass
         return ""
 
@@ -759,13 +823,15 @@ class LinkedInAgent:
         """
         Insert a short random delay to mimic human interactions.
         Defaults to class-level min_delay/max_delay if not provided.
+        Zero bounds skip the sleep entirely.
         """
         if min_sec is None:
             min_sec = self.min_delay
         if max_sec is None:
             max_sec = self.max_delay
-        delay = random.uniform(min_sec, max_sec)
-        await asyncio.sleep(delay)
+        if max_sec <= 0:
+            return
+        await asyncio.sleep(self._uniform(min_sec, max_sec))
 
     async def handle_application_form(self, cv_path: str | Path) -> bool:
         """
@@ -918,7 +984,7 @@ class LinkedInAgent:
                                 button_clicked = True
                                 await self._log_info("Clicked search button")
                                 break
-                            except:
+                            except Exception:
                                 continue
                         
                         # If button click failed, try pressing Enter in the search fields
@@ -954,15 +1020,14 @@ class LinkedInAgent:
             raise
 
     async def _retry_operation(self, operation, max_retries: int = 3):
-        """Retry an async operation with exponential backoff."""
+        """Retry an async operation with jittered exponential backoff."""
         for attempt in range(max_retries):
             try:
                 return await operation()
             except PlaywrightTimeoutError as e:
                 if attempt == max_retries - 1:
                     raise
-                delay = TimingConstants.BASE_RETRY_DELAY * (TimingConstants.RETRY_BACKOFF_FACTOR ** attempt)
-                await asyncio.sleep(delay)
+                await asyncio.sleep(self._backoff_delay(attempt, TimingConstants.RETRY_BACKOFF_FACTOR))
 
     async def cleanup(self):
         """Cleanup resources when agent is done."""
@@ -974,10 +1039,11 @@ class LinkedInAgent:
             # Close any open dialogs
             try:
                 await self.page.keyboard.press('Escape')
-                await asyncio.sleep(TimingConstants.MODAL_TRANSITION_DELAY)
-            except:
+                await asyncio.sleep(TimingConstants.MODAL_TRANSITION_DELAY / 1000)
+            except Exception:
                 pass
             
+            await self.close()
             await self.controller.tracker_agent.log_activity(
                 activity_type='cleanup',
                 details='Agent cleanup completed',
@@ -1018,7 +1084,7 @@ class LinkedInAgent:
             )
             if close_button:
                 await close_button.click()
-                await asyncio.sleep(TimingConstants.MODAL_TRANSITION_DELAY)
+                await asyncio.sleep(TimingConstants.MODAL_TRANSITION_DELAY / 1000)
         except PlaywrightTimeoutError:
             pass
 
@@ -1029,7 +1095,7 @@ class LinkedInAgent:
             await self.check_captcha_or_logout()
             
             # Check if page is responsive
-            await self.page.evaluate('() => document.readyState')
+            await self.page.evaluate(DOCUMENT_READY_STATE_JS)
             
             # Check for error banners
             error_banner = await self.page.query_selector(Selectors.LINKEDIN_FORM_ERROR)
@@ -1157,7 +1223,7 @@ class LinkedInAgent:
                 try:
                     await self.page.wait_for_selector(selector, timeout=3000)
                     return True
-                except:
+                except Exception:
                     continue
                 
             return False
@@ -1166,17 +1232,26 @@ class LinkedInAgent:
             return False
 
     async def _retry_with_backoff(self, operation, max_retries: int = 3):
-        """Execute operation with exponential backoff."""
+        """Execute operation with jittered exponential backoff."""
         for attempt in range(max_retries):
             try:
                 return await operation()
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise
-                delay = TimingConstants.BASE_RETRY_DELAY * (2 ** attempt)
-                await self._log_info(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s...")
+                delay = self._backoff_delay(attempt)
+                await self._log_info(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f}s...")
                 await asyncio.sleep(delay)
 
+    def _backoff_delay(self, attempt: int, factor: float = 2) -> float:
+        """
+        Seconds to sleep before retry number attempt + 1: BASE_RETRY_DELAY * factor**attempt,
+        stretched by up to 50% of random jitter (from the agent's own generator) so
+        concurrent agents don't retry in lockstep, and capped at MAX_RETRY_DELAY.
+        """
+        delay_ms = TimingConstants.BASE_RETRY_DELAY * (factor ** attempt) * (1 + self._uniform(0, 0.5))
+        return min(TimingConstants.MAX_RETRY_DELAY, delay_ms) / 1000
+
     async def _ensure_jobs_search_ready(self) -> bool:
         """Ensure we're on jobs page and search is ready."""
         try:
@@ -1197,7 +1272,7 @@ class LinkedInAgent:
                 try:
                     await self.page.wait_for_selector(selector, state="visible", timeout=3000)
                     return True
-                except:
+                except Exception:
                     continue
                 
             return False
@@ -1302,24 +1377,12 @@ class LinkedInAgent:
             return False
 
     async def _is_narrow_layout(self) -> bool:
-        """Check if we're in a narrow/collapsed layout."""
+        """
+        Check if we're in a narrow/collapsed layout.
+        The indicator checks and the viewport-width fallback run in one evaluate call.
+        """
         try:
-            # Check if any of the collapsed layout indicators are present
-            narrow_indicators = [
-                "button[aria-label='Search']",  # Magnifier icon
-                ".jobs-search-box--collapsed",
-                ".jobs-search-box__container--responsive"
-            ]
-            
-            for selector in narrow_indicators:
-                element = await self.page.query_selector(selector)
-                if element and await element.is_visible():
-                    return True
-            
-            # Also check viewport width as a fallback
-            viewport_width = await self.page.evaluate('window.innerWidth')
-            return viewport_width < 768  # Common breakpoint for mobile layouts
-            
+            return await self.page.evaluate(NARROW_LAYOUT_JS, [NARROW_LAYOUT_INDICATORS, NARROW_LAYOUT_BREAKPOINT])
         except Exception as e:
             await self._log_error("Error checking layout width", error=e)
             return False
@@ -1328,6 +1391,7 @@ class LinkedInAgent:
         """Handle the single feed layout when no search is active."""
         try:
             job_cards = []
+            card_fields = []
             feed_selectors = [
                 "div[data-job-id]",
                 ".jobs-job-board-list__item",
@@ -1342,6 +1406,8 @@ class LinkedInAgent:
                     if cards:
                         await self._log_info(f"Found {len(cards)} jobs in single feed layout")
                         job_cards = cards
+                        # Basic info for all cards in one evaluate call
+                        card_fields = await self.page.eval_on_selector_all(selector, FEED_CARD_FIELDS_JS)
                         break
                 except Exception:
                     continue
@@ -1349,25 +1415,12 @@ class LinkedInAgent:
             if not job_cards:
                 return []
             
-            jobs_data = []
-            for card in job_cards:
-                try:
-                    # Extract basic info from card
-                    title = await self._safe_get_text("h3", card)
-                    company = await self._safe_get_text(".job-card-container__company-name", card)
-                    location = await self._safe_get_text(".job-card-container__metadata-item", card)
-                    
-                    jobs_data.append({
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "card_element": card
-                    })
-                except Exception as e:
-                    await self._log_error("Error extracting card data", error=e)
-                    continue
-                
-            return jobs_data
+            # Handles and fields are both in document order; zip stops at the shorter
+            # list if the feed changed between the two calls.
+            return [
+                {**fields, "card_element": card}
+                for card, fields in zip(job_cards, card_fields)
+            ]
             
         except Exception as e:
             await self._log_error("Error handling single feed layout", error=e)
@@ -67,6 +67,7 @@ class TimingConstants:
     # -------------------------------------
     MAX_RETRIES = 2              # Number of retry attempts
     RETRY_BACKOFF_FACTOR = 1.2   # Multiply delay by this factor each retry
+    MAX_RETRY_DELAY = 5000       # 5000ms (5s) - cap on a single backoff sleep
 
     # -------------------------------------
     # Task Manager specific - Faster task management
@@ -142,6 +143,16 @@ class Selectors:
     LINKEDIN_FORM_SUCCESS = '.artdeco-inline-feedback--success'
     LINKEDIN_MODAL_CLOSE = 'button[aria-label="Dismiss"]'
 
+    # Easy Apply modal selectors
+    EASY_APPLY_SUBMIT_BUTTON = 'button[aria-label="Submit application"]'
+    EASY_APPLY_REVIEW_BUTTON = 'button[aria-label="Review your application"]'
+    EASY_APPLY_CV_UPLOAD = 'input[type="file"][name="fileId"]'
+    EASY_APPLY_PHONE_INPUT = 'input[name="phoneNumber"]'
+    EASY_APPLY_EXPERIENCE_SELECT = 'select[id*="experience"]'
+    EASY_APPLY_REQUIRED_CHECKBOX = 'input[type="checkbox"][required]'
+    EASY_APPLY_REQUIRED_TEXTAREA = 'textarea[required]'
+    EASY_APPLY_PROGRESS = '[role="progressbar"], progress'
+
 class Messages:
     """
     Standard messages used across agents for consistent logging.
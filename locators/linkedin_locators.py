@@ -66,6 +66,19 @@ class LinkedInLocators:
         '.jobs-apply-button--submitted'  # Submit button state change
     ]
     
+    @classmethod
+    def fallback_for(cls, selector_type: str) -> list:
+        """
+        Static selectors registered for a selector type, without touching the page.
+        Returns [] for anything that isn't a known type (e.g. a raw CSS selector).
+        """
+        selectors = getattr(cls, selector_type, None) if selector_type.isidentifier() else None
+        if isinstance(selectors, str):
+            return [selectors]
+        if isinstance(selectors, list):
+            return list(selectors)
+        return []
+
     @classmethod
     async def get_fallback_patterns(cls, selector_type: str, logs_manager: Optional['LogsManager'] = None) -> list:
         """Get AI-generated fallback patterns for selector types."""
@@ -156,6 +156,13 @@ async def async_main():
                 if logs_manager:
                     await logs_manager.error(f"Error during browser cleanup: {str(e)}")
 
+        try:
+            # Agents and utilities create their own managers; stop them all.
+            await TelemetryManager.close_all()
+        except Exception as e:
+            if logs_manager:
+                await logs_manager.error(f"Error during telemetry cleanup: {str(e)}")
+
         if logs_manager:
             try:
                 await logs_manager.info("Shutting down logging system...")
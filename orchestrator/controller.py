@@ -318,7 +318,7 @@ class Controller:
             print("[DEBUG] ========================================")
             
             await self.logs_manager.info("Starting new automation session...")
-            await asyncio.sleep(TimingConstants.ACTION_DELAY)
+            await asyncio.sleep(TimingConstants.ACTION_DELAY / 1000)
             
             # Verify initial state
             print("[DEBUG] Verifying initial state:")
@@ -356,7 +356,7 @@ class Controller:
         
         while attempt < self.max_retries:
             try:
-                await asyncio.sleep(TimingConstants.ACTION_DELAY)
+                await asyncio.sleep(TimingConstants.ACTION_DELAY / 1000)
                 
                 # Use AI Master-Plan for the flow
                 plan_steps = ["check_login", "open_job_page", "fill_search", "apply"]
@@ -421,7 +421,7 @@ class Controller:
             print("[DEBUG] ========================================")
             
             await self.logs_manager.info("Ending automation session...")
-            await asyncio.sleep(TimingConstants.ACTION_DELAY)
+            await asyncio.sleep(TimingConstants.ACTION_DELAY / 1000)
             
             # Save final state if needed
             if hasattr(self, 'pause_state') and self.pause_state:
@@ -434,6 +434,10 @@ class Controller:
                 status='success',
                 agent_name='Controller'
             )
+            await self.linkedin_agent.close()
+            # Telemetry is written in the background by every manager in the process;
+            # make sure this session's events land.
+            await TelemetryManager.flush_all()
             await self.logs_manager.info("Session ended successfully")
             
             print("[DEBUG] Session ended successfully")
@@ -459,8 +463,8 @@ class Controller:
 
     async def pause_session(self):
         """
-        Pause the current tasks or flows. 
-        For MVP, we simply log it. 
+        Pause the current tasks or flows.
+        The LinkedIn agent blocks at its next pause check until resume_session().
         """
         try:
             print("[DEBUG] ========================================")
@@ -469,7 +473,8 @@ class Controller:
             print("[DEBUG] ========================================")
             
             await self.logs_manager.info("Pausing automation session...")
-            await asyncio.sleep(TimingConstants.ACTION_DELAY)
+            await asyncio.sleep(TimingConstants.ACTION_DELAY / 1000)
+            await self.linkedin_agent.pause()
             
             # Save current state
             if not await self._save_session_state():
@@ -515,13 +520,15 @@ class Controller:
             print("[DEBUG] ========================================")
             
             await self.logs_manager.info("Resuming automation session...")
-            await asyncio.sleep(TimingConstants.ACTION_DELAY)
+            await asyncio.sleep(TimingConstants.ACTION_DELAY / 1000)
             
             # Restore previous state if available
             if hasattr(self, 'pause_state') and self.pause_state:
                 print("[DEBUG] Attempting to restore previous session state...")
                 if not await self._restore_session_state():
                     print("[DEBUG] WARNING: Failed to restore session state")
+
+            await self.linkedin_agent.resume()
             
             await self.tracker_agent.log_activity(
                 activity_type='session',
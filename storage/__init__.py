@@ -7,9 +7,11 @@ and logging functionality.
 Components:
 - CSVStorage: Handles CSV file operations
 - LogsManager: Manages application logging
+- CoverLetterCache: Persists generated cover letters per job
 """
 
 from .csv_storage import CSVStorage
 from .logs_manager import LogsManager
+from .cover_letter_cache import CoverLetterCache
 
-__all__ = ['CSVStorage', 'LogsManager'] 
\ No newline at end of file
+__all__ = ['CSVStorage', 'LogsManager', 'CoverLetterCache'] 
\ No newline at end of file
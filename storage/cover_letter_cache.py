@@ -0,0 +1,79 @@
+"""
+Cover Letter Cache Module (Async wrapper over sqlite3)
+
+Persists generated cover letters so re-applying to the same job (or a
+near-duplicate job description) skips the LLM call entirely:
+- Keyed by sha256 of normalized job title + job description + prompt version
+- Bumping the prompt version invalidates older entries
+- Blocking sqlite3 calls run in a worker thread to keep the event loop free
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class CoverLetterCache:
+    def __init__(self, settings: dict, prompt_version: str = "v1"):
+        """
+        Args:
+            settings (dict): Uses settings['system']['data_dir'] (default './data');
+                the database lives in <data_dir>/cache/cover_letters.sqlite3.
+            prompt_version (str): Mixed into every key so prompt changes invalidate old letters.
+        """
+        data_dir = settings.get('system', {}).get('data_dir', './data')
+        self.db_path = Path(data_dir) / 'cache' / 'cover_letters.sqlite3'
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.prompt_version = prompt_version
+
+        self._lock = threading.Lock()  # one sqlite connection shared by worker threads
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cover_letters ("
+            "key TEXT PRIMARY KEY, cover_letter TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Collapse whitespace and lowercase, so trivially different JDs share a key."""
+        return " ".join(str(text).split()).lower()
+
+    def make_key(self, job_title: str, job_description: str) -> str:
+        """Cache key for a job under the current prompt version."""
+        raw = f"{self._normalize(job_title)}|{self._normalize(job_description)}|{self.prompt_version}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get(self, job_title: str, job_description: str) -> Optional[str]:
+        """Return the cached cover letter for this job, or None."""
+        return await asyncio.to_thread(self._get_sync, self.make_key(job_title, job_description))
+
+    async def set(self, job_title: str, job_description: str, cover_letter: str) -> None:
+        """Store a generated cover letter (empty letters are ignored)."""
+        if not cover_letter:
+            return
+        await asyncio.to_thread(self._set_sync, self.make_key(job_title, job_description), cover_letter)
+
+    def close(self) -> None:
+        """Close the underlying sqlite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cover_letter FROM cover_letters WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_sync(self, key: str, cover_letter: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cover_letters (key, cover_letter, created_at) VALUES (?, ?, ?)",
+                (key, cover_letter, time.time())
+            )
+            self._conn.commit()
@@ -3,7 +3,9 @@ Logging Management Module (Async)
 
 Uses aiologger for async log output:
 - Daily log file naming (app_YYYYMMDD.log)
-- Console output with print for Windows compatibility
+- Console output with print for Windows compatibility (can be turned off
+  with logging.console_output for batch runs)
+- is_enabled() lets hot paths skip building messages that would be dropped
 - Learning pipeline event logging
 - Archive function is commented out (for future use)
 """
@@ -30,7 +32,10 @@ class LogsManager:
                 {
                     "system": {
                         "data_dir": "./data",
-                        "log_level": "INFO" or "DEBUG"
+                        "log_level": "DEBUG", "INFO", "WARNING" or "ERROR"
+                    },
+                    "logging": {
+                        "console_output": True   # optional, default True
                     }
                 }
             telemetry_manager: Optional TelemetryManager instance for tracking events
@@ -44,8 +49,11 @@ class LogsManager:
         self.log_dir = Path(data_dir) / 'logs'
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # For MVP, we allow 'INFO' or 'DEBUG' only
         self.log_level = log_level
+        # Numeric threshold for is_enabled(); unknown names fall back to INFO
+        level_no = logging.getLevelName(log_level)
+        self._level_no = level_no if isinstance(level_no, int) else logging.INFO
+        self.console_output = settings.get('logging', {}).get('console_output', True)
         
         # Daily filename approach
         self.log_file = self.log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
@@ -117,10 +125,21 @@ class LogsManager:
     # Logging methods for convenience (info, debug, error, etc.)
     # -------------------------------------------------------------------------
 
+    def is_enabled(self, level: str) -> bool:
+        """
+        Whether messages at `level` are emitted. Check this before formatting
+        expensive messages on hot paths.
+        """
+        level_no = logging.getLevelName(level.upper())
+        return not isinstance(level_no, int) or level_no >= self._level_no
+
     async def info(self, msg: str):
         """Log an INFO-level message."""
+        if self._level_no > logging.INFO:
+            return
         # Print to console with timestamp
-        print(f"[INFO] {msg}")
+        if self.console_output:
+            print(f"[INFO] {msg}")
         
         # Log to file if initialized
         if self.logger:
@@ -128,9 +147,10 @@ class LogsManager:
 
     async def debug(self, msg: str):
         """Log a DEBUG-level message."""
-        if self.log_level == "DEBUG":
+        if self._level_no <= logging.DEBUG:
             # Print debug messages only if in debug mode
-            print(f"[DEBUG] {msg}")
+            if self.console_output:
+                print(f"[DEBUG] {msg}")
             
             # Log to file if initialized
             if self.logger:
@@ -138,8 +158,11 @@ class LogsManager:
 
     async def warning(self, msg: str):
         """Log a WARNING-level message."""
+        if self._level_no > logging.WARNING:
+            return
         # Print to console with color
-        print(f"{Fore.YELLOW}[WARNING] {msg}{Style.RESET_ALL}")
+        if self.console_output:
+            print(f"{Fore.YELLOW}[WARNING] {msg}{Style.RESET_ALL}")
         
         # Log to file if initialized
         if self.logger:
@@ -148,7 +171,8 @@ class LogsManager:
     async def error(self, msg: str):
         """Log an ERROR-level message."""
         # Print to console with color
-        print(f"{Fore.RED}[ERROR] {msg}{Style.RESET_ALL}")
+        if self.console_output:
+            print(f"{Fore.RED}[ERROR] {msg}{Style.RESET_ALL}")
         
         # Log to file if initialized
         if self.logger:
@@ -157,7 +181,8 @@ class LogsManager:
     async def critical(self, msg: str):
         """Log a CRITICAL-level message."""
         # Print to console with color
-        print(f"{Fore.RED}[CRITICAL] {msg}{Style.RESET_ALL}")
+        if self.console_output:
+            print(f"{Fore.RED}[CRITICAL] {msg}{Style.RESET_ALL}")
         
         # Log to file if initialized
         if self.logger:
@@ -110,6 +110,8 @@ def resource_path():
 def auto_cleanup_tk():
     """Automatically clean up Tkinter windows after each test."""
     yield
+    if not tk._default_root:
+        return
     for window in tk._default_root.children.copy():
         if isinstance(window, tk.Toplevel):
             window.destroy()
@@ -0,0 +1,45 @@
+"""
+Unit Tests for CoverLetterCache
+
+Tests key normalization, persistence and prompt-version invalidation.
+"""
+
+import pytest
+from storage.cover_letter_cache import CoverLetterCache
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return {"system": {"data_dir": str(tmp_path)}}
+
+
+@pytest.mark.asyncio
+async def test_roundtrip_and_normalization(settings):
+    cache = CoverLetterCache(settings)
+    assert await cache.get("Data Scientist", "Python & ML") is None
+
+    await cache.set("Data Scientist", "Python & ML", "Dear Hiring Manager")
+    assert await cache.get("data scientist", "  Python   &  ml\n") == "Dear Hiring Manager"
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_persists_across_instances(settings):
+    cache = CoverLetterCache(settings)
+    await cache.set("Data Scientist", "Python & ML", "Dear Hiring Manager")
+    cache.close()
+
+    reopened = CoverLetterCache(settings)
+    assert await reopened.get("Data Scientist", "Python & ML") == "Dear Hiring Manager"
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_prompt_version_invalidates(settings):
+    cache = CoverLetterCache(settings, prompt_version="v1")
+    await cache.set("Data Scientist", "Python & ML", "Dear Hiring Manager")
+    cache.close()
+
+    bumped = CoverLetterCache(settings, prompt_version="v2")
+    assert await bumped.get("Data Scientist", "Python & ML") is None
+    bumped.close()
@@ -0,0 +1,566 @@
+"""
+Unit Tests for FormFillerAgent (Async, Playwright-based)
+
+Tests the form filling and cover letter logic by mocking DomService,
+LogsManager and the OpenAI client.
+"""
+
+import asyncio
+import os
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import agents.form_filler_agent as form_filler_module
+from agents.form_filler_agent import FormFillerAgent, get_openai_client
+from storage.logs_manager import LogsManager
+
+
+@pytest.fixture
+def agent(tmp_path):
+    """
+    Creates a FormFillerAgent with mocked DomService / LogsManager.
+    """
+    dom_service = MagicMock()
+    logs_manager = AsyncMock(spec=LogsManager)
+    settings = {
+        "system": {"data_dir": str(tmp_path / "data")},
+        "telemetry": {"enabled": False, "storage_path": str(tmp_path / "telemetry")}
+    }
+    return FormFillerAgent(dom_service, logs_manager, settings=settings)
+
+
+@pytest.mark.asyncio
+async def test_openai_client_is_shared(monkeypatch):
+    """
+    Every caller should receive the same pooled AsyncOpenAI client.
+    """
+    monkeypatch.setattr(form_filler_module, "_openai_client", None)
+    monkeypatch.setattr(form_filler_module.openai, "api_key", "test_key_123")
+    first = await get_openai_client()
+    second = await get_openai_client()
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_retries_transient_errors(agent, monkeypatch):
+    """
+    A rate-limit error should be retried at the API-call layer before succeeding.
+    """
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = "  Dear Hiring Manager  "
+
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(side_effect=[
+        form_filler_module.openai.APIConnectionError(request=MagicMock()),
+        completion
+    ])
+    monkeypatch.setattr(form_filler_module, "get_openai_client", AsyncMock(return_value=client))
+    monkeypatch.setattr(form_filler_module, "_openai_retry_delay", lambda error, attempt: 0)
+
+    text = await agent._async_chat_completion("prompt")
+    assert text == "Dear Hiring Manager"
+    assert client.chat.completions.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fill_form_tracks_telemetry_without_crashing(agent, monkeypatch):
+    """
+    fill_form must not touch attributes that a plain dict doesn't have.
+    """
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", AsyncMock())
+    agent._fill_field = AsyncMock()
+    form_data = {"full_name": "Alice Wonderland"}
+    form_mapping = {"full_name": {"selector": "#name-input", "type": "text"}}
+
+    await agent.fill_form(form_data, form_mapping)
+
+    agent._fill_field.assert_awaited_once_with(
+        "full_name", "Alice Wonderland", "#name-input", "text", False, False
+    )
+
+
+@pytest.mark.asyncio
+async def test_fill_field_dispatches_by_type(agent):
+    """
+    _fill_field routes each field type to its handler and skips unknown types.
+    """
+    agent._field_handlers["text"] = AsyncMock()
+    await agent._fill_field("full_name", "Alice", "#name-input", "text", required=True)
+    agent._field_handlers["text"].assert_awaited_once_with("#name-input", "Alice", True)
+
+    await agent._fill_field("mystery", "x", "#mystery", "hologram")
+    agent.logs_manager.warning.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cover_letter_streams_into_text_field(agent, monkeypatch):
+    """
+    Generated cover letters are appended to the field while tokens arrive.
+    """
+    async def fake_stream(prompt):
+        for token in ["Dear ", "Hiring ", "Manager"]:
+            yield token
+
+    monkeypatch.setattr(form_filler_module.openai, "api_key", "test_key_123")
+    element = AsyncMock()
+    agent.dom_service.page.locator.return_value.first = element
+    agent._stream_chat_completion = fake_stream
+
+    await agent._handle_cover_letter(
+        "cover_letter_text",
+        "textarea[name='cover_letter']",
+        {"job_title": "Data Scientist", "job_description": "Python & ML"},
+        required=True
+    )
+
+    element.fill.assert_awaited_once()
+    assert element.fill.await_args.args == ("",)
+    appended = "".join(call.args[1] for call in element.evaluate.await_args_list)
+    assert appended == "Dear Hiring Manager"
+
+
+@pytest.mark.asyncio
+async def test_fill_form_fills_cover_letter_after_other_fields(agent, monkeypatch):
+    """
+    Independent fields are filled first (concurrently); cover letters follow.
+    """
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", AsyncMock())
+    order = []
+
+    async def record(field_name, *args):
+        order.append(field_name)
+
+    agent._fill_field = record
+    form_data = {"cover_letter": "Dear team", "full_name": "Alice", "gender": "female"}
+    form_mapping = {
+        "cover_letter": {"selector": "textarea", "type": "cover_letter_text"},
+        "full_name": {"selector": "#name-input", "type": "text"},
+        "gender": {"selector": "input[name='gender']", "type": "radio"},
+    }
+
+    await agent.fill_form(form_data, form_mapping)
+
+    assert order[-1] == "cover_letter"
+    assert set(order[:2]) == {"full_name", "gender"}
+
+
+@pytest.mark.asyncio
+async def test_easy_apply_step_uses_single_probe(agent, monkeypatch):
+    """
+    One evaluate call describes the step; only fields needing work are touched.
+    """
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", AsyncMock())
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={
+        "phone": True,
+        "experience": False,
+        "unchecked_checkboxes": [1],
+        "empty_textareas": [],
+    })
+    locator = MagicMock()
+    locator.first.fill = AsyncMock()
+    locator.nth.return_value.click = AsyncMock()
+    page.locator.return_value = locator
+    agent.dom_service.page = page
+
+    await agent._fill_current_step_fields({"phone": "1234567890"})
+
+    page.evaluate.assert_awaited_once()
+    locator.first.fill.assert_awaited_once_with("1234567890")
+    locator.nth.assert_called_once_with(1)
+    locator.nth.return_value.click.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cover_letter_served_from_cache(agent, monkeypatch):
+    """
+    A second request for the same job reuses the cached letter instead of calling OpenAI.
+    """
+    monkeypatch.setattr(form_filler_module.openai, "api_key", "test_key_123")
+    agent._async_chat_completion = AsyncMock(return_value="Dear Hiring Manager")
+
+    first = await agent._call_llm_cover_letter("Data Scientist", "Python & ML")
+    second = await agent._call_llm_cover_letter("Data Scientist", "  python &  ML ")
+
+    assert first == second == "Dear Hiring Manager"
+    agent._async_chat_completion.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_queue_caches_completed_results(agent, monkeypatch):
+    """
+    Completed batch output is loaded into the cover letter cache by custom_id.
+    """
+    monkeypatch.setattr(form_filler_module.openai, "api_key", "test_key_123")
+    client = MagicMock()
+    client.files.create = AsyncMock(return_value=MagicMock(id="file-1"))
+    client.batches.create = AsyncMock(return_value=MagicMock(id="batch-1"))
+    client.batches.retrieve = AsyncMock(
+        return_value=MagicMock(status="completed", output_file_id="file-2")
+    )
+    client.files.content = AsyncMock(return_value=MagicMock(text=(
+        '{"custom_id": "job-1", "error": null, "response": {"status_code": 200, '
+        '"body": {"choices": [{"message": {"content": " Dear team "}}]}}}'
+    )))
+    monkeypatch.setattr(form_filler_module, "get_openai_client", AsyncMock(return_value=client))
+
+    queue = form_filler_module.BatchCoverLetterQueue(agent, poll_interval=0)
+    queue.add("job-1", "Data Scientist", "Python & ML")
+    assert await queue.submit() == "batch-1"
+    assert await queue.collect(timeout=1) == 1
+    assert await agent.cover_letter_cache.get("Data Scientist", "Python & ML") == "Dear team"
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests(monkeypatch):
+    """
+    The leaky-bucket limiter releases one caller per interval.
+    """
+    waits = []
+
+    async def fake_sleep(delay):
+        waits.append(delay)
+
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", fake_sleep)
+    limiter = form_filler_module.OpenAIRateLimiter(max_rate=60, time_period=60.0)
+
+    for _ in range(3):
+        async with limiter:
+            pass
+
+    assert len(waits) == 2
+    assert all(0.9 < w <= 2.0 for w in waits)
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_at_word_cap(agent, monkeypatch):
+    """
+    Streaming stops reading once the cover letter reaches the word cap.
+    """
+    def delta(text):
+        return MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+
+    class FakeStream:
+        def __init__(self):
+            self.close = AsyncMock()
+
+        async def __aiter__(self):
+            for _ in range(form_filler_module.COVER_LETTER_MAX_WORDS + 50):
+                yield delta("word ")
+
+    stream = FakeStream()
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=stream)
+    monkeypatch.setattr(form_filler_module, "get_openai_client", AsyncMock(return_value=client))
+
+    tokens = [token async for token in agent._stream_chat_completion("prompt")]
+
+    assert len(tokens) == form_filler_module.COVER_LETTER_MAX_WORDS
+    stream.close.assert_awaited_once()
+    assert client.chat.completions.create.await_args.kwargs["max_tokens"] == 260
+
+
+def test_cover_letter_model_is_configurable(tmp_path, monkeypatch):
+    """
+    The cover letter model defaults to gpt-4o-mini and can be overridden via env.
+    """
+    settings = {"system": {"data_dir": str(tmp_path)}, "telemetry": {"enabled": False}}
+    default_agent = FormFillerAgent(MagicMock(), AsyncMock(spec=LogsManager), settings)
+    assert default_agent._chat_request_body("prompt")["model"] == "gpt-4o-mini"
+
+    monkeypatch.setenv("COVER_LETTER_MODEL", "gpt-4o")
+    override_agent = FormFillerAgent(MagicMock(), AsyncMock(spec=LogsManager), settings)
+    assert override_agent._chat_request_body("prompt")["model"] == "gpt-4o"
+
+
+@pytest.mark.asyncio
+async def test_field_handlers_act_through_locators(agent, monkeypatch):
+    """
+    Field handlers use auto-waiting locator actions, with no separate wait step.
+    """
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", AsyncMock())
+    field = AsyncMock()
+    agent.dom_service.page.locator.return_value.first = field
+    agent.dom_service.page.locator.return_value.count = AsyncMock(return_value=1)
+    agent.dom_service.wait_for_selector = AsyncMock()
+
+    await agent._fill_field("gender", "female", "input[name='gender']", "radio")
+    await agent._fill_field("remote", True, "#remote", "checkbox")
+
+    agent.dom_service.page.locator.assert_any_call("input[name='gender'][value='female']")
+    field.check.assert_awaited_once()
+    field.set_checked.assert_awaited_once_with(True, timeout=form_filler_module.TimingConstants.DEFAULT_TIMEOUT)
+    agent.dom_service.wait_for_selector.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_text_fields_fill_unless_keystrokes_required(agent, monkeypatch):
+    """
+    Text is set with a single fill(); key-by-key typing only when the mapping asks for it.
+    """
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", AsyncMock())
+    field = AsyncMock()
+    agent.dom_service.page.locator.return_value.first = field
+    agent.dom_service.page.locator.return_value.count = AsyncMock(return_value=1)
+    timeout = form_filler_module.TimingConstants.DEFAULT_TIMEOUT
+
+    await agent.fill_form(
+        {"full_name": "Alice", "city": "Paris"},
+        {
+            "full_name": {"selector": "#name-input", "type": "text"},
+            "city": {"selector": "#city", "type": "text", "requires_keystrokes": True},
+        }
+    )
+
+    field.fill.assert_any_await("Alice", timeout=timeout)
+    field.press_sequentially.assert_awaited_once_with("Paris", timeout=timeout)
+
+
+@pytest.mark.asyncio
+async def test_required_upload_prompts_through_callback(tmp_path, monkeypatch):
+    """
+    Missing required files are requested through the async prompt callback, not input().
+    """
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", AsyncMock())
+    cv = tmp_path / "cv.pdf"
+    cv.write_text("cv")
+    prompt = AsyncMock(return_value=f"  {cv}  ")
+    settings = {"system": {"data_dir": str(tmp_path)}, "telemetry": {"enabled": False}}
+    agent = FormFillerAgent(MagicMock(), AsyncMock(spec=LogsManager), settings, prompt_callback=prompt)
+    field = AsyncMock()
+    agent.dom_service.page.locator.return_value.first = field
+
+    await agent._handle_file_upload("input[type='file']", str(tmp_path / "missing.pdf"), required=True)
+
+    prompt.assert_awaited_once()
+    field.set_input_files.assert_awaited_once()
+    assert field.set_input_files.await_args.args == (str(cv),)
+
+
+@pytest.mark.asyncio
+async def test_cover_letter_upload_uses_unique_temp_files(agent, monkeypatch):
+    """
+    Each upload gets its own temp file, which is removed afterwards.
+    """
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", AsyncMock())
+    uploaded = []
+
+    async def fake_upload(selector, file_path, required):
+        with open(file_path, encoding="utf-8") as f:
+            uploaded.append((file_path, f.read()))
+
+    agent._handle_file_upload = fake_upload
+
+    await asyncio.gather(
+        agent._handle_cover_letter("cover_letter_upload", "input[type='file']", "Letter A", required=False),
+        agent._handle_cover_letter("cover_letter_upload", "input[type='file']", "Letter B", required=False),
+    )
+
+    assert {text for _, text in uploaded} == {"Letter A", "Letter B"}
+    assert uploaded[0][0] != uploaded[1][0]
+    assert not any(os.path.exists(path) for path, _ in uploaded)
+
+
+@pytest.mark.asyncio
+async def test_absent_optional_field_is_skipped_without_waiting(agent, monkeypatch):
+    """
+    Optional fields missing from the DOM are skipped after one locator count, without
+    a locator wait or an ElementHandle.
+    """
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", AsyncMock())
+    agent.dom_service.page.locator.return_value.count = AsyncMock(return_value=0)
+    agent._field_handlers["text"] = AsyncMock()
+
+    await agent._fill_field("nickname", "Ali", "#nickname", "text", required=False)
+    agent._field_handlers["text"].assert_not_awaited()
+    agent.dom_service.page.locator.assert_called_once_with("#nickname")
+    agent.dom_service.query_selector.assert_not_called()
+
+    await agent._fill_field("full_name", "Alice", "#name-input", "text", required=True)
+    agent._field_handlers["text"].assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delays_use_milliseconds_and_respect_fast_mode(tmp_path, monkeypatch):
+    """
+    TimingConstants delays are converted from ms, and skipped entirely in fast mode.
+    """
+    sleep = AsyncMock()
+    monkeypatch.setattr(form_filler_module.asyncio, "sleep", sleep)
+    settings = {"system": {"data_dir": str(tmp_path)}, "telemetry": {"enabled": False}}
+
+    humanized = FormFillerAgent(MagicMock(), AsyncMock(spec=LogsManager), settings)
+    await humanized._delay(form_filler_module.TimingConstants.HUMAN_DELAY_MIN)
+    sleep.assert_awaited_once_with(form_filler_module.TimingConstants.HUMAN_DELAY_MIN / 1000)
+
+    sleep.reset_mock()
+    monkeypatch.setenv("FORM_FILLER_FAST", "1")
+    fast = FormFillerAgent(MagicMock(), AsyncMock(spec=LogsManager), settings)
+    await fast._delay(form_filler_module.TimingConstants.ACTION_DELAY)
+    await fast._human_delay(0.8, 1.5)
+    sleep.assert_not_awaited()
+
+
+def test_cover_letter_prompt_uses_system_message_and_caps_description(agent, monkeypatch):
+    """
+    Instructions live in the shared system message; long descriptions are truncated.
+    """
+    monkeypatch.setattr(form_filler_module, "_get_tokenizer", lambda: None)
+    long_description = "x" * 100_000
+
+    prompt = agent._build_cover_letter_prompt("Data Scientist", long_description)
+    body = agent._chat_request_body(prompt)
+
+    assert body["messages"][0] is form_filler_module.COVER_LETTER_SYSTEM_MESSAGE
+    assert body["messages"][1]["content"].startswith("Title: Data Scientist\nJD: ")
+    max_chars = form_filler_module.COVER_LETTER_JD_MAX_TOKENS * form_filler_module.CHARS_PER_TOKEN_ESTIMATE
+    assert len(prompt) < max_chars + 100
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_packs_jobs_into_one_request(agent, monkeypatch):
+    """
+    Several jobs share one JSON-mode completion; letters come back in input order and are cached.
+    """
+    monkeypatch.setattr(form_filler_module.openai, "api_key", "test_key_123")
+    monkeypatch.setattr(form_filler_module, "_get_tokenizer", lambda: None)
+    agent._async_chat_completion = AsyncMock(return_value=(
+        '{"letters": [{"id": 1, "letter": "Letter for ML"}, {"id": 0, "letter": "Letter for DS"}]}'
+    ))
+    jobs = [
+        {"job_title": "Data Scientist", "job_description": "Python"},
+        {"job_title": "ML Engineer", "job_description": "PyTorch"},
+    ]
+
+    letters = await agent.generate_batch(jobs)
+
+    assert letters == ["Letter for DS", "Letter for ML"]
+    agent._async_chat_completion.assert_awaited_once()
+    request_body = agent._async_chat_completion.await_args.args[1]
+    assert request_body["response_format"] == {"type": "json_object"}
+    assert await agent.cover_letter_cache.get("ML Engineer", "PyTorch") == "Letter for ML"
+
+
+@pytest.mark.asyncio
+async def test_step_fields_overlap_delays_but_not_focus_actions(agent, monkeypatch):
+    """
+    The step's field groups wait out their delays together, but the phone fill,
+    checkbox clicks and textarea fill (all focus-taking) never overlap.
+    """
+    delays = {"in_flight": 0, "peak": 0}
+    focus = {"in_flight": 0, "peak": 0}
+
+    def tracked(counter):
+        async def action(*args, **kwargs):
+            counter["in_flight"] += 1
+            counter["peak"] = max(counter["peak"], counter["in_flight"])
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            counter["in_flight"] -= 1
+        return action
+
+    monkeypatch.setattr(agent, "_delay", tracked(delays))
+    locator = MagicMock()
+    locator.first.fill = AsyncMock(side_effect=tracked(focus))
+    locator.nth.return_value.click = AsyncMock(side_effect=tracked(focus))
+    locator.nth.return_value.fill = AsyncMock(side_effect=tracked(focus))
+    agent.dom_service.page.locator.return_value = locator
+
+    await agent._fill_current_step_fields({"phone": "555"}, {
+        "phone": True, "experience": False, "unchecked_checkboxes": [0, 2], "empty_textareas": [1],
+    })
+
+    locator.first.fill.assert_awaited_once_with("555")
+    assert locator.nth.return_value.click.await_count == 2
+    locator.nth.return_value.fill.assert_awaited_once_with("N/A")
+    assert delays["peak"] == 4
+    assert focus["peak"] == 1
+
+
+@pytest.mark.asyncio
+async def test_easy_apply_runs_probe_driven_steps(agent):
+    """
+    Each Easy Apply step is classified by one probe and dispatched to its step handler.
+    """
+    def probe(step, next_button=None):
+        return {
+            "step": step, "next": next_button, "progress": str(len(step)), "phone": False, "experience": False,
+            "unchecked_checkboxes": [], "empty_textareas": [],
+        }
+
+    next_button = form_filler_module.Selectors.FORM_NEXT_BUTTON
+    agent.humanize = False
+    page = MagicMock()
+    page.evaluate = AsyncMock(side_effect=[
+        probe("resume", next_button),
+        probe("questions", next_button),
+        probe("review"),
+    ])
+    locator = MagicMock()
+    locator.first.click = AsyncMock()
+    locator.first.set_input_files = AsyncMock()
+    locator.first.wait_for = AsyncMock()
+    button = MagicMock(click=AsyncMock(), dispose=AsyncMock())
+    locator.first.element_handle = AsyncMock(return_value=button)
+    page.locator.return_value = locator
+    page.wait_for_function = AsyncMock()
+    agent.dom_service.page = page
+
+    result = await agent.fill_easy_apply({"cv_path": "/tmp/cv.pdf"})
+
+    assert result == "applied"
+    assert page.evaluate.await_count == 3
+    locator.first.set_input_files.assert_awaited_once_with("/tmp/cv.pdf")
+    assert button.click.await_count == 2  # next, next
+    locator.first.click.assert_awaited_once()  # submit
+    assert button.dispose.await_count == 2
+    # Each step change is confirmed (clicked button gone or progress moved) before
+    # re-probing, since the step markers are already visible on the step being left.
+    assert [call.kwargs["arg"] for call in page.wait_for_function.await_args_list] == [
+        [button, "6"], [button, "9"]
+    ]
+    # Each transition (two steps + submit) then waits on page state instead of a fixed sleep.
+    assert locator.first.wait_for.await_count == 3
+    page.locator.assert_any_call(form_filler_module.EASY_APPLY_SUCCESS_MARKER)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_text_fills_never_overlap(agent):
+    """
+    fill_form runs fields concurrently, but fills/typing (which act on the focused
+    element) never overlap, including the clear + type of keystroke fields.
+    """
+    agent.humanize = False
+    agent._is_present = AsyncMock(return_value=True)
+    in_focus = 0
+    overlapped = False
+
+    async def focus_action(*args, **kwargs):
+        nonlocal in_focus, overlapped
+        in_focus += 1
+        overlapped |= in_focus > 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        in_focus -= 1
+
+    field = MagicMock()
+    field.fill = AsyncMock(side_effect=focus_action)
+    field.press_sequentially = AsyncMock(side_effect=focus_action)
+    field.set_checked = AsyncMock(side_effect=focus_action)
+    agent.dom_service.page.locator.return_value.first = field
+
+    form_data = {"first": "Alice", "last": "Smith", "city": "Paris", "remote": True}
+    form_mapping = {
+        "first": {"selector": "#first", "type": "text"},
+        "last": {"selector": "#last", "type": "text"},
+        "city": {"selector": "#city", "type": "text", "requires_keystrokes": True},
+        "remote": {"selector": "#remote", "type": "checkbox"},
+    }
+    await agent.fill_form(form_data, form_mapping)
+
+    assert field.fill.await_count == 3  # two fills plus the keystroke field's clear
+    field.press_sequentially.assert_awaited_once()
+    field.set_checked.assert_awaited_once()
+    assert not overlapped
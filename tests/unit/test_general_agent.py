@@ -0,0 +1,893 @@
+"""
+Unit Tests for GeneralAgent (Async, Playwright-based)
+
+Tests selector handling, waits, retries and delays by mocking DomService,
+LogsManager and LinkedInLocators.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+import agents.general_agent as general_agent_module
+from agents.general_agent import GeneralAgent
+from storage.logs_manager import LogsManager
+import utils.dom.dom_service as dom_service_module
+from utils.dom.dom_service import DomService, DISPATCH_DRAG_JS, EXTRACT_ATTR_JS, SCROLL_TO_BOTTOM_JS
+from utils.page_pool import PagePool
+
+
+@pytest.fixture
+def agent(tmp_path):
+    """
+    Creates a GeneralAgent with mocked DomService / LogsManager and no human delays.
+    """
+    dom_service = MagicMock()
+    dom_service.page.url = "https://www.linkedin.com/jobs/"
+    dom_service.page.add_init_script = AsyncMock()
+    logs_manager = AsyncMock(spec=LogsManager)
+    settings = {"telemetry": {"enabled": False, "storage_path": str(tmp_path / "telemetry")}}
+    return GeneralAgent(dom_service, logs_manager, min_delay=0, max_delay=0, settings=settings)
+
+
+@pytest.mark.asyncio
+async def test_click_tries_static_alternatives_in_one_locator(agent):
+    """
+    Registered LinkedInLocators alternatives are or-ed into the clicked locator.
+    """
+    locator = agent.page.locator.return_value
+    combined = locator.or_.return_value
+    combined.first.click = AsyncMock()
+
+    await agent.click_element("EASY_APPLY_BUTTON")
+
+    agent.page.locator.assert_any_call("EASY_APPLY_BUTTON")
+    agent.page.locator.assert_any_call("button.jobs-apply-button")
+    combined.first.click.assert_awaited_once_with(timeout=agent.default_timeout)
+
+
+@pytest.mark.asyncio
+async def test_click_dom_fallback_is_cached_per_domain(agent, monkeypatch):
+    """
+    Once the DOM-walk fallback works, later clicks go straight to it.
+    """
+    clicked = []
+
+    def locator(selector):
+        async def click(timeout=None):
+            clicked.append(selector)
+            if selector == "Next":
+                raise Exception("not found")
+        return MagicMock(first=MagicMock(click=click))
+
+    agent.page.locator = MagicMock(side_effect=locator)
+    agent.dom_service.click_element = AsyncMock(side_effect=lambda s: clicked.append(s))
+    get_element = AsyncMock(return_value="[data-highlight-index='3']")
+    monkeypatch.setattr(general_agent_module.LinkedInLocators, "get_element", get_element)
+
+    await agent.click_element("Next")
+    await agent.click_element("Next")
+
+    assert clicked == ["Next", "[data-highlight-index='3']", "[data-highlight-index='3']"]
+    assert get_element.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_selector_cache_is_bounded_and_cleared(agent, monkeypatch):
+    """
+    The cache evicts the least recently used entry and empties on a frame switch.
+    """
+    monkeypatch.setattr(general_agent_module, "SELECTOR_CACHE_SIZE", 2)
+    agent._remember_selector("a", "#a")
+    agent._remember_selector("b", "#b")
+    agent._resolve("a")
+    agent._remember_selector("c", "#c")
+
+    assert agent._resolve("a") == "#a"
+    assert agent._resolve("b") == "b"
+
+    agent.dom_service.switch_to_iframe = AsyncMock()
+    await agent.switch_to_iframe("iframe#captcha")
+
+    assert agent._resolve("a") == "a"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_text_uses_one_locator_wait(agent):
+    """
+    wait_for_text is a single locator wait instead of polling extract_text.
+    """
+    locator = agent.page.locator.return_value
+    match = locator.filter.return_value
+    match.first.wait_for = AsyncMock()
+    agent.dom_service.wait_for_selector = AsyncMock()
+
+    assert await agent.wait_for_text("#status", "Applied", timeout=1000) is True
+    agent.page.locator.assert_called_once_with("#status")
+    assert locator.filter.call_args.kwargs["has_text"].pattern == "Applied"
+    match.first.wait_for.assert_awaited_once_with(state="attached", timeout=1000)
+    agent.dom_service.wait_for_selector.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_condition_times_out(agent):
+    """
+    Python conditions are polled against the loop clock until the timeout.
+    """
+    condition = AsyncMock(return_value=False)
+
+    with pytest.raises(Exception, match="Timed out waiting for condition"):
+        await agent.wait_for_condition(condition, timeout=50, poll_interval=0.01)
+    assert condition.await_count > 1
+
+
+@pytest.mark.asyncio
+async def test_retry_operation_fails_fast_on_unrecoverable_errors(agent, monkeypatch):
+    """
+    Only transient errors are retried; anything else propagates on the first attempt.
+    """
+    monkeypatch.setattr(general_agent_module.asyncio, "sleep", AsyncMock())
+    for error in (TypeError("bad argument"), PlaywrightError("Unexpected token in selector")):
+        doomed = AsyncMock(side_effect=error)
+        with pytest.raises(type(error)):
+            await agent._retry_operation(doomed)
+        assert doomed.await_count == 1
+
+    for error in (ConnectionError("reset"), PlaywrightError("net::ERR_CONNECTION_RESET")):
+        flaky = AsyncMock(side_effect=[error, "ok"])
+        assert await agent._retry_operation(flaky) == "ok"
+        assert flaky.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_links_reads_all_hrefs_in_one_call(agent):
+    """
+    Links come back from a single evaluate_all on the cached locator.
+    """
+    locator = agent.page.locator.return_value
+    locator.evaluate_all = AsyncMock(return_value=["/jobs/view/1", "/jobs/view/2"])
+
+    assert await agent.extract_links("a.job-card") == ["/jobs/view/1", "/jobs/view/2"]
+    agent.page.locator.assert_called_once_with("a.job-card")
+    locator.evaluate_all.assert_awaited_once_with(EXTRACT_ATTR_JS, "href")
+
+
+@pytest.mark.asyncio
+async def test_batch_attr_reads_any_attribute_in_one_call(agent):
+    """
+    _batch_attr passes the attribute name to the shared evaluate_all script.
+    """
+    locator = agent.page.locator.return_value
+    locator.evaluate_all = AsyncMock(return_value=["123", "456"])
+
+    assert await agent._batch_attr("li.job", "data-job-id") == ["123", "456"]
+    locator.evaluate_all.assert_awaited_once_with(EXTRACT_ATTR_JS, "data-job-id")
+
+
+@pytest.mark.asyncio
+async def test_dom_service_extract_links_is_one_call():
+    """
+    DomService.extract_links uses one eval_on_selector_all instead of per-element lookups.
+    """
+    page = MagicMock()
+    page.eval_on_selector_all = AsyncMock(return_value=["/jobs/view/1"])
+
+    assert await DomService(page).extract_links("a") == ["/jobs/view/1"]
+    page.eval_on_selector_all.assert_awaited_once_with("a", EXTRACT_ATTR_JS, "href")
+    page.query_selector_all.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_dom_service_scroll_to_bottom_is_one_evaluate():
+    """
+    DomService.scroll_to_bottom runs the whole loop in the page instead of wheel/height round-trips,
+    bounded by a step cap and a deadline, optionally in an inner scroll pane.
+    """
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+
+    assert await DomService(page).scroll_to_bottom(step=400, pause=0.5) is True
+    page.evaluate.assert_awaited_once_with(
+        SCROLL_TO_BOTTOM_JS, [400, 500, dom_service_module.SCROLL_MAX_STEPS, dom_service_module.SCROLL_TIMEOUT_MS, None]
+    )
+    page.mouse.wheel.assert_not_called()
+
+    page.evaluate = AsyncMock(return_value=False)
+    assert await DomService(page).scroll_to_bottom(max_steps=3, timeout=1000, container=".jobs-search-results-list") is False
+    page.evaluate.assert_awaited_once_with(SCROLL_TO_BOTTOM_JS, [200, 1000, 3, 1000, ".jobs-search-results-list"])
+
+
+@pytest.mark.asyncio
+async def test_dom_service_screenshot_format_follows_path(tmp_path):
+    """
+    The path's suffix picks the format (PNG unless .jpg/.jpeg); the path is never rewritten.
+    """
+    page = MagicMock()
+    page.screenshot = AsyncMock(return_value=b"image")
+    dom_service = DomService(page)
+
+    path = await dom_service.take_screenshot(str(tmp_path / "shot.png"))
+    assert path == str(tmp_path / "shot.png")
+    assert (tmp_path / "shot.png").read_bytes() == b"image"
+    page.screenshot.assert_awaited_with(full_page=True, type="png")
+
+    path = await dom_service.take_screenshot(str(tmp_path / "shot.JPG"))
+    assert path == str(tmp_path / "shot.JPG")
+    page.screenshot.assert_awaited_with(full_page=True, type="jpeg", quality=70)
+
+
+@pytest.mark.asyncio
+async def test_dom_service_drag_dispatch_skips_mouse_events():
+    """
+    A dispatched drag is one evaluate call; non-draggable sources fall back to the mouse.
+    """
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+    page.mouse.down = AsyncMock()
+
+    await DomService(page).drag_and_drop("#src", "#dst", use_dispatch=True)
+    page.evaluate.assert_awaited_once_with(DISPATCH_DRAG_JS, ["#src", "#dst"])
+    page.mouse.down.assert_not_called()
+
+    page.evaluate.return_value = False
+    handle = MagicMock(hover=AsyncMock())
+    page.wait_for_selector = AsyncMock(return_value=handle)
+    page.wait_for_timeout = AsyncMock()
+    page.mouse.up = AsyncMock()
+
+    await DomService(page).drag_and_drop("#src", "#dst", hold_delay=0, use_dispatch=True)
+    page.mouse.down.assert_awaited_once()
+    page.mouse.up.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_human_delay_cycles_precomputed_pool(tmp_path, monkeypatch):
+    """
+    Default delays come from the pool built at init, in seconds.
+    """
+    dom_service = MagicMock()
+    settings = {"telemetry": {"enabled": False, "storage_path": str(tmp_path / "telemetry")}}
+    agent = GeneralAgent(dom_service, AsyncMock(spec=LogsManager), settings=settings)
+    sleep = AsyncMock()
+    monkeypatch.setattr(general_agent_module.asyncio, "sleep", sleep)
+
+    await agent._human_delay()
+    await agent._human_delay()
+
+    assert [c.args[0] for c in sleep.await_args_list] == agent._delay_pool[:2]
+    assert all(0.1 <= d <= 0.3 for d in agent._delay_pool)
+
+
+@pytest.mark.asyncio
+async def test_dom_calls_share_a_concurrency_cap(agent, monkeypatch):
+    """
+    DOM calls from every agent wait for a free slot in the shared semaphore.
+    """
+    monkeypatch.setattr(GeneralAgent, "_dom_sem", asyncio.BoundedSemaphore(1))
+    in_flight = 0
+    peak = 0
+
+    async def evaluate(script):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    agent.dom_service.evaluate_script = AsyncMock(side_effect=evaluate)
+    await asyncio.gather(*(agent.evaluate_script("1") for _ in range(3)))
+
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_navigation_timeout_returns_none(agent):
+    """
+    A Playwright navigation timeout is logged and tolerated, not retried.
+    """
+    agent.dom_service.goto = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout 10000ms exceeded."))
+
+    assert await agent._navigate_operation("https://www.linkedin.com/jobs/") is None
+    agent.dom_service.goto.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_paused_actions_wake_on_resume(agent):
+    """
+    Actions block while paused and continue as soon as resume() is called.
+    """
+    field = agent.page.locator.return_value.first
+    field.fill = AsyncMock()
+    field.press_sequentially = AsyncMock()
+    await agent.pause()
+    assert agent.is_paused
+
+    typing = asyncio.create_task(agent.type_text("#q", "python"))
+    await asyncio.sleep(0.01)
+    assert not typing.done()
+
+    await agent.resume()
+    assert await asyncio.wait_for(typing, timeout=1) is True
+
+
+def test_agents_share_telemetry_per_settings(tmp_path):
+    """
+    Agents built from the same settings dict reuse one TelemetryManager.
+    """
+    settings = {"telemetry": {"enabled": False, "storage_path": str(tmp_path / "telemetry")}}
+    other = {"telemetry": {"enabled": False, "storage_path": str(tmp_path / "other")}}
+    first = GeneralAgent(MagicMock(), AsyncMock(spec=LogsManager), settings=settings)
+    second = GeneralAgent(MagicMock(), AsyncMock(spec=LogsManager), settings=settings)
+    third = GeneralAgent(MagicMock(), AsyncMock(spec=LogsManager), settings=other)
+
+    assert first.telemetry is second.telemetry
+    assert third.telemetry is not first.telemetry
+
+
+@pytest.mark.asyncio
+async def test_extract_text_overlaps_delay_with_lookup(agent, monkeypatch):
+    """
+    The element lookup starts while the human-like delay is still pending.
+    """
+    started = asyncio.Event()
+
+    async def human_delay(self):
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+    async def text_content(timeout=None):
+        started.set()
+        return "Senior Engineer"
+
+    monkeypatch.setattr(GeneralAgent, "_human_delay", human_delay)
+    agent.page.locator.return_value.first.text_content = AsyncMock(side_effect=text_content)
+    agent.dom_service.wait_for_selector = AsyncMock()
+
+    assert await agent.extract_text("h1.job-title") == "Senior Engineer"
+    agent.page.locator.assert_called_once_with("h1.job-title")
+    agent.dom_service.wait_for_selector.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_debug_messages_skipped_when_disabled(agent):
+    """
+    Debug lines are neither built nor sent when the logger is above DEBUG.
+    """
+    agent.logs_manager.is_enabled = MagicMock(return_value=False)
+    field = agent.page.locator.return_value.first
+    field.fill = AsyncMock()
+    field.press_sequentially = AsyncMock()
+
+    await agent.type_text("#q", "python")
+
+    agent.logs_manager.debug.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_click_skips_dom_fallback_for_simple_selectors(agent, monkeypatch):
+    """
+    A missing "#id" or "tag.class" element fails fast without the DOM walk.
+    """
+    agent.page.locator.return_value.first.click = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+    get_element = AsyncMock()
+    monkeypatch.setattr(general_agent_module.LinkedInLocators, "get_element", get_element)
+
+    for selector in ("#submit", "button.jobs-apply-button"):
+        with pytest.raises(Exception, match="Click operation failed completely"):
+            await agent.click_element(selector)
+
+    get_element.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_redundant_frame_switches_are_skipped(agent):
+    """
+    Re-entering the current iframe or leaving the main frame does nothing.
+    """
+    frame = MagicMock()
+    frame.is_detached.return_value = False
+
+    async def switch(selector):
+        agent.dom_service.page = frame
+
+    agent.dom_service.switch_to_iframe = AsyncMock(side_effect=switch)
+    agent.dom_service.switch_back_to_main_frame = MagicMock()
+
+    await agent.switch_back_to_main_frame()
+    await agent.switch_to_iframe("iframe#captcha")
+    await agent.switch_to_iframe("iframe#captcha")
+    assert agent.dom_service.switch_to_iframe.await_count == 1
+
+    await agent.switch_back_to_main_frame()
+    await agent.switch_back_to_main_frame()
+    agent.dom_service.switch_back_to_main_frame.assert_called_once_with(agent.root_page)
+
+
+@pytest.mark.asyncio
+async def test_fast_mode_skips_human_delays(tmp_path, monkeypatch):
+    """
+    GENERAL_AGENT_FAST=1 turns _human_delay into a no-op, even with explicit bounds.
+    """
+    monkeypatch.setenv("GENERAL_AGENT_FAST", "1")
+    settings = {"telemetry": {"enabled": False, "storage_path": str(tmp_path / "telemetry")}}
+    agent = GeneralAgent(MagicMock(), AsyncMock(spec=LogsManager), settings=settings)
+    sleep = AsyncMock()
+    monkeypatch.setattr(general_agent_module.asyncio, "sleep", sleep)
+
+    await agent._human_delay()
+    await agent._human_delay(1, 2)
+
+    assert agent.humanize is False
+    sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scroll_and_capture_runs_both_concurrently(agent):
+    """
+    The screenshot is taken while the scroll is still in progress.
+    """
+    screenshot_taken = asyncio.Event()
+
+    async def scroll_in_page(script, args=None):
+        if script == general_agent_module.SCROLL_TO_BOTTOM_CALL_JS:
+            await asyncio.wait_for(screenshot_taken.wait(), timeout=1)
+
+    async def take_screenshot(path, full_page):
+        screenshot_taken.set()
+        return path
+
+    agent.page.evaluate = AsyncMock(side_effect=scroll_in_page)
+    agent.dom_service.take_screenshot = AsyncMock(side_effect=take_screenshot)
+
+    assert await agent.scroll_and_capture("page.png") == "page.png"
+
+    agent.page.evaluate.assert_awaited_with(
+        general_agent_module.SCROLL_TO_BOTTOM_CALL_JS,
+        [200, 500, dom_service_module.SCROLL_MAX_STEPS, dom_service_module.SCROLL_TIMEOUT_MS, None]
+    )
+
+
+@pytest.mark.asyncio
+async def test_scroll_to_bottom_is_one_evaluate(agent, monkeypatch):
+    """
+    The scroll loop runs in the page; once the helpers are in, each scroll is a single evaluate call.
+    """
+    agent.page.evaluate = AsyncMock(return_value=True)
+    agent.dom_service.scroll_to_bottom = AsyncMock()
+    dom_call = AsyncMock(wraps=agent._dom_call)
+    monkeypatch.setattr(GeneralAgent, "_dom_call", dom_call)
+
+    await agent.scroll_to_bottom(step=300, pause=0.25)
+    agent.page.evaluate.reset_mock()
+    assert await agent.scroll_to_bottom(step=300, pause=0.25, max_steps=40, timeout=5000, container="#pane") is True
+
+    agent.page.evaluate.assert_awaited_once_with(general_agent_module.SCROLL_TO_BOTTOM_CALL_JS, [300, 250, 40, 5000, "#pane"])
+    # Bounded by the page/shared DOM slots like every other page call.
+    dom_call.assert_any_await(agent.page.evaluate, general_agent_module.SCROLL_TO_BOTTOM_CALL_JS, [300, 250, 40, 5000, "#pane"])
+    agent.dom_service.scroll_to_bottom.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_helpers_are_installed_once_per_frame(agent):
+    """
+    The helper library is registered as an init script once and evaluated once per live document.
+    """
+    agent.page.evaluate = AsyncMock(return_value=True)
+
+    await agent.check_element_present("#a", timeout=0)
+    await agent.check_element_present("#b", timeout=0)
+    agent.page.add_init_script.assert_awaited_once_with(general_agent_module.HELPERS_JS)
+    assert [c.args[0] for c in agent.page.evaluate.await_args_list] == [
+        general_agent_module.HELPERS_JS,
+        general_agent_module.PRESENT_CALL_JS,
+        general_agent_module.PRESENT_CALL_JS,
+    ]
+
+    frame = MagicMock(evaluate=AsyncMock(return_value=True))
+    agent.dom_service.switch_to_iframe = AsyncMock()
+    agent.dom_service.page = frame
+    await agent.switch_to_iframe("iframe#captcha")
+    await agent.check_element_present("#c", timeout=0)
+    agent.root_page.add_init_script.assert_awaited_once()
+    frame.evaluate.assert_any_await(general_agent_module.HELPERS_JS)
+
+
+@pytest.mark.asyncio
+async def test_helpers_are_registered_once_per_pooled_page(agent, tmp_path):
+    """
+    A second agent on the same page reuses the init script and the live document's helpers.
+    """
+    agent.page.evaluate = AsyncMock(return_value=True)
+    await agent.check_element_present("#a", timeout=0)
+
+    settings = {"telemetry": {"enabled": False, "storage_path": str(tmp_path / "telemetry")}}
+    second = GeneralAgent(agent.dom_service, agent.logs_manager, min_delay=0, max_delay=0, settings=settings)
+    await second.check_element_present("#b", timeout=0)
+
+    agent.page.add_init_script.assert_awaited_once_with(general_agent_module.HELPERS_JS)
+    assert [c.args[0] for c in agent.page.evaluate.await_args_list].count(general_agent_module.HELPERS_JS) == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_text_only_treats_timeouts_as_misses(agent):
+    """
+    A timeout becomes the usual failure; other errors are not swallowed.
+    """
+    match = agent.page.locator.return_value.filter.return_value
+    match.first.wait_for = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+    with pytest.raises(Exception, match="Timed out waiting for text"):
+        await agent.wait_for_text("#status", "Applied")
+
+    match.first.wait_for = AsyncMock(side_effect=RuntimeError("Target closed"))
+    with pytest.raises(RuntimeError):
+        await agent.wait_for_text("#status", "Applied")
+
+
+@pytest.mark.asyncio
+async def test_presence_check_with_tiny_timeout_reads_dom_once(agent):
+    """
+    Near-zero timeouts use one evaluate; non-CSS selectors fall back to the locator wait,
+    whose timeout is clamped through _wait_timeout.
+    """
+    agent.page.evaluate = AsyncMock(return_value=True)
+    wait_for = agent.page.locator.return_value.first.wait_for = AsyncMock()
+
+    assert await agent.check_element_present("#cookie-accept", timeout=0) is True
+    agent.page.evaluate.assert_awaited_with(general_agent_module.PRESENT_CALL_JS, "#cookie-accept")
+    wait_for.assert_not_called()
+
+    agent.page.evaluate.return_value = None
+    assert await agent.check_element_present("text=Accept", timeout=50) is True
+    wait_for.assert_awaited_once_with(state="visible", timeout=50)
+
+    # Longer timeouts are clamped to MAX_WAIT_MS like every other wait.
+    assert await agent.check_element_present("#apply", timeout=10 * general_agent_module.MAX_WAIT_MS) is True
+    wait_for.assert_awaited_with(state="visible", timeout=general_agent_module.MAX_WAIT_MS)
+
+
+@pytest.mark.asyncio
+async def test_locators_are_reused_per_frame(agent):
+    """
+    Repeated actions on a selector reuse one Locator until the frame changes.
+    """
+    field = agent.page.locator.return_value.first
+    field.fill = AsyncMock()
+    field.press_sequentially = AsyncMock()
+    field.wait_for = AsyncMock()
+
+    await agent.type_text("#q", "python")
+    assert await agent.check_element_present("#q") is True
+    agent.page.locator.assert_called_once_with("#q")
+
+    field.wait_for = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+    assert await agent.check_element_present("#q", timeout=1000) is False
+
+    agent.dom_service.switch_to_iframe = AsyncMock()
+    await agent.switch_to_iframe("iframe#captcha")
+    agent.page.locator.reset_mock()
+    await agent.type_text("#q", "python")
+    agent.page.locator.assert_called_once_with("#q")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_selector_state(agent):
+    """
+    Element-state conditions use a single locator wait.
+    """
+    field = agent.page.locator.return_value.first
+    field.wait_for = AsyncMock()
+
+    assert await agent.wait_for_selector_state(".spinner", state="hidden", timeout=500) is True
+    field.wait_for.assert_awaited_once_with(state="hidden", timeout=500)
+
+    field.wait_for = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+    with pytest.raises(Exception, match="to be hidden"):
+        await agent.wait_for_selector_state(".spinner", state="hidden")
+
+
+@pytest.mark.asyncio
+async def test_retry_sleeps_within_jitter_bounds(agent, monkeypatch):
+    """
+    Backoff sleeps fall between the base delay and the precomputed ceiling, and
+    only happen between attempts.
+    """
+    sleep = AsyncMock()
+    monkeypatch.setattr(general_agent_module.asyncio, "sleep", sleep)
+    failing = AsyncMock(side_effect=ConnectionError("reset"))
+
+    with pytest.raises(Exception, match="All retries failed"):
+        await agent._retry_operation(failing)
+
+    base = general_agent_module.TimingConstants.BASE_RETRY_DELAY / 1000
+    ceilings = general_agent_module.RETRY_DELAY_CEILINGS
+    delays = [c.args[0] for c in sleep.await_args_list]
+    # No sleep after the last failed attempt: it would only delay the error.
+    assert failing.await_count == general_agent_module.MAX_RETRIES
+    assert len(delays) == general_agent_module.MAX_RETRIES - 1
+    assert all(base <= d <= ceiling / 1000 for d, ceiling in zip(delays, ceilings))
+
+
+@pytest.mark.asyncio
+async def test_zero_delays_never_sleep(agent, monkeypatch):
+    """
+    Zero upper bounds skip asyncio.sleep entirely, for default and explicit calls.
+    """
+    sleep = AsyncMock()
+    monkeypatch.setattr(general_agent_module.asyncio, "sleep", sleep)
+
+    await agent._human_delay()
+    await agent._human_delay(0, 0)
+
+    sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_acquire_borrows_page_from_pool(tmp_path):
+    """
+    Agents built from a PagePool reuse released pages instead of opening new ones.
+    """
+    context = MagicMock()
+    context.new_page = AsyncMock(side_effect=lambda: MagicMock(goto=AsyncMock(), is_closed=MagicMock(return_value=False)))
+    pool = PagePool(context, size=2)
+    settings = {"telemetry": {"enabled": False, "storage_path": str(tmp_path / "telemetry")}}
+    logs_manager = AsyncMock(spec=LogsManager)
+
+    async with GeneralAgent.acquire(pool, logs_manager, settings, humanize=False) as first:
+        first_page = first.page
+    first_page.remove_listener.assert_called_once_with("framenavigated", first._on_frame_navigated)
+    async with GeneralAgent.acquire(pool, logs_manager, settings, humanize=False) as second:
+        assert second.page is first_page
+        assert second.humanize is False
+
+    assert context.new_page.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_run_batch_uses_one_context_per_url(tmp_path):
+    """
+    run_batch caps concurrency, isolates URLs in their own contexts and keeps failures per URL.
+    """
+    running = peak = 0
+    contexts = []
+
+    async def new_context():
+        context = MagicMock(close=AsyncMock())
+        context.new_page = AsyncMock(return_value=MagicMock())
+        contexts.append(context)
+        return context
+
+    async def work(agent, url):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        if url.endswith("bad"):
+            raise ValueError(url)
+        return url.upper()
+
+    browser = MagicMock(new_context=AsyncMock(side_effect=new_context))
+    settings = {"telemetry": {"enabled": False, "storage_path": str(tmp_path / "telemetry")}}
+    urls = ["https://a", "https://b", "https://bad", "https://c"]
+
+    results = await GeneralAgent.run_batch(
+        browser, urls, work, AsyncMock(spec=LogsManager), settings, concurrency=2, humanize=False
+    )
+
+    assert results[:2] == ["HTTPS://A", "HTTPS://B"] and results[3] == "HTTPS://C"
+    assert isinstance(results[2], ValueError)
+    assert peak == 2
+    assert len(contexts) == 4
+    assert all(context.close.await_count == 1 for context in contexts)
+
+
+def test_main_frame_navigation_keeps_domain_resolutions(agent):
+    """
+    Navigations the agent didn't start drop cached locators and highlight-index
+    resolutions but keep per-domain selectors; iframe navigations drop nothing.
+    """
+    agent.page.on.assert_called_once_with("framenavigated", agent._on_frame_navigated)
+    agent._remember_selector("Next", "button.next")
+    agent._remember_selector("Apply", "[data-highlight-index='3']")
+    agent._get_locator("Next")
+
+    agent._on_frame_navigated(MagicMock())
+    assert agent._resolve("Apply") == "[data-highlight-index='3']"
+    assert agent._locator_cache
+
+    agent._on_frame_navigated(agent.page.main_frame)
+    assert agent._resolve("Next") == "button.next"
+    assert agent._resolve("Apply") == "Apply"
+    assert not agent._locator_cache
+
+
+@pytest.mark.asyncio
+async def test_extract_text_missing_element_logs_once(agent):
+    """
+    A missing element is reported once as 'No element found', not re-wrapped,
+    and the stale resolution for it is forgotten.
+    """
+    agent.page.locator.return_value.first.text_content = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+    agent._remember_selector("h1", "h1.title")
+
+    with pytest.raises(Exception, match=r"^\[GeneralAgent\] No element found for h1$"):
+        await agent.extract_text("h1")
+    agent.logs_manager.error.assert_awaited_once()
+    assert agent._resolve("h1") == "h1"
+
+
+@pytest.mark.asyncio
+async def test_click_fallback_misses_are_cached_and_stale_hits_dropped(agent, monkeypatch):
+    """
+    A fallback that found nothing isn't retried on the same URL; a stale hit is forgotten.
+    """
+    agent.page.locator.return_value.first.click = AsyncMock(side_effect=Exception("not found"))
+    get_element = AsyncMock(return_value=None)
+    monkeypatch.setattr(general_agent_module.LinkedInLocators, "get_element", get_element)
+    agent._remember_selector("Next", "[data-highlight-index='3']")
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="Click operation failed completely for 'Next'"):
+            await agent.click_element("Next")
+
+    assert get_element.await_count == 1
+    assert agent._resolve("Next") == "Next"
+
+
+@pytest.mark.asyncio
+async def test_string_conditions_wait_in_the_page(agent):
+    """
+    JS predicates go to wait_for_function; wait_for_condition forwards strings to it.
+    """
+    agent.page.wait_for_function = AsyncMock()
+
+    assert await agent.wait_for_condition("() => !document.querySelector('.spinner')", timeout=800) is True
+    agent.page.wait_for_function.assert_awaited_once_with(
+        "() => !document.querySelector('.spinner')", arg=None, timeout=800, polling="raf"
+    )
+
+    await agent.wait_for_js_condition("n => document.images.length >= n", arg=3, polling=250)
+    agent.page.wait_for_function.assert_awaited_with(
+        "n => document.images.length >= n", arg=3, timeout=agent.default_timeout, polling=250
+    )
+
+    agent.page.wait_for_function = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+    with pytest.raises(Exception, match="Timed out waiting for condition"):
+        await agent.wait_for_js_condition("() => false")
+
+
+def test_agent_has_no_instance_dict(agent):
+    """
+    GeneralAgent uses __slots__, so every attribute set in __init__ must be declared.
+    """
+    assert not hasattr(agent, "__dict__")
+    with pytest.raises(AttributeError):
+        agent.undeclared = True
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_reads_concurrently(agent):
+    """
+    batch() overlaps its operations and returns results in argument order.
+    """
+    started = asyncio.Event()
+
+    async def first():
+        await asyncio.wait_for(started.wait(), timeout=1)
+        return "first"
+
+    async def second():
+        started.set()
+        return "second"
+
+    assert await agent.batch(first, second) == ["first", "second"]
+
+    async def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await agent.batch(second, failing)
+
+
+@pytest.mark.asyncio
+async def test_navigate_to_settles_for_page_transition_in_seconds(agent, monkeypatch):
+    """
+    PAGE_TRANSITION_DELAY is milliseconds; navigate_to sleeps the converted value.
+    """
+    sleep = AsyncMock()
+    monkeypatch.setattr(general_agent_module.asyncio, "sleep", sleep)
+    agent.dom_service.goto = AsyncMock(return_value="response")
+
+    assert await agent.navigate_to("https://www.linkedin.com/jobs/") == "response"
+    sleep.assert_awaited_once_with(general_agent_module.TimingConstants.PAGE_TRANSITION_DELAY / 1000)
+
+
+@pytest.mark.asyncio
+async def test_accept_cookies_is_one_locator_click(agent):
+    """
+    accept_cookies clicks through the locator's auto-wait; a timeout means no banner.
+    """
+    button = agent.page.locator.return_value.first
+    button.click = AsyncMock()
+    agent.page.evaluate = AsyncMock()
+
+    assert await agent.accept_cookies("#accept-cookies") is True
+    button.click.assert_awaited_once_with(timeout=3000)
+    agent.page.evaluate.assert_not_called()
+
+    button.click = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+    assert await agent.accept_cookies("#accept-cookies") is False
+
+
+@pytest.mark.asyncio
+async def test_navigate_to_commit_skips_settle_delay(agent, monkeypatch):
+    """
+    wait_until="commit" is passed to goto and no post-navigation settle sleep is taken.
+    """
+    sleep = AsyncMock()
+    monkeypatch.setattr(general_agent_module.asyncio, "sleep", sleep)
+    agent.dom_service.goto = AsyncMock(return_value="response")
+
+    await agent.navigate_to("https://www.linkedin.com/jobs/", wait_until="commit")
+
+    agent.dom_service.goto.assert_awaited_once_with(
+        "https://www.linkedin.com/jobs/", wait_until="commit", timeout=general_agent_module.MAX_WAIT_MS
+    )
+    sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bookkeeping_calls_skip_human_delay(agent, monkeypatch):
+    """
+    Frame switch-back and internal scripts don't pay a human-like delay.
+    """
+    human_delay = AsyncMock()
+    monkeypatch.setattr(GeneralAgent, "_human_delay", human_delay)
+    agent.dom_service.switch_to_iframe = AsyncMock()
+    agent.dom_service.evaluate_script = AsyncMock(return_value=1)
+
+    await agent.switch_to_iframe("iframe#captcha")
+    human_delay.reset_mock()
+    await agent.switch_back_to_main_frame()
+    assert await agent.evaluate_script("1", humanize=False) == 1
+
+    human_delay.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_drag_and_drop_pauses_only_for_the_hold(agent, monkeypatch):
+    """
+    No entry delay; the mouse hold is drawn from the DRAG_HOLD range (zero when not humanized).
+    """
+    human_delay = AsyncMock()
+    monkeypatch.setattr(GeneralAgent, "_human_delay", human_delay)
+    agent.dom_service.drag_and_drop = AsyncMock()
+    constants = general_agent_module.TimingConstants
+
+    await agent.drag_and_drop("#src", "#dst")
+    hold = agent.dom_service.drag_and_drop.await_args.kwargs["hold_delay"]
+    assert constants.DRAG_HOLD_MIN / 1000 <= hold <= constants.DRAG_HOLD_MAX / 1000
+
+    agent.humanize = False
+    await agent.drag_and_drop("#src", "#dst", use_dispatch=False)
+    agent.dom_service.drag_and_drop.assert_awaited_with("#src", "#dst", hold_delay=0, use_dispatch=False)
+    human_delay.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_dom_calls_are_capped_per_page(agent):
+    """
+    Concurrent DOM calls on one agent never exceed PAGE_CONCURRENCY_LIMIT.
+    """
+    in_flight = peak = 0
+
+    async def op():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    await asyncio.gather(*(agent._dom_call(op) for _ in range(3 * general_agent_module.PAGE_CONCURRENCY_LIMIT)))
+    assert peak == general_agent_module.PAGE_CONCURRENCY_LIMIT
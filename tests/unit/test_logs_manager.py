@@ -0,0 +1,44 @@
+"""
+Unit Tests for LogsManager
+
+Tests level gating and the console output switch.
+"""
+
+import pytest
+
+from storage.logs_manager import LogsManager
+
+
+def make_logs_manager(tmp_path, log_level="INFO", console_output=True):
+    return LogsManager({
+        "system": {"data_dir": str(tmp_path), "log_level": log_level},
+        "logging": {"console_output": console_output}
+    })
+
+
+def test_is_enabled_gates_debug(tmp_path):
+    assert not make_logs_manager(tmp_path).is_enabled("DEBUG")
+    assert make_logs_manager(tmp_path).is_enabled("INFO")
+    assert make_logs_manager(tmp_path, log_level="DEBUG").is_enabled("debug")
+
+
+@pytest.mark.asyncio
+async def test_console_output_can_be_silenced(tmp_path, capsys):
+    await make_logs_manager(tmp_path, console_output=False).info("quiet")
+    await make_logs_manager(tmp_path).info("loud")
+    out = capsys.readouterr().out
+    assert "quiet" not in out
+    assert "[INFO] loud" in out
+
+
+@pytest.mark.asyncio
+async def test_level_threshold_above_info(tmp_path, capsys):
+    logs_manager = make_logs_manager(tmp_path, log_level="WARNING")
+    assert not logs_manager.is_enabled("INFO")
+    assert logs_manager.is_enabled("ERROR")
+
+    await logs_manager.info("dropped")
+    await logs_manager.warning("kept")
+    out = capsys.readouterr().out
+    assert "dropped" not in out
+    assert "kept" in out
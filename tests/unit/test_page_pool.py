@@ -0,0 +1,55 @@
+"""
+Unit Tests for PagePool
+
+Tests page reuse and the size bound with a mocked BrowserContext.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from utils.page_pool import PagePool
+
+
+def make_context():
+    context = MagicMock()
+
+    async def new_page():
+        page = MagicMock()
+        page.is_closed.return_value = False
+        page.goto = AsyncMock()
+        page.close = AsyncMock()
+        return page
+
+    context.new_page = AsyncMock(side_effect=new_page)
+    return context
+
+
+@pytest.mark.asyncio
+async def test_released_pages_are_reused():
+    context = make_context()
+    pool = PagePool(context, size=2)
+
+    async with pool.acquire() as first:
+        pass
+    async with pool.acquire() as second:
+        pass
+
+    assert first is second
+    assert context.new_page.await_count == 1
+    first.goto.assert_awaited_with("about:blank")
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_when_pool_is_exhausted():
+    context = make_context()
+    pool = PagePool(context, size=1)
+
+    async with pool.acquire() as page:
+        waiter = asyncio.create_task(pool.acquire().__aenter__())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+    assert await waiter is page
+    assert context.new_page.await_count == 1
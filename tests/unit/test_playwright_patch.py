@@ -0,0 +1,41 @@
+"""
+Unit Tests for the Playwright stack-capture patch
+
+Tests that the lightweight capture still resolves the API name.
+"""
+
+import pytest
+from playwright._impl import _connection
+
+from utils.playwright_patch import apply_playwright_stack_patch
+
+
+def test_patch_keeps_api_name(monkeypatch):
+    monkeypatch.setattr(_connection, "_capture_stack_trace", _connection._capture_stack_trace)
+    monkeypatch.setattr(_connection, "traceback", _connection.traceback)
+    monkeypatch.setattr("utils.playwright_patch._patched", False)
+    monkeypatch.delenv("PW_INSPECT_STACK", raising=False)
+
+    assert apply_playwright_stack_patch() is True
+    assert len(_connection.traceback.extract_stack(limit=10)) == 0
+
+    # Simulate a Playwright-internal caller by compiling code under its module path.
+    source = (
+        "class Page:\n"
+        "    def click(self):\n"
+        "        return capture()\n"
+        "def capture():\n"
+        "    return _capture_stack_trace()\n"
+    )
+    namespace = {"_capture_stack_trace": _connection._capture_stack_trace}
+    exec(compile(source, _connection.__file__, "exec"), namespace)
+    result = namespace["Page"]().click()
+
+    assert result["apiName"] == "Page.click"
+    assert result["frames"] == []
+
+
+def test_patch_disabled_by_env(monkeypatch):
+    monkeypatch.setattr("utils.playwright_patch._patched", False)
+    monkeypatch.setenv("PW_INSPECT_STACK", "1")
+    assert apply_playwright_stack_patch() is False
@@ -0,0 +1,64 @@
+"""
+Unit Tests for TelemetryManager
+
+Tests that events are queued for the background writer and persisted in batches,
+and that managers sharing a storage path don't lose each other's events.
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+
+import utils.telemetry as telemetry_module
+from utils.telemetry import TelemetryManager
+
+
+def make_telemetry(tmp_path):
+    return TelemetryManager({"telemetry": {"enabled": True, "storage_path": str(tmp_path)}})
+
+
+@pytest.mark.asyncio
+async def test_events_are_written_in_background_batches(tmp_path):
+    telemetry = make_telemetry(tmp_path)
+    telemetry._store_events = AsyncMock(wraps=telemetry._store_events)
+
+    for i in range(5):
+        await telemetry.track_event("click", {"n": i}, success=True)
+    telemetry._store_events.assert_not_awaited()
+
+    await telemetry.flush()
+    telemetry._store_events.assert_awaited_once()
+    (events_file,) = (tmp_path / "events").glob("events_*-*-*.json")
+    assert [e["data"]["n"] for e in json.loads(events_file.read_text())] == [0, 1, 2, 3, 4]
+    await telemetry.close()
+
+
+@pytest.mark.asyncio
+async def test_events_are_dropped_when_queue_is_full(tmp_path, monkeypatch):
+    monkeypatch.setattr(telemetry_module, "TELEMETRY_QUEUE_SIZE", 2)
+    telemetry = make_telemetry(tmp_path)
+    telemetry._write_events = AsyncMock()
+
+    for i in range(3):
+        await telemetry.track_event("click", {"n": i}, success=True)
+
+    assert telemetry.dropped_events == 1
+    await telemetry.close()
+    assert telemetry._write_events.await_args.args[0][-1].data["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_managers_sharing_a_path_keep_every_event(tmp_path):
+    """
+    Separate managers on one storage_path don't overwrite each other's events,
+    and close_all stops every manager's writer.
+    """
+    managers = [make_telemetry(tmp_path) for _ in range(4)]
+    for i in range(20):
+        await managers[i % 4].track_event("click", {"n": i}, success=True)
+
+    await TelemetryManager.close_all()
+    (events_file,) = (tmp_path / "events").glob("events_*-*-*.json")
+    assert sorted(e["data"]["n"] for e in json.loads(events_file.read_text())) == list(range(20))
+    assert all(manager._drain_task is None for manager in managers)
@@ -23,6 +23,9 @@ import platform
 import os
 from storage.logs_manager import LogsManager
 from utils.telemetry import TelemetryManager
+from utils.playwright_patch import apply_playwright_stack_patch
+
+apply_playwright_stack_patch()
 
 class BrowserSetup:
     # Default paths for different browsers based on OS
@@ -2,6 +2,7 @@
 
 import os
 import json
+from pathlib import Path
 from typing import List, Optional, Any, TYPE_CHECKING
 from playwright.async_api import Page, ElementHandle, TimeoutError as PlaywrightTimeoutError
 import asyncio
@@ -11,6 +12,68 @@ if TYPE_CHECKING:
     from utils.telemetry import TelemetryManager
     from storage.logs_manager import LogsManager
 
+# Raw value of one attribute (passed as the argument) on every matched element,
+# skipping elements where it is missing or empty.
+EXTRACT_ATTR_JS = "(els, attr) => els.map(e => e.getAttribute(attr)).filter(Boolean)"
+
+# Screenshot paths with these suffixes are captured as JPEG at JPEG_QUALITY; others as PNG.
+JPEG_SUFFIXES = (".jpg", ".jpeg")
+JPEG_QUALITY = 70
+
+# Upper bounds for one in-page scroll to bottom, so an infinite feed can't keep
+# the evaluate (and its caller) waiting forever.
+SCROLL_MAX_STEPS = 500
+SCROLL_TIMEOUT_MS = 30000
+
+# In-page incremental scroll of the document, or of the element matching container
+# (inner panes such as the LinkedIn job list scroll independently of the window):
+# one step every pauseMs until the bottom is reached and the height stays the same
+# for one more pause (lazy-loaded content included). Resolves true at the bottom and
+# false once maxSteps or timeoutMs runs out. The scrolled element is looked up once
+# per call and reused by every tick.
+SCROLL_TO_BOTTOM_JS = """([step, pauseMs, maxSteps = %d, timeoutMs = %d, container = null]) =>
+new Promise((resolve, reject) => {
+    const el = container ? document.querySelector(container) : (document.scrollingElement || document.body);
+    if (!el) {
+        reject(new Error(`No scroll container matches ${container}`));
+        return;
+    }
+    const deadline = Date.now() + timeoutMs;
+    let steps = 0;
+    const tick = () => {
+        if (steps++ >= maxSteps || Date.now() >= deadline) {
+            resolve(false);
+            return;
+        }
+        el.scrollBy(0, step);
+        const height = el.scrollHeight;
+        if (el.scrollTop + el.clientHeight < height - 1) {
+            setTimeout(tick, pauseMs);
+            return;
+        }
+        setTimeout(() => el.scrollHeight > height ? tick() : resolve(true), pauseMs);
+    };
+    tick();
+})""" % (SCROLL_MAX_STEPS, SCROLL_TIMEOUT_MS)
+
+# Synthetic HTML5 drag sequence sharing one DataTransfer. Returns null when an
+# element is missing, false when the source is not HTML5-draggable (pointer
+# driven widgets ignore DragEvents) and true once the events were dispatched.
+DISPATCH_DRAG_JS = """([src, tgt]) => {
+    const s = document.querySelector(src), t = document.querySelector(tgt);
+    if (!s || !t) return null;
+    if (!s.draggable) return false;
+    const dataTransfer = new DataTransfer();
+    const fire = (el, type) => el.dispatchEvent(
+        new DragEvent(type, {bubbles: true, cancelable: true, dataTransfer}));
+    fire(s, 'dragstart');
+    fire(t, 'dragenter');
+    fire(t, 'dragover');
+    fire(t, 'drop');
+    fire(s, 'dragend');
+    return true;
+}"""
+
 class DomService:
     def __init__(self, page: Page, telemetry: Optional['TelemetryManager'] = None, settings: dict = None, logs_manager: Optional['LogsManager'] = None):
         """Initialize DOM service with page and optional telemetry."""
@@ -215,35 +278,34 @@ class DomService:
     # ===================
     # Scrolling Methods
     # ===================
-    async def scroll_to_bottom(self, step: int = 200, pause: float = 1.0):
+    async def scroll_to_bottom(self, step: int = 200, pause: float = 1.0, max_steps: int = SCROLL_MAX_STEPS,
+                               timeout: float = SCROLL_TIMEOUT_MS, container: Optional[str] = None) -> bool:
         """
         Scroll to page bottom gradually.
+        The scroll loop, pauses and height checks all run in the page as one evaluate call.
         
         Args:
             step: Pixels to scroll each step
             pause: Delay between steps in seconds
+            max_steps: Stop after this many steps
+            timeout: Stop after this many ms
+            container: Selector of an inner scroll pane to scroll instead of the page
+
+        Returns:
+            True if the bottom was reached, False if max_steps or timeout ran out first
         """
         if self.logs_manager:
             await self.logs_manager.debug(f"Starting gradual scroll to bottom (step={step}px, pause={pause}s)")
             
-        current_height = await self.page.evaluate("() => document.body.scrollHeight")
-        pos = 0
-        while pos < current_height:
-            pos += step
-            await self.page.mouse.wheel(0, step)
-            await self.page.wait_for_timeout(int(pause * 1000))
-            new_height = await self.page.evaluate("() => document.body.scrollHeight")
-            
-            if self.logs_manager:
-                await self.logs_manager.debug(f"Scrolled to position {pos}/{current_height}px")
-                
-            if new_height > current_height:
-                if self.logs_manager:
-                    await self.logs_manager.debug(f"Page height increased from {current_height} to {new_height}px")
-                current_height = new_height
-                
+        reached = await self.page.evaluate(
+            SCROLL_TO_BOTTOM_JS, [step, int(pause * 1000), max_steps, int(timeout), container]
+        )
+
         if self.logs_manager:
-            await self.logs_manager.debug("Completed scroll to bottom")
+            await self.logs_manager.debug(
+                "Completed scroll to bottom" if reached else "Stopped scrolling before the bottom (step/time limit)"
+            )
+        return reached
 
     async def scroll_to_element(self, selector: str):
         """
@@ -300,14 +362,25 @@ class DomService:
                 await self.logs_manager.error(f"Failed to take element screenshot: {str(e)}")
             raise
 
-    async def take_screenshot(self, path: str, full_page: bool = True):
-        """Take full page or viewport screenshot."""
+    async def take_screenshot(self, path: str, full_page: bool = True) -> str:
+        """
+        Take full page or viewport screenshot and return the path written.
+        The format follows the path: ".jpg"/".jpeg" captures JPEG (quality 70, much
+        smaller for full pages), anything else PNG. The path is never changed, and
+        the file is written off the event loop.
+        """
+        jpeg = Path(path).suffix.lower() in JPEG_SUFFIXES
         try:
             if self.logs_manager:
                 await self.logs_manager.info(f"Taking {'full page' if full_page else 'viewport'} screenshot: {path}")
-            await self.page.screenshot(path=path, full_page=full_page)
+            if jpeg:
+                data = await self.page.screenshot(full_page=full_page, type="jpeg", quality=JPEG_QUALITY)
+            else:
+                data = await self.page.screenshot(full_page=full_page, type="png")
+            await asyncio.to_thread(Path(path).write_bytes, data)
             if self.logs_manager:
                 await self.logs_manager.info(f"Successfully saved screenshot to: {path}")
+            return path
         except Exception as e:
             if self.logs_manager:
                 await self.logs_manager.error(f"Failed to take screenshot: {str(e)}")
@@ -387,11 +460,25 @@ class DomService:
     # ===================
     # Advanced Interactions
     # ===================
-    async def drag_and_drop(self, source_selector: str, target_selector: str, hold_delay: float = 0.5):
-        """Perform drag and drop operation."""
+    async def drag_and_drop(self, source_selector: str, target_selector: str, hold_delay: float = 0.5, use_dispatch: bool = False):
+        """
+        Perform drag and drop operation.
+        With use_dispatch the HTML5 drag events are fired in-page in a single
+        evaluate call; sources that are not HTML5-draggable fall back to the
+        physical mouse sequence below.
+        """
         if self.logs_manager:
             await self.logs_manager.debug(f"Starting drag and drop operation from {source_selector} to {target_selector}")
-            
+
+        if use_dispatch:
+            dispatched = await self.page.evaluate(DISPATCH_DRAG_JS, [source_selector, target_selector])
+            if dispatched:
+                if self.logs_manager:
+                    await self.logs_manager.info("Successfully completed drag and drop operation")
+                return
+            if self.logs_manager:
+                await self.logs_manager.debug("Drag dispatch not applicable, using mouse events")
+
         source = await self.wait_for_selector(source_selector)
         target = await self.wait_for_selector(target_selector)
         
@@ -427,26 +514,18 @@ class DomService:
             raise
 
     async def extract_links(self, selector: str = "a") -> List[str]:
-        """Extract href attributes from elements."""
+        """
+        Extract href attributes from elements.
+        Reads every match in one eval_on_selector_all call rather than one
+        get_attribute round-trip per element.
+        """
         if self.logs_manager:
             await self.logs_manager.debug(f"Extracting links from elements matching: {selector}")
             
-        elements = await self.query_selector_all(selector)
-        links = []
-        
-        for i, el in enumerate(elements, 1):
-            try:
-                href = await el.get_attribute("href")
-                if href:
-                    links.append(href)
-                    if self.logs_manager:
-                        await self.logs_manager.debug(f"Found link {i}: {href}")
-            except Exception as e:
-                if self.logs_manager:
-                    await self.logs_manager.warning(f"Failed to extract href from element {i}: {str(e)}")
+        links = await self.page.eval_on_selector_all(selector, EXTRACT_ATTR_JS, "href")
                 
         if self.logs_manager:
-            await self.logs_manager.info(f"Extracted {len(links)} links from {len(elements)} elements")
+            await self.logs_manager.info(f"Extracted {len(links)} links matching: {selector}")
         return links
 
     # ===================
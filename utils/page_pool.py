@@ -0,0 +1,94 @@
+"""
+Page Pool Module
+
+Keeps a bounded set of Playwright pages open in one browser context so
+applications borrow an existing tab instead of paying page startup each time:
+- Pages are created lazily, up to `size`
+- acquire() waits when every page is in use
+- Released pages are reset to about:blank; cookies are kept on purpose,
+  since the persistent context holds the LinkedIn session
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+from storage.logs_manager import LogsManager
+
+
+class PagePool:
+    def __init__(self, context: BrowserContext, size: int = 4, logs_manager: Optional[LogsManager] = None):
+        """
+        Args:
+            context (BrowserContext): Context the pages are opened in (usually the persistent one
+                returned by BrowserSetup.initialize).
+            size (int): Maximum number of pages open at once.
+            logs_manager: Optional LogsManager for debug output.
+        """
+        self.context = context
+        self.size = size
+        self.logs_manager = logs_manager
+
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._pages: List[Page] = []
+        self._create_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        """
+        Borrow a page for the duration of the block.
+
+        Usage:
+            async with pool.acquire() as page:
+                agent = FormFillerAgent(DomService(page), logs_manager, settings)
+        """
+        page = await self._checkout()
+        try:
+            yield page
+        finally:
+            await self._release(page)
+
+    async def close(self):
+        """Close every page the pool opened."""
+        for page in self._pages:
+            if not page.is_closed():
+                await page.close()
+        self._pages.clear()
+        self._idle = asyncio.Queue()
+
+    async def _checkout(self) -> Page:
+        if self._idle.empty():
+            async with self._create_lock:
+                if len(self._pages) < self.size:
+                    page = await self.context.new_page()
+                    self._pages.append(page)
+                    if self.logs_manager:
+                        await self.logs_manager.debug(f"[PagePool] Opened page {len(self._pages)}/{self.size}")
+                    return page
+
+        page = await self._idle.get()
+        if page.is_closed():
+            # Replace tabs that were closed while sitting idle.
+            self._pages.remove(page)
+            page = await self.context.new_page()
+            self._pages.append(page)
+        return page
+
+    async def _release(self, page: Page):
+        if not page.is_closed():
+            try:
+                await page.goto("about:blank")
+                self._idle.put_nowait(page)
+                return
+            except Exception as e:
+                if self.logs_manager:
+                    await self.logs_manager.warning(f"[PagePool] Failed to reset page, replacing it: {e}")
+                await page.close()
+
+        # Keep the pool at full strength so callers waiting in acquire() get a page.
+        self._pages.remove(page)
+        replacement = await self.context.new_page()
+        self._pages.append(replacement)
+        self._idle.put_nowait(replacement)
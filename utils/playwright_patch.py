@@ -0,0 +1,93 @@
+"""
+Playwright Stack-Capture Patch
+
+Every Playwright API call (query_selector, fill, click, set_input_files, ...)
+captures the caller's stack before talking to the driver:
+- _capture_stack_trace walks every frame and reads f_locals to build a frame list
+  and the API name used in error messages
+- traceback.extract_stack(limit=10) is stored on each protocol callback
+
+Under many concurrent pages this stack walking is a large share of CPU and can
+stall the event loop. apply_playwright_stack_patch() swaps both for lightweight
+versions that keep the API name (so errors still read "Page.click: ...") but
+drop the frame lists.
+
+Tradeoff: Playwright traces and protocol errors no longer carry the Python
+call sites. Set PW_INSPECT_STACK=1 to keep the original behaviour when debugging.
+"""
+
+import inspect
+import os
+import traceback
+
+_patched = False
+
+
+class _NoStackTraceback:
+    """Stands in for the traceback module inside Playwright's connection module."""
+
+    def __getattr__(self, name):
+        return getattr(traceback, name)
+
+    @staticmethod
+    def extract_stack(*args, **kwargs) -> traceback.StackSummary:
+        return traceback.StackSummary()
+
+
+def _make_light_capture(connection_module):
+    """Build a _capture_stack_trace replacement that only resolves the API name."""
+    internal_prefix = connection_module._PLAYWRIGHT_MODULE_PATH
+    mapping_file = connection_module.playwright._impl._impl_to_api_mapping.__file__
+
+    def _capture_api_name_only():
+        frame = inspect.currentframe()
+        frame = frame.f_back.f_back if frame and frame.f_back else None
+        last_internal = None
+        # Innermost frames are Playwright's own; the API name is the outermost
+        # of those before control returns to user code.
+        while frame:
+            filename = frame.f_code.co_filename
+            if filename == mapping_file:
+                frame = frame.f_back
+                continue
+            if not filename.startswith(internal_prefix):
+                break
+            last_internal = frame
+            frame = frame.f_back
+
+        api_name = ""
+        if last_internal is not None:
+            owner = last_internal.f_locals.get("self")
+            api_name = f"{owner.__class__.__name__}." if owner is not None else ""
+            api_name += last_internal.f_code.co_name
+        return {"frames": [], "apiName": api_name, "title": None}
+
+    return _capture_api_name_only
+
+
+def apply_playwright_stack_patch() -> bool:
+    """
+    Patch Playwright's per-call stack capture (idempotent).
+
+    Returns:
+        bool: True if the patch is active, False if disabled via PW_INSPECT_STACK=1
+              or unsupported by the installed Playwright version.
+    """
+    global _patched
+    if _patched:
+        return True
+    if os.getenv("PW_INSPECT_STACK", "0") == "1":
+        return False
+
+    try:
+        from playwright._impl import _connection
+        light_capture = _make_light_capture(_connection)
+        if not callable(getattr(_connection, "_capture_stack_trace", None)):
+            return False
+    except (ImportError, AttributeError):
+        return False
+
+    _connection._capture_stack_trace = light_capture
+    _connection.traceback = _NoStackTraceback()
+    _patched = True
+    return True
@@ -34,19 +34,40 @@ Future Enhancements:
    - Track peak usage times
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Union, Callable, TYPE_CHECKING
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import os
+import threading
+import weakref
 import aiofiles
 import uuid
 
 if TYPE_CHECKING:
     from storage.logs_manager import LogsManager
 
+# Events waiting for the background writer; further events are dropped while it is full.
+TELEMETRY_QUEUE_SIZE = 1024
+
+# Maximum events the background writer persists per flush.
+TELEMETRY_FLUSH_BATCH = 64
+
+# One lock per daily events file, shared by every TelemetryManager in the process:
+# managers pointed at the same storage_path write from separate worker threads.
+_file_locks: Dict[Path, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+
+def _file_lock(path: Path) -> threading.Lock:
+    key = path.resolve()
+    with _file_locks_guard:
+        return _file_locks.setdefault(key, threading.Lock())
+
 @dataclass
 class TelemetryEvent:
     timestamp: datetime
@@ -59,6 +80,9 @@ class TelemetryEvent:
     session_duration: float = None
 
 class TelemetryManager:
+    # Every live manager, so shutdown can flush/close them all (see close_all).
+    _instances: "weakref.WeakSet[TelemetryManager]" = weakref.WeakSet()
+
     def __init__(self, settings: Dict, logs_manager: Optional['LogsManager'] = None):
         """Initialize TelemetryManager with settings and optional logs_manager."""
         self.logger = logging.getLogger(__name__)
@@ -75,12 +99,28 @@ class TelemetryManager:
         # Store logs_manager reference
         self.logs_manager = logs_manager
 
-    async def track_event(self, event_type: str, data: Dict[str, Any], 
+        # Events are persisted by a background task; created on first use in a running loop.
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self.dropped_events = 0
+        TelemetryManager._instances.add(self)
+
+    async def track_event(self, event_type: str,
+                         data: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
                          success: bool, confidence: float = None):
-        """Track a single telemetry event with session data."""
+        """
+        Track a single telemetry event with session data.
+
+        `data` may be a zero-argument callable; it is only invoked when telemetry
+        is enabled, so hot paths don't build payloads that would be discarded.
+        Storage happens in a background task; use flush() to wait for it.
+        """
         if not self.enabled:
             return
 
+        if callable(data):
+            data = data()
+
         timestamp = datetime.now()
         session_duration = (timestamp - self.session_start).total_seconds()
 
@@ -102,23 +142,85 @@ class TelemetryManager:
             session_duration=session_duration
         )
         
-        # Add to in-memory buffer
-        self.events_buffer.append(self._event_to_dict(event))
-        
-        # Log the event using LogsManager if available
+        self._enqueue(event)
+
+    def _enqueue(self, event: TelemetryEvent):
+        """
+        Hand an event to the background writer without waiting for storage.
+        Telemetry is best-effort: events are dropped (and counted) while the queue is full.
+        """
+        if self._drain_task is None or self._drain_task.done() or \
+                self._drain_task.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+            self._drain_task = asyncio.create_task(self._drain_events())
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+
+    async def _drain_events(self):
+        """Persist queued events in batches of up to TELEMETRY_FLUSH_BATCH."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < TELEMETRY_FLUSH_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._write_events(batch)
+            except Exception as e:
+                self.logger.error(f"Failed to write telemetry batch: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write_events(self, events: List[TelemetryEvent]):
+        """Buffer, log and store a batch of events taken off the queue."""
+        self.events_buffer.extend(self._event_to_dict(event) for event in events)
+
+        # Log the events using LogsManager if available
         if self.logs_manager:
-            await self.logs_manager.info(
-                f"[Telemetry] Event: {event_type} at {timestamp.isoformat()} "
-                f"(success={success}, confidence={confidence})"
-            )
-        
+            for event in events:
+                await self.logs_manager.info(
+                    f"[Telemetry] Event: {event.event_type} at {event.timestamp.isoformat()} "
+                    f"(success={event.success}, confidence={event.confidence_score})"
+                )
+
         # Save events periodically
         if len(self.events_buffer) >= 100:
             if self.logs_manager:
                 await self.logs_manager.debug("Buffer reached 100 events, saving to storage...")
             await self._save_buffer()
-        
-        await self._store_event(event)
+
+        await self._store_events(events)
+
+    async def flush(self):
+        """
+        Wait until every queued event has been written.
+        A writer running on another event loop can't be awaited from here and is skipped.
+        """
+        task = self._drain_task
+        if self._queue is not None and task is not None and not task.done() and \
+                task.get_loop() is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self):
+        """Flush pending events and stop the background writer."""
+        await self.flush()
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+
+    @classmethod
+    async def flush_all(cls):
+        """flush() every TelemetryManager in the process."""
+        for manager in list(cls._instances):
+            await manager.flush()
+
+    @classmethod
+    async def close_all(cls):
+        """close() every TelemetryManager in the process; call once at shutdown."""
+        for manager in list(cls._instances):
+            await manager.close()
 
     def _event_to_dict(self, event: TelemetryEvent) -> dict:
         """Convert TelemetryEvent to dictionary format."""
@@ -242,8 +344,8 @@ class TelemetryManager:
             confidence=match_score
         )
 
-    async def _store_event(self, event: TelemetryEvent):
-        """Store telemetry event to appropriate file."""
+    async def _store_events(self, events: List[TelemetryEvent]):
+        """Append telemetry events to their daily files, one read/write per file."""
         try:
             # Create directories if they don't exist
             events_dir = self.storage_path / "events"
@@ -251,32 +353,23 @@ class TelemetryManager:
             events_dir.mkdir(parents=True, exist_ok=True)
             metrics_dir.mkdir(parents=True, exist_ok=True)
 
-            # Store event in daily file
-            date_str = event.timestamp.strftime("%Y-%m-%d")
-            event_file = events_dir / f"events_{date_str}.json"
-
-            # Convert event to dict
-            event_dict = {
-                "timestamp": event.timestamp.isoformat(),
-                "event_type": event.event_type,
-                "data": event.data,
-                "success": event.success,
-                "duration_ms": event.duration_ms,
-                "confidence_score": event.confidence_score
-            }
-
-            # Append to daily file
-            events = []
-            if event_file.exists():
-                with event_file.open('r') as f:
-                    events = json.load(f)
-            events.append(event_dict)
-            
-            with event_file.open('w') as f:
-                json.dump(events, f, indent=2)
+            # Group events by their daily file
+            by_file: Dict[Path, List[dict]] = {}
+            for event in events:
+                date_str = event.timestamp.strftime("%Y-%m-%d")
+                by_file.setdefault(events_dir / f"events_{date_str}.json", []).append({
+                    "timestamp": event.timestamp.isoformat(),
+                    "event_type": event.event_type,
+                    "data": event.data,
+                    "success": event.success,
+                    "duration_ms": event.duration_ms,
+                    "confidence_score": event.confidence_score
+                })
 
-            if self.logs_manager:
-                await self.logs_manager.debug(f"Stored event in {event_file}")
+            for event_file, event_dicts in by_file.items():
+                await asyncio.to_thread(self._append_to_daily_file, event_file, event_dicts)
+                if self.logs_manager:
+                    await self.logs_manager.debug(f"Stored {len(event_dicts)} events in {event_file}")
 
         except Exception as e:
             error_msg = f"Failed to store telemetry event: {e}"
@@ -284,6 +377,25 @@ class TelemetryManager:
                 await self.logs_manager.error(error_msg)
             self.logger.error(error_msg)
 
+    @staticmethod
+    def _append_to_daily_file(event_file: Path, event_dicts: List[dict]):
+        """
+        Read-modify-write of a daily events file (runs in a worker thread).
+        Serialized per file across all managers, and written to a temp file that
+        replaces the original, so readers never see a truncated file.
+        """
+        with _file_lock(event_file):
+            events = []
+            if event_file.exists():
+                with event_file.open('r') as f:
+                    events = json.load(f)
+            events.extend(event_dicts)
+
+            tmp_file = event_file.with_name(f"{event_file.name}.{threading.get_ident()}.tmp")
+            with tmp_file.open('w') as f:
+                json.dump(events, f, indent=2)
+            os.replace(tmp_file, event_file)
+
     async def load_events(self, date_str: str = None) -> List[Dict]:
         """Load events for a specific date or all dates."""
         events = []